@@ -0,0 +1,161 @@
+"""Synthetic project datasets in the `seed/projects.json` format, for load tests at 10k/100k/1M projects.
+
+Projects are variations of the seed projects. Technologies follow a Zipf-like popularity curve, led by the ones the
+seed uses most, and newer versions of each technology are more common than older ones. The output is deterministic
+for a given `--seed`.
+
+    python bench/generate.py --projects 100k --output bench/data/projects-100k.json
+    PYTHONPATH=src python -m cli database seed bench/data/projects-100k.json --batch-size 1000
+"""
+import argparse
+import json
+import random
+from collections import Counter
+from datetime import date
+from datetime import timedelta
+from pathlib import Path
+
+SEED_PATH = Path(__file__).resolve().parent.parent / 'seed' / 'projects.json'
+
+# Technologies beyond the seed, roughly in order of popularity, each with versions from oldest to newest.
+CATALOG = {
+    'Python': ['3.8', '3.9', '3.10', '3.11', '3.12', '3.13'],
+    'PostgreSQL': ['12.4', '13.8', '14.5', '15.2', '16.1', '17.0'],
+    'Redis': ['6.0', '6.2', '7.0', '7.2'],
+    'Docker': ['20.10', '23.0', '24.0', '25.0'],
+    'Django': ['3.2', '4.1', '4.2', '5.0', '5.1'],
+    'FastAPI': ['0.95.1', '0.100.0', '0.110.0', '0.115.0'],
+    'Flask': ['2.2', '2.3', '3.0', '3.1'],
+    'SQLAlchemy': ['1.4', '2.0'],
+    'Celery': ['5.2', '5.3', '5.4'],
+    'Pandas': ['1.5', '2.0', '2.1', '2.2'],
+    'NumPy': ['1.24', '1.26', '2.0', '2.1'],
+    'Kubernetes': ['1.26', '1.27', '1.28', '1.29', '1.30'],
+    'Elasticsearch': ['7.17', '8.6', '8.11', '8.15'],
+    'RabbitMQ': ['3.10', '3.11', '3.12', '3.13'],
+    'Apache Kafka': ['3.3', '3.5', '3.6', '3.7'],
+    'MySQL': ['5.7', '8.0', '8.4'],
+    'Pydantic': ['1.10', '2.5', '2.8', '2.10'],
+    'Uvicorn': ['0.22', '0.27', '0.30'],
+    'Scikit-learn': ['1.2', '1.3', '1.4', '1.5'],
+    'PyTorch': ['1.13', '2.0', '2.2', '2.4'],
+    'TensorFlow': ['2.11', '2.13', '2.15', '2.17'],
+    'Apache Airflow': ['2.5.1', '2.7', '2.8', '2.9'],
+    'ClickHouse': ['22.8', '23.3', '23.8', '24.3'],
+    'MongoDB': ['5.0', '6.0', '7.0'],
+    'Nginx': ['1.22', '1.24', '1.25', '1.26'],
+    'Terraform': ['1.3', '1.5', '1.7', '1.9'],
+    'aiohttp': ['3.8', '3.9', '3.10'],
+    'Boto3': ['1.26', '1.28', '1.34', '1.35'],
+    'gRPC': ['1.54', '1.60', '1.66'],
+    'GraphQL': ['15', '16'],
+    'dbt': ['1.4.0', '1.6', '1.7', '1.8'],
+    'Grafana': ['9.5', '10.2', '11.0'],
+    'Prometheus': ['2.45', '2.50', '2.53'],
+    'Snowflake': ['Standard', 'Enterprise'],
+    'Spark': ['3.3', '3.4', '3.5'],
+    'LangChain': ['0.0.300', '0.1', '0.2', '0.3'],
+    'OpenAI API': ['v1'],
+    'Selenium': ['4.8', '4.15', '4.20'],
+    'Cassandra': ['3.11', '4.0', '4.1'],
+    'TimescaleDB': ['2.10', '2.13', '2.15'],
+}
+TECHNOLOGY_COUNTS = {1: 2, 2: 6, 3: 20, 4: 30, 5: 24, 6: 11, 7: 5, 8: 2}  # weights, seed projects use 3-5
+PROJECT_SUFFIXES = ['v2', 'Internal', 'Lite', 'Pro', 'Next', 'Legacy', 'Mobile', 'Cloud', 'Edge', 'Analytics']
+SIZES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_size(value: str) -> int:
+    value = value.strip().lower()
+    if value[-1:] in SIZES:
+        return int(float(value[:-1]) * SIZES[value[-1]])
+    return int(value)
+
+
+def load_seed(path: Path) -> list[dict]:
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def build_catalog(seed: list[dict]) -> tuple[list[str], list[float], dict[str, list[str]]]:
+    """Technologies by popularity (seed frequency first), their Zipf weights and their known versions."""
+    versions = {name: list(known) for name, known in CATALOG.items()}
+    usage = Counter()
+    for project in seed:
+        for technology in project.get('technologies') or []:
+            usage[technology['name']] += 1
+            known = versions.setdefault(technology['name'], [])
+            if technology['version'] not in known:
+                known.append(technology['version'])
+
+    catalog_rank = {name: rank for rank, name in enumerate(CATALOG)}
+    names = sorted(versions, key=lambda name: (-usage[name], catalog_rank.get(name, len(catalog_rank)), name))
+    weights = [1 / (rank + 1) ** 1.1 for rank in range(len(names))]
+    return names, weights, versions
+
+
+def pick_technologies(rng: random.Random, names: list[str], weights: list[float],
+                      versions: dict[str, list[str]]) -> list[dict]:
+    count = rng.choices(list(TECHNOLOGY_COUNTS), weights=list(TECHNOLOGY_COUNTS.values()))[0]
+    chosen = []
+    while len(chosen) < min(count, len(names)):
+        name = rng.choices(names, weights=weights)[0]
+        if name not in chosen:
+            chosen.append(name)
+
+    technologies = []
+    for name in chosen:
+        known = versions[name]
+        # Linearly more likely the newer the version is.
+        version = rng.choices(known, weights=range(1, len(known) + 1))[0]
+        technologies.append({'name': name, 'version': version})
+    return technologies
+
+
+def generate(count: int, seed: list[dict], rng: random.Random):
+    names, weights, versions = build_catalog(seed)
+    for index in range(count):
+        template = seed[index % len(seed)]
+        start_date = date(2015, 1, 1) + timedelta(days=rng.randrange(365 * 10))
+        end_date = None
+        if rng.random() < 0.7:
+            end_date = start_date + timedelta(days=rng.randrange(30, 900))
+        yield {
+            'name': f'{template["name"]} {rng.choice(PROJECT_SUFFIXES)} #{index + 1}',
+            'description': template.get('description'),
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat() if end_date else None,
+            'technologies': pick_technologies(rng, names, weights, versions),
+        }
+
+
+def write(projects, output: Path) -> int:
+    # Streamed, a million projects do not have to fit in memory at once.
+    output.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with open(output, 'w', encoding='utf-8') as file:
+        file.write('[\n')
+        for project in projects:
+            if written:
+                file.write(',\n')
+            file.write(json.dumps(project, ensure_ascii=False))
+            written += 1
+        file.write('\n]\n')
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=parse_size, default='10k', help='e.g. 10k, 100k, 1M')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--source', type=Path, default=SEED_PATH)
+    parser.add_argument('--output', type=Path, default=None)
+    args = parser.parse_args()
+
+    output = args.output or Path(__file__).resolve().parent / 'data' / f'projects-{args.projects}.json'
+    written = write(generate(args.projects, load_seed(args.source), random.Random(args.seed)), output)
+    print(f'{written} projects written to {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+"""Load driving and latency reporting shared by the benchmark scripts.
+
+A target is either the Flask app in-process (through its test client) or a running server; both are driven from a
+thread pool and report one `Sample` per request.
+"""
+import http.client
+import json
+import math
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+from typing import Iterable
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class Call:
+    name: str  # what latencies are grouped by in the report
+    method: str
+    path: str
+    body: dict | list | None = None
+
+
+@dataclass(frozen=True)
+class Sample:
+    name: str
+    status: int  # 0 when the request itself failed (connection refused, timeout, ...)
+    elapsed: float
+    error: str | None = None
+
+
+class AppTarget:
+    """The Flask app in-process, one test client per worker thread."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self._local = threading.local()
+
+    def send(self, call: Call) -> tuple[int, bytes]:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(call.path, method=call.method, json=call.body)
+        return response.status_code, response.get_data()
+
+
+class HttpTarget:
+    """A running server, one keep-alive connection per worker thread."""
+
+    def __init__(self, base_url: str, timeout: float = 30) -> None:
+        parts = urlsplit(base_url)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def send(self, call: Call) -> tuple[int, bytes]:
+        body = None if call.body is None else json.dumps(call.body).encode()
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        try:
+            return self._send(call.method, self.prefix + call.path, body, headers)
+        except (http.client.HTTPException, ConnectionError):
+            # The server closed the idle keep-alive connection; retry once on a fresh one.
+            self._local.connection = None
+            return self._send(call.method, self.prefix + call.path, body, headers)
+
+    def _send(self, method: str, path: str, body: bytes | None, headers: dict) -> tuple[int, bytes]:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = self.connection_class(self.netloc, timeout=self.timeout)
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, response.read()
+
+
+def make_target(url: str | None):
+    if url:
+        return HttpTarget(url)
+
+    from presentation.api.main import app
+
+    return AppTarget(app)
+
+
+def timed(target, call: Call) -> Sample:
+    started = time.perf_counter()
+    try:
+        status, _ = target.send(call)
+    except Exception as e:  # noqa: BLE001 - a failed request is a sample, not a crash of the run
+        return Sample(call.name, 0, time.perf_counter() - started, error=e.__class__.__name__)
+    return Sample(call.name, status, time.perf_counter() - started)
+
+
+def run(target, calls: Iterable[Call], concurrency: int) -> tuple[list[Sample], float]:
+    """Send every call with `concurrency` workers; returns the samples and the wall-clock duration."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = list(executor.map(lambda call: timed(target, call), calls))
+    return samples, time.perf_counter() - started
+
+
+def run_schedule(
+        target, schedule: Iterable[tuple[float, Call]], concurrency: int,
+) -> tuple[list[Sample], list[float], float]:
+    """Send each call `offset` seconds after the start, in offset order.
+
+    Returns the samples, how late each call was sent (seconds, when all workers were busy or the scheduler fell
+    behind) and the wall-clock duration.
+    """
+    lateness = []
+
+    def send(due: float, call: Call) -> Sample:
+        lateness.append(max(time.perf_counter() - due, 0.0))
+        return timed(target, call)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = []
+        for offset, call in schedule:
+            delay = started + offset - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(executor.submit(send, started + offset, call))
+        samples = [future.result() for future in futures]
+    return samples, lateness, time.perf_counter() - started
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    # Nearest-rank, so reported latencies are ones that were actually observed.
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(math.ceil(percent / 100 * len(sorted_values)) - 1, 0)]
+
+
+def is_error(sample: Sample) -> bool:
+    return sample.status == 0 or sample.status >= 500
+
+
+def summarize(samples: list[Sample], wall_seconds: float, key: Callable[[Sample], str] = lambda s: s.name) -> dict:
+    groups = defaultdict(list)
+    for sample in samples:
+        groups[key(sample)].append(sample)
+
+    summary = {}
+    for name, group in sorted(groups.items()):
+        latencies = sorted(sample.elapsed * 1000 for sample in group)
+        summary[name] = {
+            'requests': len(group),
+            'errors': sum(map(is_error, group)),
+            'rps': len(group) / wall_seconds if wall_seconds else 0.0,
+            'mean_ms': sum(latencies) / len(latencies),
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'p99_ms': percentile(latencies, 99),
+            'max_ms': latencies[-1],
+        }
+    return summary
+
+
+def error_breakdown(samples: list[Sample]) -> dict[str, dict[str, int]]:
+    """Non-2xx/3xx outcomes per name, keyed by status code or exception class."""
+    breakdown = defaultdict(lambda: defaultdict(int))
+    for sample in samples:
+        if sample.status == 0:
+            breakdown[sample.name][sample.error or 'error'] += 1
+        elif sample.status >= 400:
+            breakdown[sample.name][str(sample.status)] += 1
+    return {name: dict(outcomes) for name, outcomes in sorted(breakdown.items())}
+
+
+COLUMNS = (
+    ('requests', '{:>9d}'),
+    ('errors', '{:>7d}'),
+    ('rps', '{:>9.1f}'),
+    ('p50_ms', '{:>9.2f}'),
+    ('p95_ms', '{:>9.2f}'),
+    ('p99_ms', '{:>9.2f}'),
+    ('max_ms', '{:>9.2f}'),
+)
+
+
+def format_table(summary: dict, baseline: dict | None = None, label: str = 'scenario') -> str:
+    """Markdown table; with a baseline, latency and throughput columns also show the relative change."""
+    width = max([len(name) for name in summary] + [len(label)])
+    header = f'| {label:<{width}} |' + ''.join(f' {column:>9} |' for column, _ in COLUMNS)
+    lines = [header, '|' + '-' * (width + 2) + '|' + ''.join('-' * 11 + '|' for _ in COLUMNS)]
+    for name, row in summary.items():
+        cells = []
+        for column, cell_format in COLUMNS:
+            cell = cell_format.format(row[column])
+            previous = (baseline or {}).get(name, {}).get(column)
+            if previous and column not in ('requests', 'errors'):
+                cell = f'{cell_format.format(row[column]).strip()} ({(row[column] / previous - 1) * 100:+.0f}%)'
+            cells.append(f' {cell:>9} |')
+        lines.append(f'| {name:<{width}} |' + ''.join(cells))
+    return '\n'.join(lines)
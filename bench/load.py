@@ -0,0 +1,224 @@
+"""Repeatable load scenarios against the Flask app (in-process test client) or a running server.
+
+Scenarios: read-heavy listing, single gets, PATCH technology churn and bulk delete. Every scenario builds its
+requests up front from a seeded RNG, so two runs against the same dataset send the same traffic. Load a dataset
+first (see `bench/generate.py`), then:
+
+    PYTHONPATH=src python -m bench.load --output before.json
+    PYTHONPATH=src python -m bench.load --baseline before.json
+    PYTHONPATH=src python -m bench.load --url http://localhost:8000 --concurrency 32 --scenarios list,get
+
+`patch` and `delete` write to the database: `patch` rewrites the technologies of sampled projects, and `delete`
+removes the projects it creates for itself, `--delete-batch` ids per `POST /project/bulk/delete`. A scenario with
+server errors fails the run (without writing `--output`): its timings would measure error responses.
+"""
+import argparse
+import json
+import random
+import subprocess
+import sys
+import uuid
+from datetime import datetime
+from datetime import timezone
+
+from bench.harness import Call
+from bench.harness import error_breakdown
+from bench.harness import format_table
+from bench.harness import make_target
+from bench.harness import run
+from bench.harness import summarize
+
+SCENARIOS = ('list', 'get', 'patch', 'delete')
+PAGE_SIZES = (10, 20, 50, 100)
+BULK_CREATE_LIMIT = 1000
+DELETE_BATCH_SIZE = 20
+
+
+def sample_projects(target, size: int) -> list[dict]:
+    """Walk `/project/all` with cursors and keep the first `size` projects."""
+    projects, cursor = [], None
+    while len(projects) < size:
+        path = f'/project/all?limit={min(100, size - len(projects))}'
+        if cursor:
+            path += f'&cursor={cursor}'
+        try:
+            status, body = target.send(Call('sample', 'GET', path))
+        except OSError as e:
+            sys.exit(f'Sampling projects failed: {e}')
+        if status != 200:
+            sys.exit(f'Sampling projects failed with {status}: {body[:200]!r}')
+        page = json.loads(body)
+        projects.extend(page['projects'])
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    if not projects:
+        sys.exit('No projects to benchmark against, load a dataset first (bench/generate.py).')
+    return projects
+
+
+def known_versions(projects: list[dict]) -> dict[str, list[str]]:
+    versions = {}
+    for project in projects:
+        for tech_version in project['technologies']:
+            known = versions.setdefault(tech_version['technology']['name'], [])
+            if tech_version['version'] not in known:
+                known.append(tech_version['version'])
+    return versions
+
+
+def list_calls(rng: random.Random, projects: list[dict], count: int) -> list[Call]:
+    technologies = sorted(known_versions(projects))
+    calls = []
+    for _ in range(count):
+        limit = rng.choice(PAGE_SIZES)
+        path = f'/project/all?limit={limit}&offset={rng.randrange(0, max(len(projects) - limit, 1))}'
+        if technologies and rng.random() < 0.3:
+            path += f'&technology={rng.choice(technologies)}'
+        if rng.random() < 0.2:
+            path += '&order_by=name'
+        calls.append(Call('list', 'GET', path))
+    return calls
+
+
+def get_calls(rng: random.Random, projects: list[dict], count: int) -> list[Call]:
+    # 80% of the reads go to 20% of the projects.
+    hot = projects[:max(len(projects) // 5, 1)]
+    return [
+        Call('get', 'GET', f'/project/{rng.choice(hot if rng.random() < 0.8 else projects)["id"]}')
+        for _ in range(count)
+    ]
+
+
+def patch_calls(rng: random.Random, projects: list[dict], count: int) -> list[Call]:
+    """PATCHes that move one technology of a project to another version, or swap it for another technology."""
+    versions = known_versions(projects)
+    technologies = {
+        project['id']: {tech['technology']['name']: tech['version'] for tech in project['technologies']}
+        for project in projects
+    }
+    calls = []
+    for _ in range(count):
+        project = rng.choice(projects)
+        current = technologies[project['id']]
+        if current and rng.random() < 0.7:
+            name = rng.choice(sorted(current))
+            current[name] = rng.choice(versions[name])
+        elif current:
+            del current[rng.choice(sorted(current))]
+            name = rng.choice(sorted(versions))
+            current[name] = rng.choice(versions[name])
+        body = {
+            'name': project['name'],
+            'technologies': [{'name': name, 'version': version} for name, version in current.items()],
+        }
+        calls.append(Call('patch', 'PATCH', f'/project/{project["id"]}', body))
+    return calls
+
+
+def delete_calls(target, rng: random.Random, projects: list[dict], count: int, batch_size: int) -> list[Call]:
+    """Creates `count` batches of `batch_size` throwaway projects (not timed) and returns the bulk deletes for them."""
+    versions = known_versions(projects)
+    prefix = f'bench-delete-{uuid.UUID(int=rng.getrandbits(128)).hex[:8]}'
+    project_ids = []
+    total = count * batch_size
+    for start in range(0, total, BULK_CREATE_LIMIT):
+        batch = [
+            {
+                'name': f'{prefix}-{index}',
+                'technologies': [
+                    {'name': name, 'version': rng.choice(versions[name])}
+                    for name in rng.sample(sorted(versions), min(3, len(versions)))
+                ],
+            }
+            for index in range(start, min(start + BULK_CREATE_LIMIT, total))
+        ]
+        status, body = target.send(Call('setup', 'POST', '/project/bulk', {'projects': batch}))
+        if status != 200:
+            sys.exit(f'Creating projects to delete failed with {status}: {body[:200]!r}')
+        project_ids.extend(result['project_id'] for result in json.loads(body)['results'] if result['project_id'])
+    return [
+        Call('delete', 'POST', '/project/bulk/delete', {'ids': project_ids[start:start + batch_size]})
+        for start in range(0, len(project_ids), batch_size)
+    ]
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help='Base URL of a running server; the in-process Flask app when omitted.')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        type=lambda value: [scenario for scenario in value.split(',') if scenario])
+    parser.add_argument('--requests', type=int, default=1000, help='Measured requests per scenario.')
+    parser.add_argument('--warmup', type=int, default=50, help='Unmeasured requests per scenario.')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--sample', type=int, default=1000, help='Projects sampled to build requests from.')
+    parser.add_argument('--delete-batch', type=int, default=DELETE_BATCH_SIZE, help='Project ids per bulk delete.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write the results as JSON, to pass as --baseline later.')
+    parser.add_argument('--baseline', help='Results JSON of a previous run to compare with.')
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(sorted(unknown))}')
+
+    target = make_target(args.url)
+    rng = random.Random(args.seed)
+    projects = sample_projects(target, args.sample)
+
+    summary, errors = {}, {}
+    for scenario in args.scenarios:
+        total = args.warmup + args.requests
+        if scenario == 'list':
+            calls = list_calls(rng, projects, total)
+        elif scenario == 'get':
+            calls = get_calls(rng, projects, total)
+        elif scenario == 'patch':
+            calls = patch_calls(rng, projects, total)
+        else:
+            calls = delete_calls(target, rng, projects, total, args.delete_batch)
+
+        run(target, calls[:args.warmup], args.concurrency)
+        samples, wall_seconds = run(target, calls[args.warmup:], args.concurrency)
+        summary.update(summarize(samples, wall_seconds))
+        errors.update(error_breakdown(samples))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)['summary']
+
+    print(f'target: {args.url or "in-process app"}, concurrency: {args.concurrency}, '
+          f'requests per scenario: {args.requests}, revision: {git_revision() or "unknown"}')
+    print(format_table(summary, baseline))
+    for name, outcomes in errors.items():
+        print(f'{name} errors: ' + ', '.join(f'{outcome} x{count}' for outcome, count in outcomes.items()))
+
+    failed = [name for name, row in summary.items() if row['errors']]
+    if failed:
+        sys.exit(f'Server errors in {", ".join(failed)}: the timings measure error responses, fix them first.')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({
+                'revision': git_revision(),
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'target': args.url or 'app',
+                'concurrency': args.concurrency,
+                'requests': args.requests,
+                'summary': summary,
+                'errors': errors,
+            }, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
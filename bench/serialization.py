@@ -0,0 +1,103 @@
+"""Per-project CPU cost of rendering a `/project/all` page: entity + schema path vs. record fast path.
+
+The old path starts from already loaded ORM objects, so ORM hydration (which the fast path also skips) is not
+counted in its favour.
+
+    PYTHONPATH=src python bench/serialization.py --projects 500 --technologies 5
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime
+from datetime import timezone
+
+from infrastructure.db.postgres.models import ProjectModel
+from infrastructure.db.postgres.models import TechnologyModel
+from infrastructure.db.postgres.models import TechnologyVersionModel
+from infrastructure.db.postgres.repositories import BasePostgresProjectRepository
+from presentation.api.schemas import GetManyProjectResponseSchema
+from presentation.api.schemas import ProjectSchema
+from presentation.api.serialization import project_records_page_adapter
+
+
+def make_rows(projects: int, technologies: int) -> tuple[list[tuple], list[tuple]]:
+    project_rows = [
+        (project_id, f'Project {project_id}', f'Description of project {project_id}', datetime(2025, 1, 1), None, 1,
+         datetime(2025, 1, 1, tzinfo=timezone.utc))
+        for project_id in range(1, projects + 1)
+    ]
+    technology_rows = [
+        (project_id, project_id * 100 + index, f'{index}.{project_id % 10}', index, f'Technology {index}', None)
+        for project_id in range(1, projects + 1)
+        for index in range(technologies)
+    ]
+    return project_rows, technology_rows
+
+
+def make_models(project_rows: list[tuple], technology_rows: list[tuple]) -> list[ProjectModel]:
+    technologies = {}
+    models = {
+        project_id: ProjectModel(
+            id=project_id, name=name, description=description, start_date=start_date, end_date=end_date,
+            version=version, updated_at=updated_at, technologies=[],
+        )
+        for project_id, name, description, start_date, end_date, version, updated_at in project_rows
+    }
+    for project_id, version_id, version, technology_id, name, description in technology_rows:
+        technology = technologies.setdefault(
+            technology_id, TechnologyModel(id=technology_id, name=name, description=description),
+        )
+        models[project_id].technologies.append(
+            TechnologyVersionModel(id=version_id, version=version, technology=technology),
+        )
+    return list(models.values())
+
+
+def entity_path(models: list[ProjectModel]) -> bytes:
+    projects = [ProjectSchema.model_validate(BasePostgresProjectRepository._to_entity(model)) for model in models]
+    payload = GetManyProjectResponseSchema(projects=projects, next_offset=len(projects)).model_dump(mode='json')
+    return json.dumps(payload, sort_keys=True).encode()  # what `jsonify` does
+
+
+def record_path(project_rows: list[tuple], technology_rows: list[tuple]) -> bytes:
+    records = BasePostgresProjectRepository._to_records(project_rows, technology_rows)
+    return project_records_page_adapter.dump_json({
+        'projects': records,
+        'next_offset': len(records),
+        'next_cursor': None,
+    })
+
+
+def normalized(body: bytes) -> dict:
+    # `ProjectSchema.technologies` is a set, so only the record path has a stable technology order.
+    payload = json.loads(body)
+    for project in payload['projects']:
+        project['technologies'].sort(key=lambda tech_version: tech_version['technology']['name'])
+    return payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=500)
+    parser.add_argument('--technologies', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    project_rows, technology_rows = make_rows(args.projects, args.technologies)
+    models = make_models(project_rows, technology_rows)
+    assert normalized(entity_path(models)) == normalized(record_path(project_rows, technology_rows))
+
+    results = {
+        'entity + schema': min(timeit.repeat(lambda: entity_path(models), number=1, repeat=args.repeat)),
+        'record fast path': min(timeit.repeat(
+            lambda: record_path(project_rows, technology_rows), number=1, repeat=args.repeat,
+        )),
+    }
+    print(f'{args.projects} projects x {args.technologies} technologies, best of {args.repeat}')
+    for name, seconds in results.items():
+        print(f'{name:<18} {seconds * 1000:8.2f} ms/page {seconds / args.projects * 1e6:8.2f} us/project')
+    print(f'speedup            {results["entity + schema"] / results["record fast path"]:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -3,12 +3,19 @@
 alembic -n postgres upgrade head
 
 ENVIRONMENT="${ENVIRONMENT:-dev}"
+API_MODE="${API_MODE:-sync}"
 
-if [ "$ENVIRONMENT" = "dev" ]; then
+if [ "$API_MODE" = "async" ]; then
+    if [ "$ENVIRONMENT" = "dev" ]; then
+        exec python -m quart --app presentation.api.async_main:create_app run --host=0.0.0.0 --port=8000 --debug
+    elif [ "$ENVIRONMENT" = "prod" ]; then
+        exec hypercorn --bind 0.0.0.0:8000 'presentation.api.async_main:create_app()'
+    fi
+elif [ "$ENVIRONMENT" = "dev" ]; then
     exec python -m flask --app presentation.api.main:create_app run --host=0.0.0.0 --port=8000 --debug
 elif [ "$ENVIRONMENT" = "prod" ]; then
-    exec gunicorn --bind 0.0.0.0:8000 presentation.api.main:app
-else
-    echo "Error: ENVIRONMENT variable is not set correctly. Use 'dev' or 'prod'."
-    exit 1
-fi
\ No newline at end of file
+    exec gunicorn -c python:gunicorn_conf presentation.api.main:app
+fi
+
+echo "Error: ENVIRONMENT variable is not set correctly. Use 'dev' or 'prod'."
+exit 1
\ No newline at end of file
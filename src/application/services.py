@@ -1,20 +1,42 @@
 from abc import ABC
 from typing import Iterable
+from typing import Iterator
 
+from core.dto import BulkCreateProjectResultDTO
+from core.dto import BulkCreateProjectsDTO
+from core.dto import BulkDeleteProjectsDTO
+from core.dto import BulkUpdateProjectsDTO
+from core.dto import BulkWriteResultDTO
 from core.dto import CreateProjectDTO
 from core.dto import DeleteProjectDTO
+from core.dto import ExportProjectsDTO
 from core.dto import GetProjectDTO
+from core.dto import GetProjectsByIdsDTO
 from core.dto import GetProjectsDTO
+from core.dto import GetTechnologiesDTO
+from core.dto import GetTechnologyStatsDTO
+from core.dto import GetTechnologyVersionsDTO
+from core.dto import ProjectRecord
+from core.dto import ProjectVersionDTO
 from core.dto import RemoveProjectTechnologiesDTO
+from core.dto import ReplaceTechnologyVersionDTO
+from core.dto import SearchProjectsDTO
+from core.dto import TechnologyStatsDTO
 from core.dto import UpdateProjectDTO
 from core.dto import UpdateProjectTechnologiesDTO
 from core.entities import Project
+from core.entities import Technology
+from core.entities import TechnologyVersion
+from core.interfaces import AsyncProjectRepository
+from core.interfaces import AsyncTechnologyRepository
 from core.interfaces import ProjectRepository
+from core.interfaces import TechnologyRepository
 
 
 class BaseProjectService(ABC):
+    # With an `AsyncProjectRepository` every `call` returns the repository coroutine, so the caller awaits it.
 
-    def __init__(self, project_repository: ProjectRepository):
+    def __init__(self, project_repository: ProjectRepository | AsyncProjectRepository):
         self.project_repository = project_repository
 
 
@@ -30,6 +52,48 @@ class GetSingleProjectService(BaseProjectService):
         return self.project_repository.get_by_id(dto=dto)
 
 
+class GetManyProjectRecordsService(BaseProjectService):
+
+    def call(self, dto: GetProjectsDTO) -> list[ProjectRecord]:
+        return self.project_repository.get_many_records(dto=dto)
+
+
+class GetSingleProjectRecordService(BaseProjectService):
+
+    def call(self, dto: GetProjectDTO) -> ProjectRecord:
+        return self.project_repository.get_record_by_id(dto=dto)
+
+
+class GetProjectsByIdsService(BaseProjectService):
+
+    def call(self, dto: GetProjectsByIdsDTO) -> list[ProjectRecord]:
+        return self.project_repository.get_many_by_ids(dto=dto)
+
+
+class GetProjectVersionService(BaseProjectService):
+
+    def call(self, dto: GetProjectDTO) -> ProjectVersionDTO:
+        return self.project_repository.get_version(dto=dto)
+
+
+class GetManyProjectVersionsService(BaseProjectService):
+
+    def call(self, dto: GetProjectsDTO) -> list[ProjectVersionDTO]:
+        return self.project_repository.get_many_versions(dto=dto)
+
+
+class SearchProjectsService(BaseProjectService):
+
+    def call(self, dto: SearchProjectsDTO) -> Iterable[Project]:
+        return self.project_repository.search(dto=dto)
+
+
+class ExportProjectsService(BaseProjectService):
+
+    def call(self, dto: ExportProjectsDTO) -> Iterator[Project]:
+        return self.project_repository.export(dto=dto)
+
+
 class CreateProjectService(BaseProjectService):
 
     def call(self, dto: CreateProjectDTO) -> Project:
@@ -58,3 +122,57 @@ class DeleteProjectService(BaseProjectService):
 
     def call(self, dto: DeleteProjectDTO) -> bool:
         return self.project_repository.delete(dto=dto)
+
+
+class BulkCreateProjectsService(BaseProjectService):
+
+    def call(self, dto: BulkCreateProjectsDTO) -> list[BulkCreateProjectResultDTO]:
+        return self.project_repository.bulk_create(dto=dto)
+
+
+class BulkUpdateProjectsService(BaseProjectService):
+
+    def call(self, dto: BulkUpdateProjectsDTO) -> BulkWriteResultDTO:
+        return self.project_repository.bulk_update(dto=dto)
+
+
+class BulkDeleteProjectsService(BaseProjectService):
+
+    def call(self, dto: BulkDeleteProjectsDTO) -> BulkWriteResultDTO:
+        return self.project_repository.bulk_delete(dto=dto)
+
+
+class ReplaceTechnologyVersionService(BaseProjectService):
+
+    def call(self, dto: ReplaceTechnologyVersionDTO) -> BulkWriteResultDTO:
+        return self.project_repository.replace_technology_version(dto=dto)
+
+
+class BaseTechnologyService(ABC):
+
+    def __init__(self, technology_repository: TechnologyRepository | AsyncTechnologyRepository):
+        self.technology_repository = technology_repository
+
+
+class GetManyTechnologiesService(BaseTechnologyService):
+
+    def call(self, dto: GetTechnologiesDTO) -> list[Technology]:
+        return self.technology_repository.get_many(dto=dto)
+
+
+class GetTechnologyVersionsService(BaseTechnologyService):
+
+    def call(self, dto: GetTechnologyVersionsDTO) -> list[TechnologyVersion]:
+        return self.technology_repository.get_versions(dto=dto)
+
+
+class GetTechnologyStatsService(BaseTechnologyService):
+
+    def call(self, dto: GetTechnologyStatsDTO) -> TechnologyStatsDTO:
+        return self.technology_repository.get_stats(dto=dto)
+
+
+class RefreshTechnologyStatsService(BaseTechnologyService):
+
+    def call(self, concurrently: bool = True) -> None:
+        return self.technology_repository.refresh_stats(concurrently=concurrently)
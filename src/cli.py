@@ -1,6 +1,9 @@
 import click
 
+from commands.bench import bench
 from commands.database import database
+from commands.queries import queries
+from commands.technologies import technologies
 
 from log import setup_logging
 
@@ -10,7 +13,10 @@ def cli():
 
 
 
+cli.add_command(bench)
 cli.add_command(database)
+cli.add_command(queries)
+cli.add_command(technologies)
 
 if __name__ == '__main__':
     setup_logging()
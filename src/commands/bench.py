@@ -0,0 +1,132 @@
+import json
+import logging
+import re
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from bench.harness import Call
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_SEGMENT_PATTERN = re.compile(r'/\d+(?=/|$)')
+
+
+class SpeedType(click.ParamType):
+    """`2x`, `0.5x` or `2` replay that much faster than recorded, `max` ignores the recorded timing."""
+    name = 'speed'
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, float):
+            return value
+        if value == 'max':
+            return float('inf')
+        try:
+            speed = float(value.removesuffix('x'))
+        except ValueError:
+            self.fail(f'{value!r} is not a speed like 2x, 0.5x or max.', param, ctx)
+        if speed <= 0:
+            self.fail('speed must be positive.', param, ctx)
+        return speed
+
+
+@click.group()
+def bench():
+    pass
+
+
+@bench.command()
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--url', default=None, help='Base URL of a running instance; the in-process Flask app when omitted.')
+@click.option('--concurrency', type=click.IntRange(min=1), default=8)
+@click.option('--speed', type=SpeedType(), default='1x', help='e.g. 1x (recorded timing), 2x, 0.5x or max.')
+@click.option('--limit', type=click.IntRange(min=1), default=None, help='Replay only the first N requests.')
+def replay(path, url, concurrency, speed, limit):
+    """Replay a JSON lines request log and report latency and errors per endpoint.
+
+    Each line is an object with `method` and `path` (query string included), and optionally `timestamp` (ISO 8601
+    or epoch seconds), `body` and `endpoint`. Requests are grouped by `endpoint`, or by the path without query
+    string and with numeric segments replaced by `<id>`. Lines without `method`/`path` are skipped.
+    """
+    # `bench` lives next to `src`, not in it: imported here so the other commands run from anywhere.
+    try:
+        from bench.harness import error_breakdown
+        from bench.harness import format_table
+        from bench.harness import make_target
+        from bench.harness import percentile
+        from bench.harness import run_schedule
+        from bench.harness import summarize
+    except ModuleNotFoundError as e:
+        if e.name not in ('bench', 'bench.harness'):
+            raise
+        raise click.ClickException('The bench package is not importable, run from the repository root.') from e
+
+    schedule, skipped = _load_schedule(path, speed, limit)
+    if skipped:
+        logger.warning(f'Skipped {skipped} lines of {path} that are not request log entries.')
+    if not schedule:
+        raise click.ClickException(f'No requests to replay in {path}.')
+
+    logger.info(f'Replaying {len(schedule)} requests from {path} against {url or "the in-process app"} '
+                f'at {"max" if speed == float("inf") else f"{speed:g}x"} speed, concurrency {concurrency}...')
+    samples, lateness, wall_seconds = run_schedule(make_target(url), schedule, concurrency)
+
+    summary = summarize(samples, wall_seconds)
+    summary['total'] = summarize(samples, wall_seconds, key=lambda sample: 'total')['total']
+    click.echo(format_table(summary, label='endpoint'))
+
+    for endpoint, outcomes in error_breakdown(samples).items():
+        click.echo(f'{endpoint} errors: ' + ', '.join(f'{outcome} x{count}' for outcome, count in outcomes.items()))
+
+    if speed != float('inf'):
+        # Requests sent late mean the driver, not the recorded traffic, set the pace of this replay.
+        lateness_ms = sorted(seconds * 1000 for seconds in lateness)
+        click.echo(f'schedule lag: p50 {percentile(lateness_ms, 50):.1f} ms, p99 {percentile(lateness_ms, 99):.1f} ms, '
+                   f'max {lateness_ms[-1]:.1f} ms')
+
+
+def _load_schedule(path: str, speed: float, limit: int | None) -> tuple[list[tuple[float, 'Call']], int]:
+    from bench.harness import Call
+
+    entries, skipped = [], 0
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                call = Call(
+                    name=entry.get('endpoint') or _endpoint_name(entry['path']),
+                    method=entry['method'].upper(),
+                    path=entry['path'],
+                    body=entry.get('body'),
+                )
+                timestamp = _timestamp(entry.get('timestamp'))
+            except (json.JSONDecodeError, KeyError, AttributeError, TypeError, ValueError):
+                skipped += 1
+                continue
+            entries.append((timestamp, call))
+            if limit and len(entries) == limit:
+                break
+
+    # Without timestamps, or at `max` speed, requests go out as fast as the workers take them.
+    if speed == float('inf') or any(timestamp is None for timestamp, _ in entries):
+        return [(0.0, call) for _, call in entries], skipped
+
+    entries.sort(key=lambda entry: entry[0])
+    first = entries[0][0] if entries else 0.0
+    return [((timestamp - first) / speed, call) for timestamp, call in entries], skipped
+
+
+def _timestamp(value) -> float | None:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _endpoint_name(path: str) -> str:
+    return NUMERIC_SEGMENT_PATTERN.sub('/<id>', path.split('?', 1)[0])
@@ -3,12 +3,18 @@ import logging
 
 import click
 
+from application.services import BulkCreateProjectsService
 from application.services import CreateProjectService
+from application.services import ExportProjectsService
+from core.dto import BulkCreateProjectsDTO
 from core.dto import CreateProjectDTO
+from core.dto import ExportProjectsDTO
 from core.exceptions import ProjectNameAlreadyExistsError
 from core.utils import from_dict_extended
+from infrastructure.cache import technology_cache
 from infrastructure.db.postgres import PostgresProjectRepository
 from infrastructure.db.postgres import sync_session_manager
+from presentation.export import EXPORT_ENCODERS
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +26,9 @@ def database():
 
 @database.command()
 @click.argument('path', default='seed/projects.json', type=click.Path(exists=True))
-def seed(path):
+@click.option('--batch-size', type=click.IntRange(min=1), default=None,
+              help='Insert projects in batches of this size instead of one transaction per project.')
+def seed(path, batch_size):
     try:
         with open(path, 'r', encoding='utf-8') as file:
             projects_data = json.load(file)
@@ -30,10 +38,15 @@ def seed(path):
 
     logger.info(f"Starting seeding from {path}...")
 
+    if batch_size:
+        _seed_in_batches(projects_data, batch_size)
+        logger.info("Seeding process completed.")
+        return
+
     for project_dict in projects_data:
         try:
             with sync_session_manager() as session:
-                repo = PostgresProjectRepository(session)
+                repo = PostgresProjectRepository(session, technology_cache=technology_cache)
                 service = CreateProjectService(repo)
                 dto = from_dict_extended(CreateProjectDTO, project_dict)
                 service.call(dto)
@@ -44,4 +57,50 @@ def seed(path):
         except Exception as e:
             logger.error(f"Failed to create project '{project_dict.get('name', 'Unknown')}': {e}")
 
-    logger.info("Seeding process completed.")
\ No newline at end of file
+    logger.info("Seeding process completed.")
+
+
+@database.command()
+@click.option('--format', 'export_format', type=click.Choice(list(EXPORT_ENCODERS)), default='ndjson')
+@click.option('--output', type=click.File('w', encoding='utf-8'), default='-')
+@click.option('--batch-size', type=click.IntRange(min=1), default=500)
+def export(export_format, output, batch_size):
+    with sync_session_manager() as session:
+        repo = PostgresProjectRepository(session)
+        service = ExportProjectsService(repo)
+        for chunk in EXPORT_ENCODERS[export_format](service.call(ExportProjectsDTO(batch_size=batch_size))):
+            output.write(chunk)
+
+
+def _seed_in_batches(projects_data: list[dict], batch_size: int):
+    for start in range(0, len(projects_data), batch_size):
+        batch = projects_data[start:start + batch_size]
+        # Converted one by one, a malformed project is skipped without dropping the rest of its batch.
+        projects = []
+        for project_dict in batch:
+            try:
+                projects.append(from_dict_extended(CreateProjectDTO, project_dict))
+            except Exception as e:
+                name = project_dict.get('name', 'Unknown') if isinstance(project_dict, dict) else 'Unknown'
+                logger.error(f"Failed to create project '{name}': {e}")
+        if not projects:
+            continue
+
+        dto = BulkCreateProjectsDTO(projects=projects)
+        try:
+            with sync_session_manager() as session:
+                repo = PostgresProjectRepository(session, technology_cache=technology_cache)
+                service = BulkCreateProjectsService(repo)
+                results = service.call(dto)
+        except Exception as e:
+            logger.error(f"Failed to create batch of projects {start}-{start + len(batch) - 1}: {e}")
+            continue
+
+        for result in results:
+            if result.status == 'error':
+                logger.error(f"Failed to create project '{result.name}': {result.error}")
+            elif result.status == 'duplicate':
+                logger.warning(f"Project '{result.name}' already exists. Skipped.")
+
+        created = sum(result.status == 'created' for result in results)
+        logger.warning(f"Batch {start}-{start + len(batch) - 1}: {created}/{len(batch)} projects created.")
@@ -0,0 +1,163 @@
+import logging
+import uuid
+from datetime import datetime
+
+import click
+from sqlalchemy.orm import Session
+
+from core.dto import BulkCreateProjectsDTO
+from core.dto import BulkDeleteProjectsDTO
+from core.dto import BulkUpdateProjectsDTO
+from core.dto import CreateProjectDTO
+from core.dto import DeleteProjectDTO
+from core.dto import GetProjectDTO
+from core.dto import GetProjectsByIdsDTO
+from core.dto import GetProjectsDTO
+from core.dto import ProjectTechnologyVersionDTO
+from core.dto import RemoveProjectTechnologiesDTO
+from core.dto import ReplaceTechnologyVersionDTO
+from core.dto import SearchProjectsDTO
+from core.dto import UpdateProjectDTO
+from core.dto import UpdateProjectTechnologiesDTO
+from infrastructure.db.postgres import PostgresProjectRepository
+from infrastructure.db.postgres import QueryBudgetError
+from infrastructure.db.postgres import SYNC_ENGINE
+from infrastructure.db.postgres import init_engine
+from infrastructure.db.postgres import query_budget
+
+logger = logging.getLogger(__name__)
+
+# Exact number of statements each repository method may execute, whatever the page size. The async repository
+# builds the same statements. Write budgets assume the technology registry is off, so the upsert always runs.
+QUERY_BUDGETS = {
+    'get_many': 2,  # projects + selectin load of technologies (technology joined in)
+    'get_by_id': 2,
+    'get_many_records': 2,  # projects + technology rows
+    'get_many_narrow': 1,  # `fields` without `expand`: projects only
+    'get_many_records_narrow': 1,
+    'get_record_by_id': 2,
+    'get_record_by_id_narrow': 1,
+    'get_many_by_ids': 2,
+    'get_version': 1,
+    'get_many_versions': 1,
+    'search': 2,
+    'create': 3,  # technologies upsert + project insert + associations insert
+    'update': 3,  # load (2) + project update
+    'update_technologies': 5,  # load (2) + upsert + associations insert + project update
+    'remove_technologies': 4,  # load (2) + associations delete + project update
+    'delete': 1,  # associations and project deleted by one statement
+    'bulk_create': 5,  # savepoint + upsert + projects insert + associations insert + release
+    'bulk_update': 2,  # date range check (only one of the dates given) + projects update
+    'bulk_delete': 1,  # associations and projects deleted by one statement
+    'replace_technology_version': 2,  # target version upsert + associations/projects update
+}
+
+
+@click.group()
+def queries():
+    pass
+
+
+@queries.command()
+@click.option('--projects', 'project_count', type=click.IntRange(min=2), default=20,
+              help='Number of fixture projects, read methods are checked with pages of 1 and of all of them.')
+def check(project_count):
+    """Check every repository method against its statement budget.
+
+    Runs against the configured database inside a transaction that is rolled back at the end.
+    """
+    failures = 0
+    with init_engine(SYNC_ENGINE).connect() as connection:
+        transaction = connection.begin()
+        try:
+            with Session(bind=connection) as session:
+                for label, budget, call in _budget_cases(session, project_count):
+                    session.expunge_all()
+                    try:
+                        with query_budget(budget, label):
+                            call()
+                    except QueryBudgetError as e:
+                        failures += 1
+                        logger.error(str(e))
+                    else:
+                        logger.info(f'{label}: {budget} statements.')
+        finally:
+            transaction.rollback()
+
+    if failures:
+        raise click.ClickException(f'{failures} repository calls exceeded or undercut their statement budget.')
+    logger.info('All repository calls are within their statement budgets.')
+
+
+def _budget_cases(session: Session, project_count: int):
+    repo = PostgresProjectRepository(session)
+    prefix = f'qbudget{uuid.uuid4().hex[:8]}'
+
+    def fixture(name, index=0):
+        return CreateProjectDTO(
+            name=name,
+            description=f'Query budget fixture {index}',
+            technologies=[
+                ProjectTechnologyVersionDTO(name=f'{prefix}-python', version=f'3.{index % 4}'),
+                ProjectTechnologyVersionDTO(name=f'{prefix}-postgres', version='16'),
+            ],
+            start_date=datetime(2024, 1, 1),
+            end_date=None,
+        )
+
+    results = repo.bulk_create(BulkCreateProjectsDTO(
+        projects=[fixture(f'{prefix}-{index}', index) for index in range(project_count)],
+    ))
+    project_ids = [result.project_id for result in results]
+    project_id = project_ids[0]
+    removable = repo.create(fixture(f'{prefix}-removable'))
+    bulk_removable = [repo.create(fixture(f'{prefix}-bulk-removable-{index}', index)).id for index in range(2)]
+
+    for limit in (1, project_count):
+        page = GetProjectsDTO(limit=limit, name_prefix=prefix)
+        yield f'get_many[limit={limit}]', QUERY_BUDGETS['get_many'], lambda page=page: repo.get_many(page)
+        yield (f'get_many_records[limit={limit}]', QUERY_BUDGETS['get_many_records'],
+               lambda page=page: repo.get_many_records(page))
+        narrow = GetProjectsDTO(limit=limit, name_prefix=prefix, fields=['id', 'name'])
+        yield (f'get_many[limit={limit},fields=id,name]', QUERY_BUDGETS['get_many_narrow'],
+               lambda narrow=narrow: repo.get_many(narrow))
+        yield (f'get_many_records[limit={limit},fields=id,name]', QUERY_BUDGETS['get_many_records_narrow'],
+               lambda narrow=narrow: repo.get_many_records(narrow))
+        yield (f'get_many_versions[limit={limit}]', QUERY_BUDGETS['get_many_versions'],
+               lambda page=page: repo.get_many_versions(page))
+        yield (f'get_many_by_ids[ids={limit}]', QUERY_BUDGETS['get_many_by_ids'],
+               lambda limit=limit: repo.get_many_by_ids(GetProjectsByIdsDTO(project_ids=project_ids[:limit])))
+        yield (f'search[limit={limit}]', QUERY_BUDGETS['search'],
+               lambda limit=limit: repo.search(SearchProjectsDTO(query=prefix, limit=limit)))
+
+    yield 'get_by_id', QUERY_BUDGETS['get_by_id'], lambda: repo.get_by_id(GetProjectDTO(project_id=project_id))
+    yield ('get_record_by_id', QUERY_BUDGETS['get_record_by_id'],
+           lambda: repo.get_record_by_id(GetProjectDTO(project_id=project_id)))
+    yield ('get_record_by_id[fields=id,name]', QUERY_BUDGETS['get_record_by_id_narrow'],
+           lambda: repo.get_record_by_id(GetProjectDTO(project_id=project_id, fields=['id', 'name'])))
+    yield 'get_version', QUERY_BUDGETS['get_version'], lambda: repo.get_version(GetProjectDTO(project_id=project_id))
+    yield 'create', QUERY_BUDGETS['create'], lambda: repo.create(fixture(f'{prefix}-created'))
+    yield ('update', QUERY_BUDGETS['update'],
+           lambda: repo.update(UpdateProjectDTO(project_id=project_id, description='Updated fixture')))
+    yield ('update_technologies', QUERY_BUDGETS['update_technologies'],
+           lambda: repo.update_technologies(UpdateProjectTechnologiesDTO(
+               project_id=project_id,
+               technologies=[ProjectTechnologyVersionDTO(name=f'{prefix}-redis', version='7')],
+           )))
+    yield ('remove_technologies', QUERY_BUDGETS['remove_technologies'],
+           lambda: repo.remove_technologies(RemoveProjectTechnologiesDTO(
+               project_id=project_id, technologies=[f'{prefix}-redis'],
+           )))
+    yield 'delete', QUERY_BUDGETS['delete'], lambda: repo.delete(DeleteProjectDTO(project_id=removable.id))
+    yield ('bulk_update', QUERY_BUDGETS['bulk_update'],
+           lambda: repo.bulk_update(BulkUpdateProjectsDTO(project_ids=project_ids, end_date=datetime(2030, 1, 1))))
+    yield ('bulk_delete', QUERY_BUDGETS['bulk_delete'],
+           lambda: repo.bulk_delete(BulkDeleteProjectsDTO(project_ids=bulk_removable)))
+    yield ('replace_technology_version', QUERY_BUDGETS['replace_technology_version'],
+           lambda: repo.replace_technology_version(ReplaceTechnologyVersionDTO(
+               technology=f'{prefix}-python', from_version='3.0', to_version='3.1',
+           )))
+    yield ('bulk_create', QUERY_BUDGETS['bulk_create'],
+           lambda: repo.bulk_create(BulkCreateProjectsDTO(
+               projects=[fixture(f'{prefix}-bulk-{index}', index) for index in range(2)],
+           )))
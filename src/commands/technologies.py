@@ -0,0 +1,28 @@
+import logging
+import time
+
+import click
+
+from application.services import RefreshTechnologyStatsService
+from infrastructure.db.postgres import PostgresTechnologyRepository
+from infrastructure.db.postgres import sync_session_manager
+
+logger = logging.getLogger(__name__)
+
+
+@click.group()
+def technologies():
+    pass
+
+
+@technologies.command('refresh-stats')
+@click.option('--concurrently/--no-concurrently', default=True,
+              help='Keep the views readable while refreshing; --no-concurrently is faster but blocks readers.')
+def refresh_stats(concurrently):
+    """Refresh the materialized views behind GET /technology/stats, e.g. from cron."""
+    started = time.perf_counter()
+    with sync_session_manager() as session:
+        service = RefreshTechnologyStatsService(PostgresTechnologyRepository(session))
+        service.call(concurrently=concurrently)
+
+    logger.warning(f"Technology statistics refreshed in {time.perf_counter() - started:.2f} s.")
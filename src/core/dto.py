@@ -1,6 +1,16 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from typing_extensions import TypedDict
+
+PROJECT_ORDERING_FIELDS = {
+    'id': ('id',),
+    'name': ('name', 'id'),
+}
+# Scalar fields a read may be narrowed to (`fields`), and what it may embed on top (`expand`).
+PROJECT_FIELDS = ('id', 'name', 'description', 'start_date', 'end_date', 'version', 'updated_at')
+PROJECT_EXPANSIONS = ('technologies',)
+
 
 @dataclass(frozen=True)
 class UNSET:
@@ -18,12 +28,50 @@ class ProjectTechnologyVersionDTO:
 @dataclass(frozen=True)
 class GetProjectDTO:
     project_id: int
+    fields: list[str] | None = None  # every field when `None`
+    expand: list[str] | None = None  # see `core.utils.project_expansions`
+
+
+@dataclass(frozen=True)
+class GetProjectsByIdsDTO:
+    project_ids: list[int]
+
+
+@dataclass(frozen=True)
+class ProjectVersionDTO:
+    project_id: int
+    version: int
+    updated_at: datetime
 
 
 @dataclass(frozen=True)
 class GetProjectsDTO:
     limit: int = 10
     offset: int = 0
+    cursor: str | None = None
+    order_by: str = 'id'
+    name_prefix: str | None = None
+    technology: str | None = None
+    version: str | None = None
+    min_version: str | None = None
+    start_date_from: datetime | None = None
+    start_date_to: datetime | None = None
+    end_date_from: datetime | None = None
+    end_date_to: datetime | None = None
+    fields: list[str] | None = None
+    expand: list[str] | None = None
+
+
+@dataclass(frozen=True)
+class SearchProjectsDTO:
+    query: str
+    limit: int = 10
+    offset: int = 0
+
+
+@dataclass(frozen=True)
+class ExportProjectsDTO:
+    batch_size: int = 500
 
 
 @dataclass(frozen=True)
@@ -43,6 +91,7 @@ class UpdateProjectDTO:
     technologies: list[ProjectTechnologyVersionDTO] | None | UNSET = UNSET
     start_date: datetime | None | UNSET = UNSET
     end_date: datetime | None | UNSET = UNSET
+    expected_version: int | None = None
 
 
 @dataclass(frozen=True)
@@ -60,3 +109,121 @@ class RemoveProjectTechnologiesDTO:
 @dataclass(frozen=True)
 class DeleteProjectDTO:
     project_id: int
+
+
+@dataclass(frozen=True)
+class BulkCreateProjectsDTO:
+    projects: list[CreateProjectDTO]
+
+
+@dataclass(frozen=True)
+class BulkCreateProjectResultDTO:
+    index: int
+    name: str
+    status: str  # created | duplicate | error
+    project_id: int | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class ReplaceTechnologyVersionDTO:
+    technology: str
+    from_version: str
+    to_version: str
+
+
+@dataclass(frozen=True)
+class BulkUpdateProjectsDTO:
+    project_ids: list[int]
+    description: str | None | UNSET = UNSET
+    start_date: datetime | None | UNSET = UNSET
+    end_date: datetime | None | UNSET = UNSET
+
+
+@dataclass(frozen=True)
+class BulkDeleteProjectsDTO:
+    # Both narrow the selection when given; paging fields of `filters` are ignored.
+    project_ids: list[int] | None = None
+    filters: GetProjectsDTO | None = None
+
+
+@dataclass(frozen=True)
+class BulkWriteResultDTO:
+    project_ids: list[int]  # the projects actually changed or deleted
+
+
+@dataclass(frozen=True)
+class GetTechnologiesDTO:
+    name_prefix: str | None = None
+    limit: int = 50
+    offset: int = 0
+
+
+@dataclass(frozen=True)
+class GetTechnologyVersionsDTO:
+    technology_id: int
+
+
+@dataclass(frozen=True)
+class GetTechnologyStatsDTO:
+    technology: str | None = None  # only this technology and the pairs it is part of
+    limit: int = 20
+    pairs_limit: int = 20
+
+
+@dataclass(frozen=True)
+class TechnologyVersionCountDTO:
+    version: str
+    project_count: int
+
+
+@dataclass(frozen=True)
+class TechnologyYearCountDTO:
+    year: int
+    project_count: int
+
+
+@dataclass(frozen=True)
+class TechnologyCountDTO:
+    name: str
+    project_count: int
+    versions: list[TechnologyVersionCountDTO]
+    usage: list[TechnologyYearCountDTO]
+
+
+@dataclass(frozen=True)
+class TechnologyPairCountDTO:
+    technologies: tuple[str, str]
+    project_count: int
+
+
+@dataclass(frozen=True)
+class TechnologyStatsDTO:
+    technologies: list[TechnologyCountDTO]
+    pairs: list[TechnologyPairCountDTO]
+    refreshed_at: datetime | None  # `None` until the views were refreshed once
+
+
+# Read-only records for the GET fast path: plain dicts built from row tuples, serialized without entities/schemas.
+
+class TechnologyRecord(TypedDict):
+    id: int
+    name: str
+    description: str | None
+
+
+class TechnologyVersionRecord(TypedDict):
+    id: int
+    version: str
+    technology: TechnologyRecord
+
+
+class ProjectRecord(TypedDict):
+    id: int
+    name: str
+    description: str | None
+    technologies: list[TechnologyVersionRecord]
+    start_date: datetime | None
+    end_date: datetime | None
+    version: int
+    updated_at: datetime
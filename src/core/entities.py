@@ -44,6 +44,8 @@ class Project:
     technologies: list[TechnologyVersion] = field(default_factory=list)
     start_date: datetime | None = None
     end_date: datetime | None = None
+    version: int | None = None
+    updated_at: datetime | None = None
 
     def validate(self):
         if self.start_date and self.end_date and self.end_date < self.start_date:
@@ -31,3 +31,33 @@ class ProjectInvalidDateRangeError(CoreException):
 class InvalidTechnologyVersionFormat(CoreException):
     def __init__(self, name:str, version: str):
         super().__init__(f'Technology with name ({name}) has invalid version ({version})')
+
+
+class TechnologyNotFoundError(CoreException):
+
+    def __init__(self, technology_id: int):
+        super().__init__(f'Technology with id ({technology_id}) not found.')
+
+
+class InvalidCursorError(CoreException):
+
+    def __init__(self, cursor: str):
+        super().__init__(f'Invalid pagination cursor ({cursor}).')
+
+
+class StaleTechnologyReferenceError(CoreException):
+
+    def __init__(self):
+        super().__init__('Technology references changed concurrently, please retry.')
+
+
+class ProjectVersionMismatchError(CoreException):
+
+    def __init__(self, project_id: int):
+        super().__init__(f'Project with id ({project_id}) was modified by another request.')
+
+
+class ProjectConcurrentUpdateError(CoreException):
+
+    def __init__(self, project_id: int):
+        super().__init__(f'Project with id ({project_id}) was modified concurrently, please retry.')
@@ -1,14 +1,33 @@
+from typing import AsyncIterator
 from typing import Iterable
+from typing import Iterator
 from typing import Protocol
 
+from core.dto import BulkCreateProjectResultDTO
+from core.dto import BulkCreateProjectsDTO
+from core.dto import BulkDeleteProjectsDTO
+from core.dto import BulkUpdateProjectsDTO
+from core.dto import BulkWriteResultDTO
 from core.dto import CreateProjectDTO
 from core.dto import DeleteProjectDTO
+from core.dto import ExportProjectsDTO
 from core.dto import GetProjectDTO
+from core.dto import GetProjectsByIdsDTO
 from core.dto import GetProjectsDTO
+from core.dto import GetTechnologiesDTO
+from core.dto import GetTechnologyStatsDTO
+from core.dto import GetTechnologyVersionsDTO
+from core.dto import ProjectRecord
+from core.dto import ProjectVersionDTO
 from core.dto import RemoveProjectTechnologiesDTO
+from core.dto import ReplaceTechnologyVersionDTO
+from core.dto import SearchProjectsDTO
+from core.dto import TechnologyStatsDTO
 from core.dto import UpdateProjectDTO
 from core.dto import UpdateProjectTechnologiesDTO
 from core.entities import Project
+from core.entities import Technology
+from core.entities import TechnologyVersion
 
 
 class ProjectRepository(Protocol):
@@ -17,6 +36,20 @@ class ProjectRepository(Protocol):
 
     def get_by_id(self, dto: GetProjectDTO) -> Project: ...
 
+    def get_many_records(self, dto: GetProjectsDTO) -> list[ProjectRecord]: ...
+
+    def get_record_by_id(self, dto: GetProjectDTO) -> ProjectRecord: ...
+
+    def get_many_by_ids(self, dto: GetProjectsByIdsDTO) -> list[ProjectRecord]: ...
+
+    def get_version(self, dto: GetProjectDTO) -> ProjectVersionDTO: ...
+
+    def get_many_versions(self, dto: GetProjectsDTO) -> list[ProjectVersionDTO]: ...
+
+    def search(self, dto: SearchProjectsDTO) -> Iterable[Project]: ...
+
+    def export(self, dto: ExportProjectsDTO) -> Iterator[Project]: ...
+
     def create(self, dto: CreateProjectDTO) -> Project: ...
 
     def update(self, dto: UpdateProjectDTO) -> Project: ...
@@ -26,3 +59,72 @@ class ProjectRepository(Protocol):
     def remove_technologies(self, dto: RemoveProjectTechnologiesDTO) -> Project: ...
 
     def delete(self, dto: DeleteProjectDTO) -> bool: ...
+
+    def bulk_create(self, dto: BulkCreateProjectsDTO) -> list[BulkCreateProjectResultDTO]: ...
+
+    def bulk_update(self, dto: BulkUpdateProjectsDTO) -> BulkWriteResultDTO: ...
+
+    def bulk_delete(self, dto: BulkDeleteProjectsDTO) -> BulkWriteResultDTO: ...
+
+    def replace_technology_version(self, dto: ReplaceTechnologyVersionDTO) -> BulkWriteResultDTO: ...
+
+
+class AsyncProjectRepository(Protocol):
+
+    async def get_many(self, dto: GetProjectsDTO) -> Iterable[Project]: ...
+
+    async def get_by_id(self, dto: GetProjectDTO) -> Project: ...
+
+    async def get_many_records(self, dto: GetProjectsDTO) -> list[ProjectRecord]: ...
+
+    async def get_record_by_id(self, dto: GetProjectDTO) -> ProjectRecord: ...
+
+    async def get_many_by_ids(self, dto: GetProjectsByIdsDTO) -> list[ProjectRecord]: ...
+
+    async def get_version(self, dto: GetProjectDTO) -> ProjectVersionDTO: ...
+
+    async def get_many_versions(self, dto: GetProjectsDTO) -> list[ProjectVersionDTO]: ...
+
+    async def search(self, dto: SearchProjectsDTO) -> Iterable[Project]: ...
+
+    def export(self, dto: ExportProjectsDTO) -> AsyncIterator[Project]: ...
+
+    async def create(self, dto: CreateProjectDTO) -> Project: ...
+
+    async def update(self, dto: UpdateProjectDTO) -> Project: ...
+
+    async def update_technologies(self, dto: UpdateProjectTechnologiesDTO) -> Project: ...
+
+    async def remove_technologies(self, dto: RemoveProjectTechnologiesDTO) -> Project: ...
+
+    async def delete(self, dto: DeleteProjectDTO) -> bool: ...
+
+    async def bulk_create(self, dto: BulkCreateProjectsDTO) -> list[BulkCreateProjectResultDTO]: ...
+
+    async def bulk_update(self, dto: BulkUpdateProjectsDTO) -> BulkWriteResultDTO: ...
+
+    async def bulk_delete(self, dto: BulkDeleteProjectsDTO) -> BulkWriteResultDTO: ...
+
+    async def replace_technology_version(self, dto: ReplaceTechnologyVersionDTO) -> BulkWriteResultDTO: ...
+
+
+class TechnologyRepository(Protocol):
+
+    def get_many(self, dto: GetTechnologiesDTO) -> list[Technology]: ...
+
+    def get_versions(self, dto: GetTechnologyVersionsDTO) -> list[TechnologyVersion]: ...
+
+    def get_stats(self, dto: GetTechnologyStatsDTO) -> TechnologyStatsDTO: ...
+
+    def refresh_stats(self, concurrently: bool = True) -> None: ...
+
+
+class AsyncTechnologyRepository(Protocol):
+
+    async def get_many(self, dto: GetTechnologiesDTO) -> list[Technology]: ...
+
+    async def get_versions(self, dto: GetTechnologyVersionsDTO) -> list[TechnologyVersion]: ...
+
+    async def get_stats(self, dto: GetTechnologyStatsDTO) -> TechnologyStatsDTO: ...
+
+    async def refresh_stats(self, concurrently: bool = True) -> None: ...
@@ -1,3 +1,6 @@
+import base64
+import binascii
+import json
 from dataclasses import asdict
 from datetime import date
 from datetime import datetime
@@ -7,7 +10,10 @@ from typing import Iterable
 from dacite import Config
 from dacite import from_dict
 
+from core.dto import PROJECT_EXPANSIONS
+from core.dto import PROJECT_ORDERING_FIELDS
 from core.dto import UNSET
+from core.exceptions import InvalidCursorError
 
 
 def asdict_extended(obj: Any, exclude_fields: list[str] | None = None):
@@ -30,3 +36,39 @@ def from_dict_extended(dataclass, data):
         },
     )
     return from_dict(dataclass, data, config)
+
+
+def project_expansions(fields: list[str] | None, expand: list[str] | None) -> list[str]:
+    # Everything is embedded by default; a read narrowed with `fields` embeds only what `expand` asks for.
+    if expand is not None:
+        return expand
+    return [] if fields is not None else list(PROJECT_EXPANSIONS)
+
+
+def encode_cursor(order_by: str, obj: Any) -> str:
+    # `obj` is a project entity/schema or a `ProjectRecord` dict.
+    values = [obj[field] if isinstance(obj, dict) else getattr(obj, field) for field in PROJECT_ORDERING_FIELDS[order_by]]
+    payload = json.dumps({'order_by': order_by, 'values': values}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(order_by: str, cursor: str) -> list[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(cursor) from e
+
+    # Anything the client sends back is untrusted: only the shape `encode_cursor` produces gets to the query.
+    if not isinstance(payload, dict):
+        raise InvalidCursorError(cursor)
+
+    values = payload.get('values')
+    if (
+        payload.get('order_by') != order_by
+        or not isinstance(values, list)
+        or len(values) != len(PROJECT_ORDERING_FIELDS[order_by])
+        or not all(isinstance(value, (int, str)) and not isinstance(value, bool) for value in values)
+    ):
+        raise InvalidCursorError(cursor)
+
+    return values
@@ -0,0 +1,85 @@
+"""Gunicorn configuration for the sync (Flask) API.
+
+    gunicorn -c python:gunicorn_conf presentation.api.main:app
+
+Workers and threads are sized from the CPU count and the database pool unless set explicitly (see `GUNICORN_*` in
+settings.py). With the default preloading, workers fork from a master that has already imported the app; database
+engines are created lazily and reset after fork (see `infrastructure.db.postgres.engines`), so each worker opens its
+own connections. `SIGHUP` restarts the workers gracefully, but workers then still run the
+preloaded code. To deploy new code without dropping requests, send `SIGUSR2` and then `SIGTERM` to the old master.
+"""
+import logging
+import os
+
+from settings import GUNICORN_BIND
+from settings import GUNICORN_GRACEFUL_TIMEOUT
+from settings import GUNICORN_KEEPALIVE
+from settings import GUNICORN_MAX_REQUESTS
+from settings import GUNICORN_MAX_REQUESTS_JITTER
+from settings import GUNICORN_PRELOAD
+from settings import GUNICORN_THREADS
+from settings import GUNICORN_TIMEOUT
+from settings import GUNICORN_WORKER_CLASS
+from settings import GUNICORN_WORKER_CONNECTIONS
+from settings import GUNICORN_WORKERS
+from settings import POSTGRES_MAX_OVERFLOW
+from settings import POSTGRES_POOL_SIZE
+
+logger = logging.getLogger('gunicorn.error')
+
+if GUNICORN_WORKER_CLASS == 'gevent':
+    # Patched before anything else is imported, and psycopg2 made cooperative, or one query blocks the worker.
+    try:
+        from gevent import monkey
+        from psycogreen.gevent import patch_psycopg
+    except ImportError as e:
+        raise RuntimeError(
+            'The `gevent` and `psycogreen` packages are required for GUNICORN_WORKER_CLASS=gevent.',
+        ) from e
+    monkey.patch_all()
+    patch_psycopg()
+
+
+def _cpu_count() -> int:
+    # The CPUs this process may run on, which is less than `os.cpu_count()` under taskset/cpusets.
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _default_workers(worker_class: str, cpus: int) -> int:
+    if worker_class == 'sync':
+        return 2 * cpus + 1
+    # Threads and greenlets already overlap the database waits, one extra worker covers GC/GIL stalls.
+    return cpus + 1
+
+
+_pool_capacity = POSTGRES_POOL_SIZE + POSTGRES_MAX_OVERFLOW
+
+bind = GUNICORN_BIND
+worker_class = GUNICORN_WORKER_CLASS
+workers = GUNICORN_WORKERS or _default_workers(worker_class, _cpu_count())
+# More threads than pooled connections just queue on the pool checkout (POSTGRES_POOL_TIMEOUT).
+threads = (GUNICORN_THREADS or min(4, _pool_capacity)) if worker_class == 'gthread' else 1
+worker_connections = GUNICORN_WORKER_CONNECTIONS
+timeout = GUNICORN_TIMEOUT
+graceful_timeout = GUNICORN_GRACEFUL_TIMEOUT
+keepalive = GUNICORN_KEEPALIVE
+max_requests = GUNICORN_MAX_REQUESTS
+max_requests_jitter = GUNICORN_MAX_REQUESTS_JITTER
+preload_app = GUNICORN_PRELOAD
+errorlog = '-'
+
+
+def on_starting(server):
+    logger.info('Starting %s %s workers x %s threads, preload %s.', workers, worker_class, threads, preload_app)
+    if worker_class == 'gthread' and threads > _pool_capacity:
+        logger.warning('%s threads per worker share %s pooled connections (POSTGRES_POOL_SIZE + '
+                       'POSTGRES_MAX_OVERFLOW).', threads, _pool_capacity)
+
+
+def worker_exit(server, worker):
+    # Close pooled connections now rather than leaving Postgres to notice the dead backends.
+    from infrastructure.db.postgres import dispose_engine
+
+    dispose_engine()
@@ -0,0 +1,31 @@
+from infrastructure.cache.backends import CacheBackend
+from infrastructure.cache.backends import FakeRedisClient
+from infrastructure.cache.backends import InMemoryCacheBackend
+from infrastructure.cache.backends import JsonCodec
+from infrastructure.cache.backends import RedisCacheBackend
+from infrastructure.cache.base import create_cache_backend
+from infrastructure.cache.base import create_project_cache
+from infrastructure.cache.base import create_technology_cache
+from infrastructure.cache.base import project_cache
+from infrastructure.cache.base import technology_cache
+from infrastructure.cache.repositories import CachedProjectRepository
+from infrastructure.cache.repositories import CachedTechnologyRepository
+from infrastructure.cache.repositories import ProjectCache
+from infrastructure.cache.repositories import TechnologyCache
+
+__all__ = [
+    'CacheBackend',
+    'FakeRedisClient',
+    'InMemoryCacheBackend',
+    'JsonCodec',
+    'RedisCacheBackend',
+    'create_cache_backend',
+    'create_project_cache',
+    'create_technology_cache',
+    'project_cache',
+    'technology_cache',
+    'CachedProjectRepository',
+    'CachedTechnologyRepository',
+    'ProjectCache',
+    'TechnologyCache',
+]
@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Protocol
+
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    evictions: int
+
+    def get(self, key: str) -> Any | None: ...
+
+    def set(self, key: str, value: Any) -> None: ...
+
+    def delete(self, *keys: str) -> None: ...
+
+    def incr(self, key: str) -> int: ...
+
+    def get_counter(self, key: str) -> int: ...
+
+
+class InMemoryCacheBackend:
+    """Process-local LRU cache with a per-entry TTL.
+
+    Counters (see `incr`) are kept apart from the entries so they are never evicted.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self.evictions += 1
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class JsonCodec:
+    """JSON for the values of a shared cache, typed by the kind each key starts with (`<kind>:...`).
+
+    Whatever is read back is validated into the type registered for its kind rather than unpickled, so a client
+    that can write to the cache cannot get code run by the readers.
+    """
+
+    def __init__(self, types: dict[str, Any]) -> None:
+        self._adapters = {kind: TypeAdapter(type_) for kind, type_ in types.items()}
+
+    def dumps(self, key: str, value: Any) -> bytes:
+        return self._adapter(key).dump_json(value)
+
+    def loads(self, key: str, data: bytes) -> Any:
+        return self._adapter(key).validate_json(data)
+
+    def _adapter(self, key: str) -> TypeAdapter:
+        kind = key.partition(':')[0]
+        if kind not in self._adapters:
+            raise KeyError(f'No cache value type registered for ({kind}) keys.')
+        return self._adapters[kind]
+
+
+class RedisCacheBackend:
+    """Shared cache on top of a redis-py compatible client, values are encoded with `codec`.
+
+    Expiry and eviction happen on the server, so `evictions` stays at zero here.
+    """
+
+    def __init__(self, client: Any, codec: JsonCodec, ttl: int = 30, prefix: str = 'projects-presenter:') -> None:
+        self.client = client
+        self.codec = codec
+        self.ttl = ttl
+        self.prefix = prefix
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            return None
+        try:
+            return self.codec.loads(key, value)
+        except ValidationError:
+            # Written by an older release, or not by us at all: a miss, overwritten by the next read.
+            logger.warning('Ignoring undecodable cache entry (%s).', key)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        self.client.set(self.prefix + key, self.codec.dumps(key, value), ex=self.ttl)
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def get_counter(self, key: str) -> int:
+        value = self.client.get(self.prefix + key)
+        return int(value) if value is not None else 0
+
+    @classmethod
+    def from_url(cls, url: str, codec: JsonCodec, ttl: int = 30) -> 'RedisCacheBackend':
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError('The `redis` package is required for PROJECT_CACHE_BACKEND=redis.') from e
+
+        return cls(client=redis.Redis.from_url(url), codec=codec, ttl=ttl)
+
+
+class FakeRedisClient:
+    """Minimal in-process stand-in for the subset of redis-py used by `RedisCacheBackend`."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self._data: dict[str, tuple[float | None, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> bytes | None:
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self.clock():
+                del self._data[name]
+                return None
+
+            return value
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        with self._lock:
+            expires_at = self.clock() + ex if ex is not None else None
+            self._data[name] = (expires_at, value)
+            return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            _, value = self._data.get(name, (None, b'0'))
+            value = int(value) + amount
+            self._data[name] = (None, str(value).encode())
+            return value
@@ -0,0 +1,50 @@
+from infrastructure.cache.backends import CacheBackend
+from infrastructure.cache.backends import FakeRedisClient
+from infrastructure.cache.backends import InMemoryCacheBackend
+from infrastructure.cache.backends import JsonCodec
+from infrastructure.cache.backends import RedisCacheBackend
+from infrastructure.cache.repositories import CACHE_VALUE_TYPES
+from infrastructure.cache.repositories import ProjectCache
+from infrastructure.cache.repositories import TechnologyCache
+from settings import PROJECT_CACHE_BACKEND
+from settings import PROJECT_CACHE_MAX_SIZE
+from settings import POSTGRES_REPLICA_HOSTS
+from settings import PROJECT_CACHE_TTL
+from settings import READ_YOUR_WRITES_SECONDS
+from settings import REDIS_URL
+from settings import TECHNOLOGY_CACHE_BACKEND
+from settings import TECHNOLOGY_CACHE_TTL
+
+# How long replicas are assumed to lag behind the primary, the window read-your-writes pins reads for.
+REPLICA_LAG_SECONDS = READ_YOUR_WRITES_SECONDS if POSTGRES_REPLICA_HOSTS else 0
+
+
+def create_cache_backend(backend: str, ttl: int, setting: str = 'PROJECT_CACHE_BACKEND') -> CacheBackend | None:
+    if backend == 'none':
+        return None
+    if backend == 'memory':
+        return InMemoryCacheBackend(max_size=PROJECT_CACHE_MAX_SIZE, ttl=ttl)
+    if backend == 'redis':
+        return RedisCacheBackend.from_url(REDIS_URL, codec=JsonCodec(CACHE_VALUE_TYPES), ttl=ttl)
+    if backend == 'fake-redis':
+        return RedisCacheBackend(client=FakeRedisClient(), codec=JsonCodec(CACHE_VALUE_TYPES), ttl=ttl)
+
+    raise ValueError(f'Unknown {setting} ({backend}).')
+
+
+def create_project_cache(backend: str = PROJECT_CACHE_BACKEND) -> ProjectCache | None:
+    cache_backend = create_cache_backend(backend, ttl=PROJECT_CACHE_TTL)
+    if cache_backend is None:
+        return None
+    return ProjectCache(cache_backend, replica_lag=REPLICA_LAG_SECONDS)
+
+
+def create_technology_cache(backend: str = TECHNOLOGY_CACHE_BACKEND) -> TechnologyCache | None:
+    cache_backend = create_cache_backend(backend, ttl=TECHNOLOGY_CACHE_TTL, setting='TECHNOLOGY_CACHE_BACKEND')
+    if cache_backend is None:
+        return None
+    return TechnologyCache(cache_backend, replica_lag=REPLICA_LAG_SECONDS)
+
+
+project_cache = create_project_cache()
+technology_cache = create_technology_cache()
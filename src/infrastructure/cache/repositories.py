@@ -0,0 +1,384 @@
+import logging
+import threading
+from dataclasses import asdict
+from typing import Iterable
+from typing import Iterator
+
+from core.dto import BulkCreateProjectResultDTO
+from core.dto import BulkCreateProjectsDTO
+from core.dto import BulkDeleteProjectsDTO
+from core.dto import BulkUpdateProjectsDTO
+from core.dto import BulkWriteResultDTO
+from core.dto import CreateProjectDTO
+from core.dto import DeleteProjectDTO
+from core.dto import ExportProjectsDTO
+from core.dto import GetProjectDTO
+from core.dto import GetProjectsByIdsDTO
+from core.dto import GetProjectsDTO
+from core.dto import GetTechnologiesDTO
+from core.dto import GetTechnologyStatsDTO
+from core.dto import GetTechnologyVersionsDTO
+from core.dto import ProjectRecord
+from core.dto import ProjectVersionDTO
+from core.dto import RemoveProjectTechnologiesDTO
+from core.dto import ReplaceTechnologyVersionDTO
+from core.dto import SearchProjectsDTO
+from core.dto import TechnologyStatsDTO
+from core.dto import UpdateProjectDTO
+from core.dto import UpdateProjectTechnologiesDTO
+from core.entities import Project
+from core.entities import Technology
+from core.entities import TechnologyVersion
+from core.interfaces import ProjectRepository
+from core.interfaces import TechnologyRepository
+from infrastructure.cache.backends import CacheBackend
+from infrastructure.db.transactions import on_commit
+
+logger = logging.getLogger(__name__)
+
+LIST_GENERATION_KEY = 'projects:generation'
+TECHNOLOGY_GENERATION_KEY = 'technologies:generation'
+
+# What the keys of each kind hold, for the backends that store JSON (see `JsonCodec`).
+CACHE_VALUE_TYPES = {
+    'project': Project,
+    'projects': list[Project],
+    'project-record': ProjectRecord,
+    'project-records': list[ProjectRecord],
+    'technologies': list[Technology],
+    'technology-versions': list[TechnologyVersion],
+}
+
+
+def _call_later(delay: float, callback) -> None:
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+
+
+class ProjectCache:
+    """Projects by id and list pages.
+
+    Reads go to replicas, which may re-cache a project as it was before a write until they replay it, so
+    `invalidate_committed` drops the written projects and the pages once more `replica_lag` seconds later.
+    """
+
+    def __init__(self, backend: CacheBackend, replica_lag: float = 0) -> None:
+        self.backend = backend
+        self.replica_lag = replica_lag
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def get_project(self, project_id: int) -> Project | None:
+        return self._get(self._project_key(project_id))
+
+    def set_project(self, project: Project) -> None:
+        self.backend.set(self._project_key(project.id), project)
+
+    # List pages are read and filled by key: the key holds the generation, which is read once per read-through so
+    # a page read before a write commits is stored under the generation the write invalidates.
+    def projects_key(self, dto: GetProjectsDTO) -> str:
+        return self._projects_key(dto)
+
+    def get_projects(self, key: str) -> list[Project] | None:
+        return self._get(key)
+
+    def set_projects(self, key: str, projects: list[Project]) -> None:
+        self.backend.set(key, projects)
+
+    def get_project_record(self, project_id: int) -> ProjectRecord | None:
+        return self._get(self._project_key(project_id, kind='project-record'))
+
+    def set_project_record(self, record: ProjectRecord) -> None:
+        self.backend.set(self._project_key(record['id'], kind='project-record'), record)
+
+    def project_records_key(self, dto: GetProjectsDTO) -> str:
+        return self._projects_key(dto, kind='project-records')
+
+    def get_project_records(self, key: str) -> list[ProjectRecord] | None:
+        return self._get(key)
+
+    def set_project_records(self, key: str, records: list[ProjectRecord]) -> None:
+        self.backend.set(key, records)
+
+    def invalidate(self, project_id: int | None = None) -> None:
+        self.invalidate_many([project_id] if project_id is not None else [])
+
+    def invalidate_many(self, project_ids: list[int]) -> None:
+        # List pages may contain (or, after a create, shift around) any project, so they are dropped all at once
+        # by bumping the generation that is part of every list key.
+        keys = [
+            key
+            for project_id in project_ids
+            for key in (self._project_key(project_id), self._project_key(project_id, kind='project-record'))
+        ]
+        if keys:
+            self.backend.delete(*keys)
+        self.backend.incr(LIST_GENERATION_KEY)
+        with self._lock:
+            self.invalidations += 1
+
+    def invalidate_committed(self, project_ids: list[int]) -> None:
+        """Invalidate after a transaction that wrote `project_ids` committed (see `on_commit`)."""
+        self.invalidate_many(project_ids)
+        if self.replica_lag:
+            _call_later(self.replica_lag, lambda: self.invalidate_many(project_ids))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.backend.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def _get(self, key: str):
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    @staticmethod
+    def _project_key(project_id: int, kind: str = 'project') -> str:
+        return f'{kind}:{project_id}'
+
+    def _projects_key(self, dto: GetProjectsDTO, kind: str = 'projects') -> str:
+        generation = self.backend.get_counter(LIST_GENERATION_KEY)
+        params = ':'.join(f'{key}={value}' for key, value in sorted(asdict(dto).items()))
+        return f'{kind}:{generation}:{params}'
+
+
+class CachedProjectRepository:
+    """Read-through `ProjectRepository` decorator.
+
+    Writes invalidate right after they succeed and, when the wrapped repository has a session, once more after the
+    transaction is committed (see `on_commit`), so a concurrent reader cannot re-cache the pre-commit state.
+    With `read_through=False` reads go to the repository, neither reading nor filling the cache, and writes still
+    invalidate it.
+    """
+
+    def __init__(self, repository: ProjectRepository, cache: ProjectCache, read_through: bool = True) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.read_through = read_through
+
+    def get_many(self, dto: GetProjectsDTO) -> Iterable[Project]:
+        if not self.read_through:
+            return self.repository.get_many(dto=dto)
+
+        key = self.cache.projects_key(dto)
+        projects = self.cache.get_projects(key)
+        if projects is None:
+            projects = list(self.repository.get_many(dto=dto))
+            self.cache.set_projects(key, projects)
+        return projects
+
+    def get_by_id(self, dto: GetProjectDTO) -> Project:
+        if not self.read_through or dto.fields is not None or dto.expand is not None:
+            return self.repository.get_by_id(dto=dto)  # only whole projects are cached by id
+
+        project = self.cache.get_project(dto.project_id)
+        if project is None:
+            project = self.repository.get_by_id(dto=dto)
+            self.cache.set_project(project)
+        return project
+
+    def get_many_records(self, dto: GetProjectsDTO) -> list[ProjectRecord]:
+        if not self.read_through:
+            return self.repository.get_many_records(dto=dto)
+
+        key = self.cache.project_records_key(dto)
+        records = self.cache.get_project_records(key)
+        if records is None:
+            records = self.repository.get_many_records(dto=dto)
+            self.cache.set_project_records(key, records)
+        return records
+
+    def get_record_by_id(self, dto: GetProjectDTO) -> ProjectRecord:
+        if not self.read_through or dto.fields is not None or dto.expand is not None:
+            return self.repository.get_record_by_id(dto=dto)
+
+        record = self.cache.get_project_record(dto.project_id)
+        if record is None:
+            record = self.repository.get_record_by_id(dto=dto)
+            self.cache.set_project_record(record)
+        return record
+
+    def get_many_by_ids(self, dto: GetProjectsByIdsDTO) -> list[ProjectRecord]:
+        return self.repository.get_many_by_ids(dto=dto)
+
+    def get_version(self, dto: GetProjectDTO) -> ProjectVersionDTO:
+        return self.repository.get_version(dto=dto)
+
+    def get_many_versions(self, dto: GetProjectsDTO) -> list[ProjectVersionDTO]:
+        return self.repository.get_many_versions(dto=dto)
+
+    def search(self, dto: SearchProjectsDTO) -> Iterable[Project]:
+        return self.repository.search(dto=dto)
+
+    def export(self, dto: ExportProjectsDTO) -> Iterator[Project]:
+        return self.repository.export(dto=dto)
+
+    def create(self, dto: CreateProjectDTO) -> Project:
+        project = self.repository.create(dto=dto)
+        self._invalidate(project_id=project.id)
+        return project
+
+    def update(self, dto: UpdateProjectDTO) -> Project:
+        project = self.repository.update(dto=dto)
+        self._invalidate(project_id=dto.project_id)
+        return project
+
+    def update_technologies(self, dto: UpdateProjectTechnologiesDTO) -> Project:
+        project = self.repository.update_technologies(dto=dto)
+        self._invalidate(project_id=dto.project_id)
+        return project
+
+    def remove_technologies(self, dto: RemoveProjectTechnologiesDTO) -> Project:
+        project = self.repository.remove_technologies(dto=dto)
+        self._invalidate(project_id=dto.project_id)
+        return project
+
+    def delete(self, dto: DeleteProjectDTO) -> bool:
+        success = self.repository.delete(dto=dto)
+        if success:
+            self._invalidate(project_id=dto.project_id)
+        return success
+
+    def bulk_create(self, dto: BulkCreateProjectsDTO) -> list[BulkCreateProjectResultDTO]:
+        results = self.repository.bulk_create(dto=dto)
+        self._invalidate(project_id=None)
+        return results
+
+    def bulk_update(self, dto: BulkUpdateProjectsDTO) -> BulkWriteResultDTO:
+        result = self.repository.bulk_update(dto=dto)
+        self._invalidate_many(result.project_ids)
+        return result
+
+    def bulk_delete(self, dto: BulkDeleteProjectsDTO) -> BulkWriteResultDTO:
+        result = self.repository.bulk_delete(dto=dto)
+        self._invalidate_many(result.project_ids)
+        return result
+
+    def replace_technology_version(self, dto: ReplaceTechnologyVersionDTO) -> BulkWriteResultDTO:
+        result = self.repository.replace_technology_version(dto=dto)
+        self._invalidate_many(result.project_ids)
+        return result
+
+    def _invalidate(self, project_id: int | None) -> None:
+        self._invalidate_many([project_id] if project_id is not None else [])
+
+    def _invalidate_many(self, project_ids: list[int]) -> None:
+        self.cache.invalidate_many(project_ids)
+
+        session = getattr(self.repository, 'session', None)
+        if session is not None:
+            on_commit(session, lambda: self.cache.invalidate_committed(project_ids))
+
+
+class TechnologyCache:
+    """Technology catalogue pages and version lists.
+
+    Everything is dropped at once (by bumping the generation that is part of every key) when a technology or
+    version is added. The catalogue is read from replicas, which may re-cache it as it was before the write until
+    they replay it, so `invalidate_committed` drops it once more `replica_lag` seconds later.
+    """
+
+    def __init__(self, backend: CacheBackend, replica_lag: float = 0) -> None:
+        self.backend = backend
+        self.replica_lag = replica_lag
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    # By key, read once per read-through, like the list pages of `ProjectCache`.
+    def technologies_key(self, dto: GetTechnologiesDTO) -> str:
+        return self._key('technologies', dto)
+
+    def get_technologies(self, key: str) -> list[Technology] | None:
+        return self._get(key)
+
+    def set_technologies(self, key: str, technologies: list[Technology]) -> None:
+        self.backend.set(key, technologies)
+
+    def versions_key(self, dto: GetTechnologyVersionsDTO) -> str:
+        return self._key('technology-versions', dto)
+
+    def get_versions(self, key: str) -> list[TechnologyVersion] | None:
+        return self._get(key)
+
+    def set_versions(self, key: str, versions: list[TechnologyVersion]) -> None:
+        self.backend.set(key, versions)
+
+    def invalidate(self) -> None:
+        self.backend.incr(TECHNOLOGY_GENERATION_KEY)
+        with self._lock:
+            self.invalidations += 1
+
+    def invalidate_committed(self) -> None:
+        """Invalidate after a transaction that added technologies or versions committed (see `on_commit`)."""
+        self.invalidate()
+        if self.replica_lag:
+            _call_later(self.replica_lag, self.invalidate)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.backend.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def _get(self, key: str):
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def _key(self, kind: str, dto) -> str:
+        generation = self.backend.get_counter(TECHNOLOGY_GENERATION_KEY)
+        params = ':'.join(f'{key}={value}' for key, value in sorted(asdict(dto).items()))
+        return f'{kind}:{generation}:{params}'
+
+
+class CachedTechnologyRepository:
+    """Read-through `TechnologyRepository` decorator for the catalogue.
+
+    The project repositories invalidate the cache when they insert technologies or versions (see their
+    `technology_cache`); statistics come from materialized views and are not cached here.
+    """
+
+    def __init__(self, repository: TechnologyRepository, cache: TechnologyCache) -> None:
+        self.repository = repository
+        self.cache = cache
+
+    def get_many(self, dto: GetTechnologiesDTO) -> list[Technology]:
+        key = self.cache.technologies_key(dto)
+        technologies = self.cache.get_technologies(key)
+        if technologies is None:
+            technologies = self.repository.get_many(dto=dto)
+            self.cache.set_technologies(key, technologies)
+        return technologies
+
+    def get_versions(self, dto: GetTechnologyVersionsDTO) -> list[TechnologyVersion]:
+        key = self.cache.versions_key(dto)
+        versions = self.cache.get_versions(key)
+        if versions is None:
+            versions = self.repository.get_versions(dto=dto)
+            self.cache.set_versions(key, versions)
+        return versions
+
+    def get_stats(self, dto: GetTechnologyStatsDTO) -> TechnologyStatsDTO:
+        return self.repository.get_stats(dto=dto)
+
+    def refresh_stats(self, concurrently: bool = True) -> None:
+        return self.repository.refresh_stats(concurrently=concurrently)
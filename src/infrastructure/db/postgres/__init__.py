@@ -1,19 +1,79 @@
 from infrastructure.db.postgres.base import BaseModel
-from infrastructure.db.postgres.base import sync_engine
+from infrastructure.db.postgres.engines import ASYNC_ENGINE
+from infrastructure.db.postgres.engines import EngineRegistry
+from infrastructure.db.postgres.engines import ManagedEngine
+from infrastructure.db.postgres.engines import SYNC_ENGINE
+from infrastructure.db.postgres.engines import dispose_async_engine
+from infrastructure.db.postgres.engines import dispose_engine
+from infrastructure.db.postgres.engines import engine_registry
+from infrastructure.db.postgres.engines import get_engine
+from infrastructure.db.postgres.engines import init_engine
 from infrastructure.db.postgres.models import ProjectModel
 from infrastructure.db.postgres.models import TechnologyModel
 from infrastructure.db.postgres.models import TechnologyVersionModel
+from infrastructure.db.postgres.queries import QueryBudgetError
+from infrastructure.db.postgres.queries import QueryStats
+from infrastructure.db.postgres.queries import query_budget
+from infrastructure.db.postgres.queries import start_tracking
+from infrastructure.db.postgres.queries import stop_tracking
+from infrastructure.db.postgres.queries import track_queries
+from infrastructure.db.postgres.registry import TechnologyRegistry
+from infrastructure.db.postgres.registry import technology_registry
+from infrastructure.db.postgres.replicas import ReplicaSet
+from infrastructure.db.postgres.replicas import async_replicas
+from infrastructure.db.postgres.replicas import pin_reads_to_primary
+from infrastructure.db.postgres.replicas import reads_pinned_to_primary
+from infrastructure.db.postgres.replicas import sync_replicas
+from infrastructure.db.postgres.repositories import AsyncPostgresProjectRepository
+from infrastructure.db.postgres.repositories import AsyncPostgresTechnologyRepository
 from infrastructure.db.postgres.repositories import PostgresProjectRepository
+from infrastructure.db.postgres.repositories import PostgresTechnologyRepository
+from infrastructure.db.postgres.session import async_read_session_manager
+from infrastructure.db.postgres.session import async_session_manager
+from infrastructure.db.postgres.session import get_async_read_session
+from infrastructure.db.postgres.session import get_async_session
+from infrastructure.db.postgres.session import get_sync_read_session
 from infrastructure.db.postgres.session import get_sync_session
+from infrastructure.db.postgres.session import sync_read_session_manager
 from infrastructure.db.postgres.session import sync_session_manager
 
 __all__ = [
     'BaseModel',
-    'sync_engine',
+    'ASYNC_ENGINE',
+    'EngineRegistry',
+    'ManagedEngine',
+    'SYNC_ENGINE',
+    'dispose_async_engine',
+    'dispose_engine',
+    'engine_registry',
+    'get_engine',
+    'init_engine',
     'ProjectModel',
     'TechnologyModel',
     'TechnologyVersionModel',
+    'QueryBudgetError',
+    'QueryStats',
+    'query_budget',
+    'start_tracking',
+    'stop_tracking',
+    'track_queries',
+    'TechnologyRegistry',
+    'technology_registry',
+    'ReplicaSet',
+    'async_replicas',
+    'pin_reads_to_primary',
+    'reads_pinned_to_primary',
+    'sync_replicas',
+    'AsyncPostgresProjectRepository',
+    'AsyncPostgresTechnologyRepository',
     'PostgresProjectRepository',
+    'PostgresTechnologyRepository',
+    'async_read_session_manager',
+    'async_session_manager',
+    'get_async_read_session',
+    'get_async_session',
+    'get_sync_read_session',
     'get_sync_session',
+    'sync_read_session_manager',
     'sync_session_manager',
 ]
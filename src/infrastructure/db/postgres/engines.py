@@ -0,0 +1,168 @@
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import Engine
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.db.postgres.pool import PoolMetrics
+from infrastructure.db.postgres.queries import QueryTracker
+from settings import POSTGRES_DB
+from settings import POSTGRES_HOST
+from settings import POSTGRES_MAX_OVERFLOW
+from settings import POSTGRES_PASSWORD
+from settings import POSTGRES_POOL_PRE_PING
+from settings import POSTGRES_POOL_RECYCLE
+from settings import POSTGRES_POOL_SIZE
+from settings import POSTGRES_POOL_TIMEOUT
+from settings import POSTGRES_PORT
+from settings import POSTGRES_SLOW_CHECKOUT_MS
+from settings import POSTGRES_SLOW_QUERY_MS
+from settings import POSTGRES_STATEMENT_TIMEOUT_MS
+from settings import POSTGRES_USER
+
+logger = logging.getLogger(__name__)
+
+SYNC_ENGINE = 'sync'
+ASYNC_ENGINE = 'async'
+
+pool_options = {
+    'pool_size': POSTGRES_POOL_SIZE,
+    'max_overflow': POSTGRES_MAX_OVERFLOW,
+    'pool_timeout': POSTGRES_POOL_TIMEOUT,
+    'pool_recycle': POSTGRES_POOL_RECYCLE,
+    'pool_pre_ping': POSTGRES_POOL_PRE_PING,
+}
+
+
+def sync_connection_url(host: str = POSTGRES_HOST, port: str = POSTGRES_PORT) -> str:
+    return f'postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{host}:{port}/{POSTGRES_DB}'
+
+
+def async_connection_url(host: str = POSTGRES_HOST, port: str = POSTGRES_PORT) -> str:
+    return f'postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{host}:{port}/{POSTGRES_DB}'
+
+
+def create_sync_engine(url: str) -> Engine:
+    return create_engine(
+        url,
+        connect_args={'options': f'-c statement_timeout={POSTGRES_STATEMENT_TIMEOUT_MS}'},
+        **pool_options,
+    )
+
+
+def create_asyncpg_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        connect_args={'server_settings': {'statement_timeout': str(POSTGRES_STATEMENT_TIMEOUT_MS)}},
+        **pool_options,
+    )
+
+
+@dataclass(frozen=True)
+class ManagedEngine:
+    name: str
+    engine: Engine | AsyncEngine
+    pool_metrics: PoolMetrics
+    query_tracker: QueryTracker
+
+    @property
+    def sync_engine(self) -> Engine:
+        """The engine events and pools live on, the proxied one for an `AsyncEngine`."""
+        return self.engine.sync_engine if isinstance(self.engine, AsyncEngine) else self.engine
+
+
+class EngineRegistry:
+    """Named engines, each created (with its pool metrics and query tracker) the first time it is used.
+
+    Nothing connects, or even imports a database driver, until then, so importing the package stays cheap for the
+    CLI and migrations. Forked children start with empty pools, see `reset_after_fork`.
+    """
+
+    def __init__(self) -> None:
+        self._factories: dict[str, Callable[[], Engine | AsyncEngine]] = {}
+        self._engines: dict[str, ManagedEngine] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory: Callable[[], Engine | AsyncEngine]) -> None:
+        with self._lock:
+            if name in self._engines:
+                raise RuntimeError(f'Engine ({name}) is already initialized.')
+            self._factories[name] = factory
+
+    def get(self, name: str) -> ManagedEngine:
+        managed = self._engines.get(name)
+        if managed is not None:
+            return managed
+
+        with self._lock:
+            if name not in self._engines:
+                if name not in self._factories:
+                    raise KeyError(f'Engine ({name}) is not registered.')
+                engine = self._factories[name]()
+                sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+                self._engines[name] = ManagedEngine(
+                    name=name,
+                    engine=engine,
+                    pool_metrics=PoolMetrics(sync_engine, slow_checkout_ms=POSTGRES_SLOW_CHECKOUT_MS),
+                    query_tracker=QueryTracker(sync_engine, slow_query_ms=POSTGRES_SLOW_QUERY_MS),
+                )
+                logger.debug('Engine (%s) initialized.', name)
+            return self._engines[name]
+
+    def initialized(self) -> list[ManagedEngine]:
+        return list(self._engines.values())
+
+    def dispose(self, name: str | None = None, close: bool = True) -> None:
+        """Replace the pool of one engine (every initialized one when `name` is `None`) with an empty one.
+
+        `close=False` leaves checked-in connections open for whoever else holds them, e.g. the parent process after
+        a fork. Closing connections of an `AsyncEngine` needs the event loop: those are skipped when disposing every
+        engine, use `dispose_async_engine` for them.
+        """
+        if name is None:
+            targets = self.initialized()
+        else:
+            targets = [self._engines[name]] if name in self._engines else []
+
+        for managed in targets:
+            if isinstance(managed.engine, AsyncEngine) and close:
+                if name is None:
+                    continue
+                raise RuntimeError(f'Engine ({managed.name}) is async, dispose it with `dispose_async_engine`.')
+            managed.sync_engine.dispose(close=close)
+
+    def reset_after_fork(self) -> None:
+        # Connections inherited from the parent are the parent's; using them from two processes corrupts both.
+        for managed in self.initialized():
+            managed.sync_engine.dispose(close=False)
+
+
+engine_registry = EngineRegistry()
+engine_registry.register(SYNC_ENGINE, lambda: create_sync_engine(sync_connection_url()))
+engine_registry.register(ASYNC_ENGINE, lambda: create_asyncpg_engine(async_connection_url()))
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=engine_registry.reset_after_fork)
+
+
+def init_engine(name: str = SYNC_ENGINE) -> Engine | AsyncEngine:
+    """Create the engine now instead of on first use, e.g. to fail fast at startup on a bad configuration."""
+    return engine_registry.get(name).engine
+
+
+def get_engine(name: str = SYNC_ENGINE) -> ManagedEngine:
+    return engine_registry.get(name)
+
+
+def dispose_engine(name: str | None = None, close: bool = True) -> None:
+    engine_registry.dispose(name, close=close)
+
+
+async def dispose_async_engine(name: str = ASYNC_ENGINE) -> None:
+    if any(managed.name == name for managed in engine_registry.initialized()):
+        await engine_registry.get(name).engine.dispose()
@@ -0,0 +1,47 @@
+"""Add indexes for project filters
+
+Revision ID: 79a19a9e06e5
+Revises: 9f7fc5782f1f
+Create Date: 2026-10-18 13:00:12.318201
+
+"""
+from typing import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '79a19a9e06e5'
+down_revision: Union[str, Sequence[str], None] = '9f7fc5782f1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the tables stay writable while the indexes are created.
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_project_technology_association_technology_version_id'),
+                        'project_technology_association', ['technology_version_id'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_project_start_date'), 'project', ['start_date'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_project_end_date'), 'project', ['end_date'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_project_name_pattern', 'project', ['name'], unique=False,
+                        postgresql_ops={'name': 'varchar_pattern_ops'},
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_project_name_pattern', table_name='project',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_project_end_date'), table_name='project',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_project_start_date'), table_name='project',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_project_technology_association_technology_version_id'),
+                      table_name='project_technology_association',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,76 @@
+"""Add project full-text search vector and trigram index
+
+Revision ID: c71ee15536f9
+Revises: 79a19a9e06e5
+Create Date: 2026-10-18 13:30:41.905517
+
+"""
+from typing import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71ee15536f9'
+down_revision: Union[str, Sequence[str], None] = '79a19a9e06e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce({row}name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}description, '')), 'B')"
+)
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # A plain nullable column is a catalog-only change; a STORED generated one would rewrite the whole table under
+    # an ACCESS EXCLUSIVE lock. The trigger keeps new and updated rows current, the backfill below does the rest.
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.add_column('project', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(f"""
+        CREATE FUNCTION project_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER project_search_vector_update
+        BEFORE INSERT OR UPDATE OF name, description ON project
+        FOR EACH ROW EXECUTE FUNCTION project_search_vector_update()
+    """)
+
+    with op.get_context().autocommit_block():
+        # One short transaction per batch of ids, so rows are only locked for as long as their batch takes.
+        connection = op.get_bind()
+        max_id = connection.execute(sa.text('SELECT coalesce(max(id), 0) FROM project')).scalar_one()
+        backfill = sa.text(
+            f'UPDATE project SET search_vector = {SEARCH_VECTOR.format(row="")} '
+            'WHERE id > :start AND id <= :end AND search_vector IS NULL'
+        )
+        for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+            connection.execute(backfill, {'start': start, 'end': start + BACKFILL_BATCH_SIZE})
+
+        op.create_index('ix_project_search_vector', 'project', ['search_vector'], unique=False,
+                        postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_project_name_trgm', 'project', ['name'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_project_name_trgm', table_name='project', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_project_search_vector', table_name='project', postgresql_concurrently=True, if_exists=True)
+    op.execute('DROP TRIGGER IF EXISTS project_search_vector_update ON project')
+    op.execute('DROP FUNCTION IF EXISTS project_search_vector_update()')
+    op.drop_column('project', 'search_vector')
@@ -0,0 +1,32 @@
+"""Add project version and updated_at
+
+Revision ID: 4e2b8d1c7a90
+Revises: c71ee15536f9
+Create Date: 2026-10-18 14:00:41.572903
+
+"""
+from typing import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4e2b8d1c7a90'
+down_revision: Union[str, Sequence[str], None] = 'c71ee15536f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Non-volatile defaults, so existing rows are not rewritten.
+    op.add_column('project', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('project', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'),
+                                       nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('project', 'updated_at')
+    op.drop_column('project', 'version')
@@ -0,0 +1,104 @@
+"""Add technology statistics materialized views
+
+Revision ID: 59df9969e859
+Revises: 4e2b8d1c7a90
+Create Date: 2026-10-18 14:30:12.318204
+
+"""
+from typing import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '59df9969e859'
+down_revision: Union[str, Sequence[str], None] = '4e2b8d1c7a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Each view has a unique index, which `REFRESH MATERIALIZED VIEW CONCURRENTLY` requires.
+    op.execute("""
+        CREATE MATERIALIZED VIEW technology_version_stats AS
+        SELECT technology_version.id AS technology_version_id,
+               technology.id AS technology_id,
+               technology.name AS technology,
+               technology_version.version,
+               count(*) AS project_count
+        FROM project_technology_association
+        JOIN technology_version ON technology_version.id = project_technology_association.technology_version_id
+        JOIN technology ON technology.id = technology_version.technology_id
+        GROUP BY technology_version.id, technology.id
+    """)
+    op.execute('CREATE UNIQUE INDEX ux_technology_version_stats ON technology_version_stats (technology_version_id)')
+
+    # A project may use several versions of one technology, so the per-technology views count distinct projects.
+    op.execute("""
+        CREATE MATERIALIZED VIEW technology_stats AS
+        SELECT technology.id AS technology_id,
+               technology.name AS technology,
+               count(DISTINCT project_technology_association.project_id) AS project_count
+        FROM project_technology_association
+        JOIN technology_version ON technology_version.id = project_technology_association.technology_version_id
+        JOIN technology ON technology.id = technology_version.technology_id
+        GROUP BY technology.id
+    """)
+    op.execute('CREATE UNIQUE INDEX ux_technology_stats ON technology_stats (technology_id)')
+    op.execute('CREATE INDEX ix_technology_stats_project_count ON technology_stats (project_count DESC)')
+
+    # A project counts for every year from its start to its end (or the current year while it runs).
+    op.execute("""
+        CREATE MATERIALIZED VIEW technology_usage_stats AS
+        SELECT technology.id AS technology_id,
+               technology.name AS technology,
+               year::integer AS year,
+               count(DISTINCT project.id) AS project_count
+        FROM project
+        JOIN project_technology_association ON project_technology_association.project_id = project.id
+        JOIN technology_version ON technology_version.id = project_technology_association.technology_version_id
+        JOIN technology ON technology.id = technology_version.technology_id
+        CROSS JOIN LATERAL generate_series(
+            extract(year FROM project.start_date)::integer,
+            extract(year FROM coalesce(project.end_date, now()))::integer
+        ) AS year
+        WHERE project.start_date IS NOT NULL
+        GROUP BY technology.id, year
+    """)
+    op.execute('CREATE UNIQUE INDEX ux_technology_usage_stats ON technology_usage_stats (technology_id, year)')
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW technology_pair_stats AS
+        WITH project_technology AS (
+            SELECT DISTINCT project_technology_association.project_id, technology_version.technology_id
+            FROM project_technology_association
+            JOIN technology_version ON technology_version.id = project_technology_association.technology_version_id
+        )
+        SELECT a.technology_id AS first_technology_id,
+               technology_a.name AS first_technology,
+               b.technology_id AS second_technology_id,
+               technology_b.name AS second_technology,
+               count(*) AS project_count
+        FROM project_technology AS a
+        JOIN project_technology AS b ON b.project_id = a.project_id AND b.technology_id > a.technology_id
+        JOIN technology AS technology_a ON technology_a.id = a.technology_id
+        JOIN technology AS technology_b ON technology_b.id = b.technology_id
+        GROUP BY a.technology_id, technology_a.name, b.technology_id, technology_b.name
+    """)
+    op.execute('CREATE UNIQUE INDEX ux_technology_pair_stats '
+               'ON technology_pair_stats (first_technology_id, second_technology_id)')
+    op.execute('CREATE INDEX ix_technology_pair_stats_project_count ON technology_pair_stats (project_count DESC)')
+
+    # Refreshed last, in the same transaction as the others.
+    op.execute('CREATE MATERIALIZED VIEW technology_stats_refresh AS SELECT 1 AS id, now() AS refreshed_at')
+    op.execute('CREATE UNIQUE INDEX ux_technology_stats_refresh ON technology_stats_refresh (id)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS technology_stats_refresh')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS technology_pair_stats')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS technology_usage_stats')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS technology_stats')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS technology_version_stats')
@@ -0,0 +1,33 @@
+"""Add technology name prefix index
+
+Revision ID: b3c9e07d41a2
+Revises: 59df9969e859
+Create Date: 2026-10-18 15:00:12.318205
+
+"""
+from typing import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c9e07d41a2'
+down_revision: Union[str, Sequence[str], None] = '59df9969e859'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves `name LIKE 'prefix%'` (catalogue autocomplete) whatever the database collation.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_technology_name_pattern', 'technology', ['name'], unique=False,
+                        postgresql_ops={'name': 'varchar_pattern_ops'},
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_technology_name_pattern', table_name='technology',
+                      postgresql_concurrently=True, if_exists=True)
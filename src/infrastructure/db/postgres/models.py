@@ -1,14 +1,28 @@
 from datetime import datetime
 
+from sqlalchemy import BigInteger
+from sqlalchemy import Column
 from sqlalchemy import DateTime
+from sqlalchemy import FetchedValue
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
 from sqlalchemy import String
+from sqlalchemy import Table
 from sqlalchemy import UniqueConstraint
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
 
 from infrastructure.db.postgres.base import BaseModel
+from settings import POSTGRES_RAISE_ON_LAZY_LOAD
+
+PROJECT_SEARCH_CONFIG = 'english'  # must match the `project_search_vector_update` trigger
+# Every relationship is loaded eagerly by the repositories; `raise_on_sql` still allows identity map hits.
+RELATIONSHIP_LAZY = 'raise_on_sql' if POSTGRES_RAISE_ON_LAZY_LOAD else 'select'
 
 
 class TechnologyModel(BaseModel):
@@ -18,9 +32,12 @@ class TechnologyModel(BaseModel):
     name: Mapped[str] = mapped_column(String(128))
     description: Mapped[str | None] = mapped_column(String(255))
 
-    versions: Mapped[list["TechnologyVersionModel"]] = relationship(back_populates="technology")
+    versions: Mapped[list["TechnologyVersionModel"]] = relationship(back_populates="technology", lazy=RELATIONSHIP_LAZY)
 
-    __table_args__ = (UniqueConstraint('name'),)
+    __table_args__ = (
+        UniqueConstraint('name'),
+        Index('ix_technology_name_pattern', 'name', postgresql_ops={'name': 'varchar_pattern_ops'}),
+    )
 
 
 class TechnologyVersionModel(BaseModel):
@@ -28,7 +45,7 @@ class TechnologyVersionModel(BaseModel):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     technology_id: Mapped[int] = mapped_column(ForeignKey('technology.id'))
-    technology: Mapped[TechnologyModel] = relationship(back_populates='versions')
+    technology: Mapped[TechnologyModel] = relationship(back_populates='versions', lazy=RELATIONSHIP_LAZY)
     version: Mapped[str] = mapped_column(String(128))
 
     __table_args__ = (UniqueConstraint('technology_id', 'version'),)
@@ -37,7 +54,8 @@ class TechnologyVersionModel(BaseModel):
 class ProjectTechnologyAssociationModel(BaseModel):
     __tablename__ = 'project_technology_association'
     project_id: Mapped[int] = mapped_column(ForeignKey('project.id'), primary_key=True)
-    technology_version_id: Mapped[int] = mapped_column(ForeignKey('technology_version.id'), primary_key=True)
+    technology_version_id: Mapped[int] = mapped_column(ForeignKey('technology_version.id'), primary_key=True,
+                                                       index=True)
 
 
 class ProjectModel(BaseModel):
@@ -46,10 +64,86 @@ class ProjectModel(BaseModel):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(128))
     description: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    start_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    end_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    start_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    end_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
     technologies: Mapped[list[TechnologyVersionModel]] = relationship(
         secondary=ProjectTechnologyAssociationModel.__table__,
+        lazy=RELATIONSHIP_LAZY,
     )
+    # Written by the `project_search_vector_update` trigger from name and description (see migration c71ee15536f9).
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        nullable=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        deferred=True,
+    )
+    # Bumped by every write (see `__mapper_args__`), and checked in the UPDATE's WHERE clause.
+    version: Mapped[int] = mapped_column(Integer, server_default='1')
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __mapper_args__ = {'version_id_col': version}
+
+    __table_args__ = (
+        UniqueConstraint('name'),
+        Index('ix_project_name_pattern', 'name', postgresql_ops={'name': 'varchar_pattern_ops'}),
+        Index('ix_project_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_project_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
+
 
-    __table_args__ = (UniqueConstraint('name'),)
+# Materialized views created by the migrations and refreshed with `cli technologies refresh-stats`; kept out of
+# `BaseModel.metadata` so that autogenerate does not try to create them as tables.
+view_metadata = MetaData()
+
+technology_stats = Table(
+    'technology_stats',
+    view_metadata,
+    Column('technology_id', Integer, primary_key=True),
+    Column('technology', String(128)),
+    Column('project_count', BigInteger),
+)
+
+technology_version_stats = Table(
+    'technology_version_stats',
+    view_metadata,
+    Column('technology_version_id', Integer, primary_key=True),
+    Column('technology_id', Integer),
+    Column('technology', String(128)),
+    Column('version', String(128)),
+    Column('project_count', BigInteger),
+)
+
+technology_usage_stats = Table(
+    'technology_usage_stats',
+    view_metadata,
+    Column('technology_id', Integer, primary_key=True),
+    Column('technology', String(128)),
+    Column('year', Integer, primary_key=True),
+    Column('project_count', BigInteger),
+)
+
+technology_pair_stats = Table(
+    'technology_pair_stats',
+    view_metadata,
+    Column('first_technology_id', Integer, primary_key=True),
+    Column('first_technology', String(128)),
+    Column('second_technology_id', Integer, primary_key=True),
+    Column('second_technology', String(128)),
+    Column('project_count', BigInteger),
+)
+
+technology_stats_refresh = Table(
+    'technology_stats_refresh',
+    view_metadata,
+    Column('id', Integer, primary_key=True),
+    Column('refreshed_at', DateTime(timezone=True)),
+)
+
+TECHNOLOGY_STATS_VIEWS = (
+    technology_stats,
+    technology_version_stats,
+    technology_usage_stats,
+    technology_pair_stats,
+    technology_stats_refresh,  # last, so its time is when the others were refreshed
+)
@@ -0,0 +1,91 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import Engine
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """Live connection pool counters fed by SQLAlchemy pool events."""
+
+    def __init__(self, engine: Engine, slow_checkout_ms: float) -> None:
+        self.engine = engine
+        self.slow_checkout_ms = slow_checkout_ms
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.checkout_waits = 0
+        self.checkout_failures = 0
+        self.checkout_wait_total_ms = 0.0
+        self.checkout_wait_max_ms = 0.0
+        self._lock = threading.Lock()
+
+        event.listen(engine, 'connect', self._on_connect)
+        event.listen(engine, 'checkout', self._on_checkout)
+        event.listen(engine, 'checkin', self._on_checkin)
+        event.listen(engine, 'invalidate', self._on_invalidate)
+        event.listen(engine, 'soft_invalidate', self._on_invalidate)
+
+    @contextmanager
+    def measure_checkout(self):
+        # Failed checkouts (pool timeouts above all) count too, they are what the wait metrics are for.
+        started = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.observe_checkout_wait((time.perf_counter() - started) * 1000, failed=failed)
+
+    def observe_checkout_wait(self, wait_ms: float, failed: bool = False) -> None:
+        with self._lock:
+            self.checkout_waits += 1
+            self.checkout_failures += failed
+            self.checkout_wait_total_ms += wait_ms
+            self.checkout_wait_max_ms = max(self.checkout_wait_max_ms, wait_ms)
+
+        if failed:
+            logger.warning(
+                'Failed to get a database connection after %.1f ms (%s).', wait_ms, self.engine.pool.status(),
+            )
+        elif wait_ms >= self.slow_checkout_ms:
+            logger.warning('Waited %.1f ms for a database connection (%s).', wait_ms, self.engine.pool.status())
+
+    def snapshot(self) -> dict[str, int | float]:
+        pool = self.engine.pool
+        with self._lock:
+            return {
+                'size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': max(pool.overflow(), 0),
+                'connects': self.connects,
+                'checkouts': self.checkouts,
+                'checkins': self.checkins,
+                'invalidations': self.invalidations,
+                'checkout_failures': self.checkout_failures,
+                'checkout_wait_avg_ms': self.checkout_wait_total_ms / self.checkout_waits if self.checkout_waits else 0.0,
+                'checkout_wait_max_ms': self.checkout_wait_max_ms,
+            }
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+        logger.warning('Database connection invalidated: %s', exception)
@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Iterator
+
+from sqlalchemy import Engine
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_ms: float = 0.0
+    statements: list[str] = field(default_factory=list)
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar('query_stats', default=None)
+
+
+def start_tracking() -> QueryStats:
+    """Collect the statements executed from now on in this context (thread or task) into a fresh `QueryStats`."""
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def stop_tracking() -> None:
+    _current_stats.set(None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    token = _current_stats.set(QueryStats())
+    try:
+        yield _current_stats.get()
+    finally:
+        _current_stats.reset(token)
+
+
+class QueryBudgetError(Exception):
+
+    def __init__(self, label: str, budget: int, stats: QueryStats):
+        statements = ''.join(f'\n  {statement}' for statement in stats.statements)
+        super().__init__(f'{label} executed {stats.count} statements, budget is {budget}:{statements}')
+        self.label = label
+        self.budget = budget
+        self.stats = stats
+
+
+@contextmanager
+def query_budget(budget: int, label: str = 'block') -> Iterator[QueryStats]:
+    """Raise `QueryBudgetError` unless the block executes exactly `budget` statements.
+
+    Fewer statements fail too, so budgets are lowered together with the code that earns it.
+    """
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count != budget:
+        raise QueryBudgetError(label, budget, stats)
+
+
+class QueryTracker:
+    """Times every cursor execution on an engine and logs the slow ones.
+
+    Statements are attributed to whatever `QueryStats` is tracked in the executing context; SQLAlchemy's asyncio
+    greenlets share the context of the awaiting task, so this works for the async engine as well.
+    """
+
+    def __init__(self, engine: Engine, slow_query_ms: float) -> None:
+        self.engine = engine
+        self.slow_query_ms = slow_query_ms
+        self.slow_queries = 0
+        self._lock = threading.Lock()
+
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault('query_started_at', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed_ms = (time.perf_counter() - conn.info['query_started_at'].pop()) * 1000
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.statements.append(statement)
+
+        if elapsed_ms >= self.slow_query_ms:
+            with self._lock:
+                self.slow_queries += 1
+            logger.warning('Slow query (%.1f ms): %s', elapsed_ms, statement)
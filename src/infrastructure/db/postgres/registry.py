@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Callable
+from typing import Iterable
+from typing import NamedTuple
+
+from settings import TECHNOLOGY_REGISTRY_MAX_SIZE
+from settings import TECHNOLOGY_REGISTRY_TTL
+
+
+class TechnologyVersionRow(NamedTuple):
+    id: int
+    technology_id: int
+    version: str
+    name: str
+    description: str | None
+
+
+class TechnologyRegistry:
+    """Process-level copy of the `technology` and `technology_version` dictionaries.
+
+    Entries only come from rows returned by the database. Rows deleted out of band leave stale entries behind; the
+    repositories notice them as a foreign key violation and `clear` the registry, and the TTL bounds how long they
+    can linger otherwise.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.clears = 0
+        self._technologies: dict[str, tuple[int, str | None]] = {}
+        self._versions: dict[tuple[int, str], int] = {}
+        self._expires_at = clock() + ttl
+        self._lock = threading.Lock()
+
+    def get(self, name: str, version: str) -> TechnologyVersionRow | None:
+        with self._lock:
+            self._expire()
+            technology = self._technologies.get(name)
+            version_id = self._versions.get((technology[0], version)) if technology is not None else None
+            if version_id is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            technology_id, description = technology
+            return TechnologyVersionRow(
+                id=version_id, technology_id=technology_id, version=version, name=name, description=description,
+            )
+
+    def add(self, rows: Iterable[TechnologyVersionRow]) -> None:
+        with self._lock:
+            self._expire()
+            for row in rows:
+                if len(self._versions) >= self.max_size:
+                    self._clear()
+                self._technologies[row.name] = (row.technology_id, row.description)
+                self._versions[(row.technology_id, row.version)] = row.id
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'technologies': len(self._technologies),
+                'versions': len(self._versions),
+                'hits': self.hits,
+                'misses': self.misses,
+                'clears': self.clears,
+            }
+
+    def _expire(self) -> None:
+        if self._expires_at <= self.clock():
+            self._clear()
+
+    def _clear(self) -> None:
+        self._technologies.clear()
+        self._versions.clear()
+        self._expires_at = self.clock() + self.ttl
+        self.clears += 1
+
+
+technology_registry = (
+    TechnologyRegistry(max_size=TECHNOLOGY_REGISTRY_MAX_SIZE, ttl=TECHNOLOGY_REGISTRY_TTL)
+    if TECHNOLOGY_REGISTRY_TTL > 0
+    else None
+)
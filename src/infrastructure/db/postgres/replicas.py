@@ -0,0 +1,213 @@
+import functools
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.db.postgres.engines import async_connection_url
+from infrastructure.db.postgres.engines import create_asyncpg_engine
+from infrastructure.db.postgres.engines import create_sync_engine
+from infrastructure.db.postgres.engines import engine_registry
+from infrastructure.db.postgres.engines import get_engine
+from infrastructure.db.postgres.engines import sync_connection_url
+from settings import POSTGRES_PORT
+from settings import POSTGRES_REPLICA_CHECK_SECONDS
+from settings import POSTGRES_REPLICA_HOSTS
+from settings import POSTGRES_REPLICA_MAX_LAG_MS
+from settings import POSTGRES_REPLICA_RETRY_SECONDS
+from settings import POSTGRES_REPLICA_STRATEGY
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ('round_robin', 'least_connections')
+
+# 0 when everything received has been replayed, so an idle primary does not look like lag.
+REPLICATION_LAG_QUERY = text(
+    'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) * 1000, 0) END'
+)
+
+_reads_pinned_to_primary = ContextVar('reads_pinned_to_primary', default=False)
+
+
+def pin_reads_to_primary(pinned: bool = True) -> None:
+    """Send the read sessions of the current request (context) to the primary, e.g. right after the client wrote."""
+    _reads_pinned_to_primary.set(pinned)
+
+
+def reads_pinned_to_primary() -> bool:
+    return _reads_pinned_to_primary.get()
+
+
+@dataclass
+class ReplicaState:
+    name: str
+    down_until: float = 0.0
+    checked_at: float = 0.0
+    lag_ms: float | None = None
+
+
+class ReplicaSet:
+    """Replica engines and their health, ordered by `strategy` for each read.
+
+    There is no background checker: a replica that fails to connect, or lags more than `max_lag_ms`, is skipped for
+    `retry_seconds` and then tried again by the next read. The lag is measured on a connection a read has just
+    checked out, at most every `check_seconds` per replica.
+    """
+
+    def __init__(
+            self,
+            names: list[str],
+            strategy: str = 'round_robin',
+            retry_seconds: float = 10,
+            check_seconds: float = 5,
+            max_lag_ms: float = 0,
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise RuntimeError(f'Unknown replica strategy ({strategy}), expected one of: {", ".join(STRATEGIES)}.')
+        self.strategy = strategy
+        self.retry_seconds = retry_seconds
+        self.check_seconds = check_seconds
+        self.max_lag_ms = max_lag_ms
+        self._replicas = {name: ReplicaState(name) for name in names}
+        self._turns = itertools.count()
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._replicas)
+
+    def candidates(self) -> list[str]:
+        now = time.monotonic()
+        healthy = [state.name for state in self._replicas.values() if state.down_until <= now]
+        if not healthy:
+            return []
+
+        # Rotated for round robin, and so that idle replicas tie-break differently for least connections.
+        turn = next(self._turns) % len(healthy)
+        healthy = healthy[turn:] + healthy[:turn]
+        if self.strategy == 'least_connections':
+            healthy.sort(key=lambda name: get_engine(name).sync_engine.pool.checkedout())
+        return healthy
+
+    def mark_down(self, name: str, reason: str) -> None:
+        self._replicas[name].down_until = time.monotonic() + self.retry_seconds
+        logger.warning('Replica (%s) skipped for %g s: %s', name, self.retry_seconds, reason)
+
+    def claim_check(self, name: str) -> bool:
+        """Whether the caller should measure the lag of `name` now; only one caller per `check_seconds` does."""
+        if not self.max_lag_ms:
+            return False
+        state = self._replicas[name]
+        with self._lock:
+            now = time.monotonic()
+            if now - state.checked_at < self.check_seconds:
+                return False
+            state.checked_at = now
+            return True
+
+    def record_lag(self, name: str, lag_ms: float) -> bool:
+        self._replicas[name].lag_ms = lag_ms
+        if lag_ms > self.max_lag_ms:
+            self.mark_down(name, f'replication lag {lag_ms:.0f} ms over {self.max_lag_ms:g} ms')
+            return False
+        return True
+
+    def snapshot(self) -> dict[str, dict]:
+        now = time.monotonic()
+        return {
+            state.name: {'healthy': state.down_until <= now, 'lag_ms': state.lag_ms}
+            for state in self._replicas.values()
+        }
+
+
+def _reason(error: Exception) -> str:
+    return (str(error).strip().splitlines() or [error.__class__.__name__])[0]
+
+
+def _host_port(replica: str) -> tuple[str, str]:
+    host, _, port = replica.partition(':')
+    return host, port or POSTGRES_PORT
+
+
+def _register_replicas(prefix: str, create: Callable[[str, str], Engine | AsyncEngine]) -> ReplicaSet:
+    names = []
+    for index, (host, port) in enumerate(map(_host_port, POSTGRES_REPLICA_HOSTS)):
+        names.append(f'{prefix}_replica_{index}')
+        engine_registry.register(names[-1], functools.partial(create, host, port))
+    return ReplicaSet(
+        names,
+        strategy=POSTGRES_REPLICA_STRATEGY,
+        retry_seconds=POSTGRES_REPLICA_RETRY_SECONDS,
+        check_seconds=POSTGRES_REPLICA_CHECK_SECONDS,
+        max_lag_ms=POSTGRES_REPLICA_MAX_LAG_MS,
+    )
+
+
+sync_replicas = _register_replicas('sync', lambda host, port: create_sync_engine(sync_connection_url(host, port)))
+async_replicas = _register_replicas('async', lambda host, port: create_asyncpg_engine(async_connection_url(host, port)))
+
+
+def connect_replica(replicas: ReplicaSet) -> Connection | None:
+    """A connection to the first healthy replica that accepts one, `None` when reads should go to the primary."""
+    for name in replicas.candidates():
+        managed = get_engine(name)
+        try:
+            with managed.pool_metrics.measure_checkout():
+                connection = managed.engine.connect()
+        except PoolTimeoutError:
+            continue  # busy rather than unhealthy
+        except (DBAPIError, OSError) as e:
+            replicas.mark_down(name, _reason(e))
+            continue
+
+        if replicas.claim_check(name):
+            try:
+                lag_ms = float(connection.execute(REPLICATION_LAG_QUERY).scalar_one())
+                connection.rollback()
+            except (DBAPIError, OSError) as e:
+                connection.close()
+                replicas.mark_down(name, _reason(e))
+                continue
+            if not replicas.record_lag(name, lag_ms):
+                connection.close()
+                continue
+        return connection
+    return None
+
+
+async def connect_async_replica(replicas: ReplicaSet) -> AsyncConnection | None:
+    for name in replicas.candidates():
+        managed = get_engine(name)
+        try:
+            with managed.pool_metrics.measure_checkout():
+                connection = await managed.engine.connect().start()
+        except PoolTimeoutError:
+            continue
+        except (DBAPIError, OSError) as e:
+            replicas.mark_down(name, _reason(e))
+            continue
+
+        if replicas.claim_check(name):
+            try:
+                lag_ms = float((await connection.execute(REPLICATION_LAG_QUERY)).scalar_one())
+                await connection.rollback()
+            except (DBAPIError, OSError) as e:
+                await connection.close()
+                replicas.mark_down(name, _reason(e))
+                continue
+            if not replicas.record_lag(name, lag_ms):
+                await connection.close()
+                continue
+        return connection
+    return None
@@ -1,69 +1,818 @@
 import logging
+from collections import defaultdict
+from datetime import datetime
+from datetime import timezone
+from typing import AsyncIterator
 from typing import Iterable
+from typing import Iterator
 
+from sqlalchemy import BigInteger
+from sqlalchemy import DateTime
+from sqlalchemy import Delete
+from sqlalchemy import Integer
+from sqlalchemy import ColumnElement
+from sqlalchemy import Select
+from sqlalchemy import String
+from sqlalchemy import TextClause
+from sqlalchemy import Update
+from sqlalchemy import and_
+from sqlalchemy import any_
+from sqlalchemy import case
+from sqlalchemy import cast
+from sqlalchemy import column
 from sqlalchemy import delete
+from sqlalchemy import exists
+from sqlalchemy import func
+from sqlalchemy import inspect
+from sqlalchemy import literal
+from sqlalchemy import or_
 from sqlalchemy import select
+from sqlalchemy import text
 from sqlalchemy import tuple_
+from sqlalchemy import union
+from sqlalchemy import union_all
+from sqlalchemy import update
+from sqlalchemy import values
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.dialects.postgresql import Insert
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm import noload
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.orm.attributes import set_committed_value
 
+from core.dto import BulkCreateProjectResultDTO
+from core.dto import BulkCreateProjectsDTO
+from core.dto import BulkDeleteProjectsDTO
+from core.dto import BulkUpdateProjectsDTO
+from core.dto import BulkWriteResultDTO
 from core.dto import CreateProjectDTO
 from core.dto import DeleteProjectDTO
+from core.dto import ExportProjectsDTO
 from core.dto import GetProjectDTO
+from core.dto import GetProjectsByIdsDTO
 from core.dto import GetProjectsDTO
+from core.dto import GetTechnologiesDTO
+from core.dto import GetTechnologyStatsDTO
+from core.dto import GetTechnologyVersionsDTO
+from core.dto import ProjectRecord
+from core.dto import PROJECT_FIELDS
+from core.dto import PROJECT_ORDERING_FIELDS
 from core.dto import ProjectTechnologyVersionDTO
+from core.dto import ProjectVersionDTO
 from core.dto import RemoveProjectTechnologiesDTO
+from core.dto import ReplaceTechnologyVersionDTO
+from core.dto import SearchProjectsDTO
+from core.dto import TechnologyCountDTO
+from core.dto import TechnologyPairCountDTO
+from core.dto import TechnologyStatsDTO
+from core.dto import TechnologyVersionCountDTO
+from core.dto import TechnologyYearCountDTO
 from core.dto import UNSET
 from core.dto import UpdateProjectDTO
 from core.dto import UpdateProjectTechnologiesDTO
 from core.entities import Project
 from core.entities import Technology
 from core.entities import TechnologyVersion
+from core.exceptions import CoreException
+from core.exceptions import ProjectConcurrentUpdateError
+from core.exceptions import ProjectInvalidDateRangeError
 from core.exceptions import ProjectNameAlreadyExistsError
 from core.exceptions import ProjectNotFoundError
+from core.exceptions import ProjectVersionMismatchError
+from core.exceptions import StaleTechnologyReferenceError
+from core.exceptions import TechnologyNotFoundError
 from core.utils import asdict_extended
+from core.utils import decode_cursor
+from core.utils import project_expansions
+from infrastructure.cache.repositories import TechnologyCache
+from infrastructure.db.postgres.models import PROJECT_SEARCH_CONFIG
+from infrastructure.db.postgres.models import TECHNOLOGY_STATS_VIEWS
 from infrastructure.db.postgres.models import ProjectModel
+from infrastructure.db.postgres.models import ProjectTechnologyAssociationModel
 from infrastructure.db.postgres.models import TechnologyModel
 from infrastructure.db.postgres.models import TechnologyVersionModel
+from infrastructure.db.postgres.models import technology_pair_stats
+from infrastructure.db.postgres.models import technology_stats
+from infrastructure.db.postgres.models import technology_stats_refresh
+from infrastructure.db.postgres.models import technology_usage_stats
+from infrastructure.db.postgres.models import technology_version_stats
+from infrastructure.db.postgres.registry import TechnologyRegistry
+from infrastructure.db.postgres.registry import TechnologyVersionRow
+from infrastructure.db.transactions import async_savepoint
+from infrastructure.db.transactions import on_commit
+from infrastructure.db.transactions import savepoint
 
 logger = logging.getLogger(__name__)
 
-class PostgresProjectRepository:
 
-    def __init__(self, session: Session) -> None:
+NUMERIC_VERSION_PATTERN = r'^\d{1,18}(\.\d{1,18})*$'
+STALE_TECHNOLOGY_VERSION_CONSTRAINT = 'project_technology_association_technology_version_id_fkey'
+PROJECT_RECORD_COLUMNS = (
+    ProjectModel.id,
+    ProjectModel.name,
+    ProjectModel.description,
+    ProjectModel.start_date,
+    ProjectModel.end_date,
+    ProjectModel.version,
+    ProjectModel.updated_at,
+)
+
+
+def _unset_to_none(value):
+    return None if value == UNSET else value
+
+
+def _id_in(column, ids: list[int]) -> ColumnElement[bool]:
+    # `= ANY(array)` binds a single parameter, so the statement is the same whatever the number of ids.
+    return column == any_(literal(ids, ARRAY(Integer)))
+
+
+def _starts_with(column, prefix: str) -> ColumnElement[bool]:
+    # A plain `LIKE 'prefix%'`, which the `*_pattern_ops` indexes serve.
+    escaped_prefix = prefix.replace('/', '//').replace('%', '/%').replace('_', '/_')
+    return column.like(f'{escaped_prefix}%', escape='/')
+
+
+def _numeric_version(version) -> ColumnElement:
+    # '15.2' -> {15,2}; integer arrays compare element-wise, so '15.2' >= '15' and '9.6' < '15'.
+    return cast(func.string_to_array(version, '.'), ARRAY(BigInteger))
+
+
+class BasePostgresProjectRepository:
+
+    @staticmethod
+    def _get_many_query(dto: GetProjectsDTO) -> Select:
+        query = select(ProjectModel).options(*BasePostgresProjectRepository._load_options(dto.fields, dto.expand))
+        return BasePostgresProjectRepository._page_query(query, dto)
+
+    @staticmethod
+    def _get_many_records_query(dto: GetProjectsDTO) -> Select:
+        return BasePostgresProjectRepository._page_query(
+            select(*BasePostgresProjectRepository._record_columns(dto.fields)),
+            dto,
+        )
+
+    @staticmethod
+    def _load_options(fields: list[str] | None = None, expand: list[str] | None = None) -> list:
+        options = []
+        if fields is not None:
+            # Raising rather than lazy loading: `_to_entity` leaves unloaded columns out.
+            options.append(load_only(*(getattr(ProjectModel, field) for field in fields), raiseload=True))
+        if 'technologies' in project_expansions(fields, expand):
+            options.append(selectinload(ProjectModel.technologies).joinedload(TechnologyVersionModel.technology))
+        else:
+            options.append(noload(ProjectModel.technologies))
+
+        return options
+
+    @staticmethod
+    def _record_columns(fields: list[str] | None) -> tuple:
+        if fields is None:
+            return PROJECT_RECORD_COLUMNS
+        # `id` is always selected, technologies are matched to their project by it.
+        return tuple(getattr(ProjectModel, field) for field in PROJECT_FIELDS if field == 'id' or field in fields)
+
+    @staticmethod
+    def _page_query(query: Select, dto: GetProjectsDTO) -> Select:
+        ordering_columns = [getattr(ProjectModel, field) for field in PROJECT_ORDERING_FIELDS[dto.order_by]]
+        query = (
+            query
+            .where(*BasePostgresProjectRepository._get_many_filters(dto))
+            .order_by(*ordering_columns)
+            .limit(dto.limit)
+        )
+        if dto.cursor:
+            cursor_values = decode_cursor(order_by=dto.order_by, cursor=dto.cursor)
+            query = query.where(tuple_(*ordering_columns) > tuple_(*cursor_values))
+        else:
+            query = query.offset(dto.offset)
+
+        return query
+
+    @staticmethod
+    def _get_many_filters(dto: GetProjectsDTO) -> list[ColumnElement[bool]]:
+        filters = []
+        if dto.name_prefix:
+            filters.append(_starts_with(ProjectModel.name, dto.name_prefix))
+        if dto.start_date_from:
+            filters.append(ProjectModel.start_date >= dto.start_date_from)
+        if dto.start_date_to:
+            filters.append(ProjectModel.start_date <= dto.start_date_to)
+        if dto.end_date_from:
+            filters.append(ProjectModel.end_date >= dto.end_date_from)
+        if dto.end_date_to:
+            filters.append(ProjectModel.end_date <= dto.end_date_to)
+
+        technology_filters = []
+        if dto.technology:
+            technology_filters.append(TechnologyModel.name == dto.technology)
+        if dto.version:
+            technology_filters.append(TechnologyVersionModel.version == dto.version)
+        if dto.min_version:
+            technology_filters.append(
+                case(
+                    (TechnologyVersionModel.version.regexp_match(NUMERIC_VERSION_PATTERN),
+                     _numeric_version(TechnologyVersionModel.version)),
+                    else_=None,
+                ) >= _numeric_version(dto.min_version),
+            )
+        if technology_filters:
+            filters.append(
+                exists()
+                .where(
+                    ProjectTechnologyAssociationModel.project_id == ProjectModel.id,
+                    ProjectTechnologyAssociationModel.technology_version_id == TechnologyVersionModel.id,
+                    TechnologyVersionModel.technology_id == TechnologyModel.id,
+                    *technology_filters,
+                ),
+            )
+
+        return filters
+
+    @staticmethod
+    def _search_query(dto: SearchProjectsDTO) -> Select:
+        # Full-text matches on name/description plus trigram word similarity on the name to tolerate typos; both
+        # conditions are served by GIN indexes.
+        ts_query = func.websearch_to_tsquery(cast(PROJECT_SEARCH_CONFIG, REGCONFIG), dto.query)
+        rank = func.ts_rank_cd(ProjectModel.search_vector, ts_query) + func.word_similarity(dto.query, ProjectModel.name)
+        return (
+            select(ProjectModel)
+            .options(selectinload(ProjectModel.technologies).joinedload(TechnologyVersionModel.technology))
+            .where(
+                or_(
+                    ProjectModel.search_vector.bool_op('@@')(ts_query),
+                    literal(dto.query).bool_op('<%')(ProjectModel.name),
+                ),
+            )
+            .order_by(rank.desc(), ProjectModel.id)
+            .limit(dto.limit)
+            .offset(dto.offset)
+        )
+
+    @staticmethod
+    def _export_query(dto: ExportProjectsDTO) -> Select:
+        # `yield_per` switches to a server-side cursor and loads technologies once per batch.
+        return (
+            select(ProjectModel)
+            .options(selectinload(ProjectModel.technologies).joinedload(TechnologyVersionModel.technology))
+            .order_by(ProjectModel.id)
+            .execution_options(yield_per=dto.batch_size)
+        )
+
+    @staticmethod
+    def _get_by_id_query(project_id: int, options: list | None = None) -> Select:
+        if options is None:
+            options = [selectinload(ProjectModel.technologies).joinedload(TechnologyVersionModel.technology)]
+
+        return select(ProjectModel).options(*options).where(ProjectModel.id == project_id)
+
+    @staticmethod
+    def _get_version_query(project_id: int) -> Select:
+        return (
+            select(ProjectModel.id, ProjectModel.version, ProjectModel.updated_at)
+            .where(ProjectModel.id == project_id)
+        )
+
+    @staticmethod
+    def _get_many_versions_query(dto: GetProjectsDTO) -> Select:
+        return BasePostgresProjectRepository._page_query(
+            select(ProjectModel.id, ProjectModel.version, ProjectModel.updated_at),
+            dto,
+        )
+
+    @staticmethod
+    def _get_record_by_id_query(project_id: int, fields: list[str] | None = None) -> Select:
+        return select(*BasePostgresProjectRepository._record_columns(fields)).where(ProjectModel.id == project_id)
+
+    @staticmethod
+    def _get_records_by_ids_query(project_ids: list[int]) -> Select:
+        return select(*PROJECT_RECORD_COLUMNS).where(_id_in(ProjectModel.id, project_ids))
+
+    @staticmethod
+    def _in_requested_order(records: list[ProjectRecord], project_ids: list[int]) -> list[ProjectRecord]:
+        positions = {project_id: position for position, project_id in enumerate(project_ids)}
+        return sorted(records, key=lambda record: positions[record['id']])
+
+    @staticmethod
+    def _technology_records_query(project_ids: list[int]) -> Select:
+        return (
+            select(
+                ProjectTechnologyAssociationModel.project_id,
+                TechnologyVersionModel.id,
+                TechnologyVersionModel.version,
+                TechnologyModel.id,
+                TechnologyModel.name,
+                TechnologyModel.description,
+            )
+            .join_from(
+                ProjectTechnologyAssociationModel,
+                TechnologyVersionModel,
+                ProjectTechnologyAssociationModel.technology_version_id == TechnologyVersionModel.id,
+            )
+            .join(TechnologyModel, TechnologyVersionModel.technology_id == TechnologyModel.id)
+            .where(ProjectTechnologyAssociationModel.project_id.in_(project_ids))
+            .order_by(ProjectTechnologyAssociationModel.project_id, TechnologyModel.name)
+        )
+
+    @staticmethod
+    def _to_records(project_rows, technology_rows) -> list[ProjectRecord]:
+        # Rows are known to be valid, so they skip the entity validation and the response schemas.
+        technologies = defaultdict(list)
+        for project_id, version_id, version, technology_id, name, description in technology_rows:
+            technologies[project_id].append({
+                'id': version_id,
+                'version': version,
+                'technology': {'id': technology_id, 'name': name, 'description': description},
+            })
+
+        return [
+            {
+                'id': project_id,
+                'name': name,
+                'description': description,
+                'technologies': technologies.get(project_id, []),
+                'start_date': start_date,
+                'end_date': end_date,
+                'version': version,
+                'updated_at': updated_at,
+            }
+            for project_id, name, description, start_date, end_date, version, updated_at
+            in project_rows
+        ]
+
+    @staticmethod
+    def _records(fields: list[str] | None, project_rows, technology_rows: list | None) -> list[ProjectRecord]:
+        # `technology_rows` is `None` when technologies are not expanded.
+        if fields is None and technology_rows is not None:
+            return BasePostgresProjectRepository._to_records(project_rows, technology_rows)
+        return BasePostgresProjectRepository._to_partial_records(project_rows, technology_rows)
+
+    @staticmethod
+    def _to_partial_records(project_rows, technology_rows: list | None) -> list[ProjectRecord]:
+        # Rows of `_record_columns(fields)`, with a `technologies` key only when they were loaded.
+        records = [dict(zip(row._fields, row)) for row in project_rows]
+        if technology_rows is None:
+            return records
+
+        by_project = {record['id']: record for record in records}
+        for record in records:
+            record['technologies'] = []
+        for project_id, version_id, version, technology_id, name, description in technology_rows:
+            by_project[project_id]['technologies'].append({
+                'id': version_id,
+                'version': version,
+                'technology': {'id': technology_id, 'name': name, 'description': description},
+            })
+
+        return records
+
+    @staticmethod
+    def _touch(project: ProjectModel, expected_version: int | None = None) -> None:
+        if expected_version is not None and project.version != expected_version:
+            raise ProjectVersionMismatchError(project.id)
+
+        # A changed column makes the flush UPDATE the row even when only technologies changed, so `version` is
+        # bumped (and compared) on every write.
+        project.updated_at = datetime.now(timezone.utc)
+
+    @staticmethod
+    def _stale_project_error(project_id: int, expected_version: int | None = None) -> CoreException:
+        # Another writer bumped the version since the project was loaded. That fails a precondition (412) only when
+        # the client sent one; otherwise the request just lost the race.
+        if expected_version is None:
+            return ProjectConcurrentUpdateError(project_id)
+        return ProjectVersionMismatchError(project_id)
+
+    @staticmethod
+    def _merge_technologies(
+            project: ProjectModel,
+            technologies: list[ProjectTechnologyVersionDTO],
+    ) -> list[ProjectTechnologyVersionDTO]:
+        tech_version_map = {tech_version.technology.name: tech_version.version for tech_version in project.technologies}
+        tech_versions_new_map = {tech_version.name: tech_version.version for tech_version in technologies}
+        tech_version_map.update(tech_versions_new_map)
+
+        return [
+            ProjectTechnologyVersionDTO(name=name, version=version)
+            for name, version
+            in tech_version_map.items()
+        ]
+
+    @staticmethod
+    def _exclude_technologies(project: ProjectModel, names: list[str]) -> list[TechnologyVersionModel]:
+        return [
+            tech_version
+            for tech_version
+            in project.technologies
+            if tech_version.technology.name not in names
+        ]
+
+    @staticmethod
+    def _upsert_tech_versions_query(technologies: list[ProjectTechnologyVersionDTO]) -> Select:
+        # One statement instead of insert/select per table. Rows inserted by a data-modifying CTE are invisible to
+        # the rest of the statement, so each CTE unions its RETURNING rows with the rows that already existed.
+        requested = select(
+            values(column('name', String), column('version', String), name='requested_values')
+            .data(list(dict.fromkeys((tech.name, tech.version) for tech in technologies))),
+        ).cte('requested')
+        inserted_techs = (
+            insert(TechnologyModel)
+            .from_select(['name'], select(requested.c.name).distinct())
+            .on_conflict_do_nothing(index_elements=['name'])
+            .returning(TechnologyModel.id, TechnologyModel.name, TechnologyModel.description)
+            .cte('inserted_techs')
+        )
+        techs = union_all(
+            select(inserted_techs.c.id, inserted_techs.c.name, inserted_techs.c.description),
+            select(TechnologyModel.id, TechnologyModel.name, TechnologyModel.description)
+            .where(TechnologyModel.name.in_(select(requested.c.name))),
+        ).cte('techs')
+        inserted_versions = (
+            insert(TechnologyVersionModel)
+            .from_select(
+                ['technology_id', 'version'],
+                select(techs.c.id, requested.c.version).join_from(requested, techs, techs.c.name == requested.c.name),
+            )
+            .on_conflict_do_nothing(index_elements=['technology_id', 'version'])
+            .returning(TechnologyVersionModel.id, TechnologyVersionModel.technology_id, TechnologyVersionModel.version)
+            .cte('inserted_versions')
+        )
+        # A new technology always comes with a new version, so `inserted` tells whether the catalogue changed.
+        versions = union_all(
+            select(inserted_versions.c.id, inserted_versions.c.technology_id, inserted_versions.c.version,
+                   literal(True).label('inserted')),
+            select(TechnologyVersionModel.id, TechnologyVersionModel.technology_id, TechnologyVersionModel.version,
+                   literal(False).label('inserted'))
+            .join(techs, techs.c.id == TechnologyVersionModel.technology_id)
+            .join(
+                requested,
+                and_(requested.c.name == techs.c.name, requested.c.version == TechnologyVersionModel.version),
+            ),
+        ).cte('versions')
+        return (
+            select(versions.c.id, versions.c.technology_id, versions.c.version, techs.c.name, techs.c.description,
+                   versions.c.inserted)
+            .join_from(versions, techs, techs.c.id == versions.c.technology_id)
+        )
+
+    @staticmethod
+    def _tech_version_models(rows, merge) -> list[TechnologyVersionModel]:
+        # Rows come back from the upsert, so the models are attached as already-persistent instances without
+        # another SELECT; `merge` is the session's (sync) merge with `load=False`.
+        tech_versions = []
+        for row in rows:
+            technology = TechnologyModel(id=row.technology_id, name=row.name, description=row.description)
+            make_transient_to_detached(technology)
+            technology = merge(technology, load=False)
+
+            tech_version = TechnologyVersionModel(id=row.id, technology_id=row.technology_id, version=row.version)
+            make_transient_to_detached(tech_version)
+            tech_version = merge(tech_version, load=False)
+            set_committed_value(tech_version, 'technology', technology)
+            tech_versions.append(tech_version)
+
+        return tech_versions
+
+    @staticmethod
+    def _validate_bulk_items(projects: list[CreateProjectDTO]) -> list[BulkCreateProjectResultDTO | None]:
+        results = []
+        seen_names = set()
+        for index, dto in enumerate(projects):
+            try:
+                Project(
+                    name=dto.name,
+                    technologies=[
+                        TechnologyVersion(technology=Technology(name=tech.name), version=tech.version)
+                        for tech
+                        in _unset_to_none(dto.technologies) or []
+                    ],
+                    start_date=_unset_to_none(dto.start_date),
+                    end_date=_unset_to_none(dto.end_date),
+                )
+            except CoreException as e:
+                results.append(BulkCreateProjectResultDTO(index=index, name=dto.name, status='error', error=str(e)))
+                continue
+
+            if dto.name in seen_names:
+                results.append(BulkCreateProjectResultDTO(index=index, name=dto.name, status='duplicate'))
+                continue
+
+            seen_names.add(dto.name)
+            results.append(None)
+
+        return results
+
+    @staticmethod
+    def _collect_technologies(projects: list[CreateProjectDTO]) -> list[ProjectTechnologyVersionDTO]:
+        technologies = {
+            (tech.name, tech.version): tech
+            for dto in projects
+            for tech in _unset_to_none(dto.technologies) or []
+        }
+        return list(technologies.values())
+
+    @staticmethod
+    def _insert_projects_query(projects: list[CreateProjectDTO]) -> Insert:
+        return (
+            insert(ProjectModel)
+            .values([
+                {
+                    'name': dto.name,
+                    'description': _unset_to_none(dto.description),
+                    'start_date': _unset_to_none(dto.start_date),
+                    'end_date': _unset_to_none(dto.end_date),
+                }
+                for dto
+                in projects
+            ])
+            .on_conflict_do_nothing(index_elements=['name'])
+            .returning(ProjectModel.id, ProjectModel.name)
+        )
+
+    @staticmethod
+    def _insert_associations_query(
+            projects: list[CreateProjectDTO],
+            project_ids: dict[str, int],
+            tech_versions: list[TechnologyVersionModel],
+    ) -> Insert | None:
+        tech_version_ids = {(tech_version.technology.name, tech_version.version): tech_version.id
+                            for tech_version in tech_versions}
+        rows = [
+            {'project_id': project_ids[dto.name], 'technology_version_id': tech_version_ids[(tech.name, tech.version)]}
+            for dto in projects
+            if dto.name in project_ids
+            for tech in _unset_to_none(dto.technologies) or []
+        ]
+        if not rows:
+            return None
+
+        return insert(ProjectTechnologyAssociationModel).values(rows)
+
+    @staticmethod
+    def _bulk_results(
+            projects: list[CreateProjectDTO],
+            results: list[BulkCreateProjectResultDTO | None],
+            project_ids: dict[str, int],
+    ) -> list[BulkCreateProjectResultDTO]:
+        bulk_results = []
+        for index, (dto, result) in enumerate(zip(projects, results)):
+            if result is None and dto.name in project_ids:
+                result = BulkCreateProjectResultDTO(
+                    index=index, name=dto.name, status='created', project_id=project_ids[dto.name],
+                )
+            elif result is None:
+                result = BulkCreateProjectResultDTO(index=index, name=dto.name, status='duplicate')
+            bulk_results.append(result)
+
+        return bulk_results
+
+    def _resolve_tech_versions(
+            self,
+            technologies: list[ProjectTechnologyVersionDTO],
+    ) -> tuple[list[TechnologyVersionRow], list[ProjectTechnologyVersionDTO]]:
+        technologies = list({(tech.name, tech.version): tech for tech in technologies}.values())
+        if self.registry is None:
+            return [], technologies
+
+        found, missing = [], []
+        for tech in technologies:
+            row = self.registry.get(tech.name, tech.version)
+            if row is None:
+                missing.append(tech)
+            else:
+                found.append(row)
+
+        return found, missing
+
+    def _remember_tech_versions(self, session: Session, rows, inserted: bool) -> None:
+        # The rows may have just been inserted, so they only become shareable once the transaction commits (see
+        # `on_commit`, the session's own `after_commit` fires before the COMMIT).
+        if self.technology_cache is not None and inserted:
+            on_commit(session, self.technology_cache.invalidate_committed)
+        if self.registry is None or not rows:
+            return
+
+        rows = [TechnologyVersionRow(row.id, row.technology_id, row.version, row.name, row.description) for row in rows]
+        on_commit(session, lambda: self.registry.add(rows))
+
+    def _forget_stale_technologies(self, e: DBAPIError) -> bool:
+        # A version id taken from the registry no longer exists, so drop everything the registry knows.
+        if STALE_TECHNOLOGY_VERSION_CONSTRAINT not in str(e.orig):
+            return False
+
+        if self.registry is not None:
+            self.registry.clear()
+        return True
+
+    @staticmethod
+    def _bulk_update_values(dto: BulkUpdateProjectsDTO) -> dict:
+        values = asdict_extended(dto, exclude_fields=['project_ids'])
+        start_date, end_date = values.get('start_date'), values.get('end_date')
+        if start_date and end_date and end_date < start_date:
+            raise ProjectInvalidDateRangeError(start_date, end_date)
+        return values
+
+    @staticmethod
+    def _invalid_date_range_query(dto: BulkUpdateProjectsDTO, values: dict) -> Select | None:
+        # With only one of the dates given, the other one comes from each project's row.
+        if ('start_date' in values) == ('end_date' in values):
+            return None
+
+        start_date = literal(values['start_date'], DateTime) if 'start_date' in values else ProjectModel.start_date
+        end_date = literal(values['end_date'], DateTime) if 'end_date' in values else ProjectModel.end_date
+        return (
+            select(start_date, end_date)
+            .where(_id_in(ProjectModel.id, dto.project_ids), end_date < start_date)
+            .limit(1)
+        )
+
+    @staticmethod
+    def _bulk_update_query(dto: BulkUpdateProjectsDTO, values: dict) -> Update:
+        return (
+            update(ProjectModel)
+            .where(_id_in(ProjectModel.id, dto.project_ids))
+            .values(**values, version=ProjectModel.version + 1, updated_at=func.now())
+            .returning(ProjectModel.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _bulk_delete_query(dto: BulkDeleteProjectsDTO) -> Delete | None:
+        conditions = BasePostgresProjectRepository._get_many_filters(dto.filters) if dto.filters else []
+        if dto.project_ids is not None:
+            conditions.append(_id_in(ProjectModel.id, dto.project_ids))
+        if not conditions:
+            return None  # never "delete everything"
+
+        return BasePostgresProjectRepository._delete_projects_query(conditions)
+
+    @staticmethod
+    def _delete_projects_query(conditions: list[ColumnElement[bool]]) -> Delete:
+        # There is no ON DELETE CASCADE; the foreign keys are checked at the end of the statement, by when the
+        # associations CTE has run.
+        targets = select(ProjectModel.id).where(*conditions).cte('targets')
+        associations = (
+            delete(ProjectTechnologyAssociationModel)
+            .where(ProjectTechnologyAssociationModel.project_id.in_(select(targets.c.id)))
+            .cte('deleted_associations')
+        )
+        return (
+            delete(ProjectModel)
+            .where(ProjectModel.id.in_(select(targets.c.id)))
+            .returning(ProjectModel.id)
+            .add_cte(associations)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _replace_technology_version_query(dto: ReplaceTechnologyVersionDTO, to_version_id: int) -> Update:
+        # All CTEs see the associations as they were before the statement: projects that already have the target
+        # version lose the old row, the others have it repointed, and both get their version bumped.
+        association = ProjectTechnologyAssociationModel
+        from_version_id = (
+            select(TechnologyVersionModel.id)
+            .join(TechnologyModel, TechnologyModel.id == TechnologyVersionModel.technology_id)
+            .where(TechnologyModel.name == dto.technology, TechnologyVersionModel.version == dto.from_version)
+            .scalar_subquery()
+        )
+        on_target = aliased(ProjectTechnologyAssociationModel)
+        has_target = select(on_target.project_id).where(on_target.technology_version_id == to_version_id)
+        moved = (
+            update(association)
+            .where(association.technology_version_id == from_version_id, association.project_id.not_in(has_target))
+            .values(technology_version_id=to_version_id)
+            .returning(association.project_id)
+            .cte('moved')
+        )
+        dropped = (
+            delete(association)
+            .where(association.technology_version_id == from_version_id, association.project_id.in_(has_target))
+            .returning(association.project_id)
+            .cte('dropped')
+        )
+        return (
+            update(ProjectModel)
+            .where(ProjectModel.id.in_(union(select(moved.c.project_id), select(dropped.c.project_id))))
+            .values(version=ProjectModel.version + 1, updated_at=func.now())
+            .returning(ProjectModel.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _to_entity(project: ProjectModel) -> Project:
+        # Columns left out by `load_only` stay `None`.
+        unloaded = inspect(project).unloaded
+        return Project(
+            **{field: None if field in unloaded else getattr(project, field) for field in PROJECT_FIELDS},
+            technologies=[
+                TechnologyVersion(
+                    id=t.id,
+                    technology=Technology(
+                        id=t.technology.id,
+                        name=t.technology.name,
+                        description=t.technology.description,
+                    ),
+                    version=t.version,
+                )
+                for t
+                in project.technologies
+            ],
+        )
+
+
+class PostgresProjectRepository(BasePostgresProjectRepository):
+
+    def __init__(
+            self,
+            session: Session,
+            registry: TechnologyRegistry | None = None,
+            technology_cache: TechnologyCache | None = None,
+    ) -> None:
         self.session = session
+        self.registry = registry
+        self.technology_cache = technology_cache
 
     def get_many(self, dto: GetProjectsDTO) -> Iterable[Project]:
-        projects = self.session.execute(
-            select(ProjectModel)
-            .options(
-                selectinload(ProjectModel.technologies).joinedload(TechnologyVersionModel.technology),
-            ).offset(dto.offset).limit(dto.limit),
-        ).scalars().all()
+        projects = self.session.execute(self._get_many_query(dto)).scalars().all()
 
         return list(map(self._to_entity, projects))
 
     def get_by_id(self, dto: GetProjectDTO) -> Project:
-        project = self._get_by_id(project_id=dto.project_id)
+        project = self._get_by_id(project_id=dto.project_id, options=self._load_options(dto.fields, dto.expand))
 
         return self._to_entity(project)
 
+    def get_many_records(self, dto: GetProjectsDTO) -> list[ProjectRecord]:
+        projects = self.session.execute(self._get_many_records_query(dto)).all()
+        technologies = None
+        if 'technologies' in project_expansions(dto.fields, dto.expand):
+            technologies = self._get_technology_rows(project_ids=[project.id for project in projects])
+
+        return self._records(dto.fields, projects, technologies)
+
+    def get_record_by_id(self, dto: GetProjectDTO) -> ProjectRecord:
+        project = self.session.execute(self._get_record_by_id_query(dto.project_id, dto.fields)).first()
+        if project is None:
+            raise ProjectNotFoundError(dto.project_id)
+        technologies = None
+        if 'technologies' in project_expansions(dto.fields, dto.expand):
+            technologies = self._get_technology_rows(project_ids=[project.id])
+
+        return self._records(dto.fields, [project], technologies)[0]
+
+    def get_many_by_ids(self, dto: GetProjectsByIdsDTO) -> list[ProjectRecord]:
+        project_ids = list(dict.fromkeys(dto.project_ids))
+        projects = self.session.execute(self._get_records_by_ids_query(project_ids)).all()
+        technologies = self._get_technology_rows(project_ids=[project.id for project in projects])
+
+        return self._in_requested_order(self._to_records(projects, technologies), project_ids)
+
+    def get_version(self, dto: GetProjectDTO) -> ProjectVersionDTO:
+        row = self.session.execute(self._get_version_query(dto.project_id)).first()
+        if row is None:
+            raise ProjectNotFoundError(dto.project_id)
+
+        return ProjectVersionDTO(*row)
+
+    def get_many_versions(self, dto: GetProjectsDTO) -> list[ProjectVersionDTO]:
+        return [ProjectVersionDTO(*row) for row in self.session.execute(self._get_many_versions_query(dto))]
+
+    def search(self, dto: SearchProjectsDTO) -> Iterable[Project]:
+        projects = self.session.execute(self._search_query(dto)).scalars().all()
+
+        return list(map(self._to_entity, projects))
+
+    def export(self, dto: ExportProjectsDTO) -> Iterator[Project]:
+        for project in self.session.execute(self._export_query(dto)).scalars():
+            yield self._to_entity(project)
+
     def create(self, dto: CreateProjectDTO) -> Project:
         try:
             project = ProjectModel(**asdict_extended(dto, exclude_fields=['technologies']))
-            self.session.add(project)
+            project.updated_at = datetime.now(timezone.utc)
 
+            # Resolved before the project joins the session: the upsert autoflushes, and assigning the collection
+            # of an already inserted project would lazy-load it first.
             if dto.technologies and dto.technologies != UNSET:
                 technologies = self._get_or_create_tech_versions(technologies=dto.technologies)
                 project.technologies = technologies
 
+            self.session.add(project)
             self.session.flush()
         except IntegrityError as e:
             if 'project_name_key' in str(e.orig):
                 raise ProjectNameAlreadyExistsError(dto.name) from e
+            if self._forget_stale_technologies(e):
+                raise StaleTechnologyReferenceError() from e
             raise
 
         return self._to_entity(project)
@@ -71,7 +820,10 @@ class PostgresProjectRepository:
     def update(self, dto: UpdateProjectDTO) -> Project:
         try:
             project = self._get_by_id(project_id=dto.project_id)
-            for key, value in asdict_extended(dto, exclude_fields=['project_id', 'technologies']).items():
+            self._touch(project, expected_version=dto.expected_version)
+            for key, value in asdict_extended(
+                    dto, exclude_fields=['project_id', 'technologies', 'expected_version'],
+            ).items():
                 setattr(project, key, value)
             if not dto.technologies and dto.technologies is not None:
                 project.technologies = []
@@ -83,7 +835,11 @@ class PostgresProjectRepository:
         except IntegrityError as e:
             if 'project_name_key' in str(e.orig):
                 raise ProjectNameAlreadyExistsError(dto.name) from e
+            if self._forget_stale_technologies(e):
+                raise StaleTechnologyReferenceError() from e
             raise
+        except StaleDataError as e:
+            raise self._stale_project_error(dto.project_id, dto.expected_version) from e
 
         return self._to_entity(project)
 
@@ -92,20 +848,18 @@ class PostgresProjectRepository:
         if not dto.technologies:
             return self._to_entity(project)
 
-        tech_version_map = {tech_version.technology.name: tech_version.version for tech_version in project.technologies}
-        tech_versions_new_map = {tech_version.name: tech_version.version for tech_version in dto.technologies}
-        tech_version_map.update(tech_versions_new_map)
-
-        technologies = self._get_or_create_tech_versions(
-            [
-                ProjectTechnologyVersionDTO(name=name, version=version)
-                for name, version
-                in tech_version_map.items()
-            ],
-        )
+        technologies = self._get_or_create_tech_versions(self._merge_technologies(project, dto.technologies))
         project.technologies = technologies
+        self._touch(project)
 
-        self.session.flush()
+        try:
+            self.session.flush()
+        except IntegrityError as e:
+            if self._forget_stale_technologies(e):
+                raise StaleTechnologyReferenceError() from e
+            raise
+        except StaleDataError as e:
+            raise self._stale_project_error(dto.project_id) from e
 
         return self._to_entity(project)
 
@@ -114,92 +868,600 @@ class PostgresProjectRepository:
         if not dto.technologies:
             return self._to_entity(project)
 
-        tech_versions_remove_list = [tech_version for tech_version in dto.technologies]
-        tech_versions_list = [
-            tech_version
-            for tech_version
-            in project.technologies
-            if tech_version.technology.name not in tech_versions_remove_list
-        ]
-        project.technologies = tech_versions_list
-        self.session.flush()
+        project.technologies = self._exclude_technologies(project, dto.technologies)
+        self._touch(project)
+
+        try:
+            self.session.flush()
+        except StaleDataError as e:
+            raise self._stale_project_error(dto.project_id) from e
 
         return self._to_entity(project)
 
     def delete(self, dto: DeleteProjectDTO) -> bool:
-        result = self.session.execute(delete(ProjectModel).where(ProjectModel.id == dto.project_id))
-        if result.rowcount:
-            return True
-        return False
+        query = self._delete_projects_query([ProjectModel.id == dto.project_id])
+        return self.session.execute(query).first() is not None
 
-    def _get_by_id(self, project_id: int) -> ProjectModel:
-        project = self.session.execute(
-            select(ProjectModel)
-            .options(selectinload(ProjectModel.technologies).joinedload(TechnologyVersionModel.technology))
-            .where(ProjectModel.id == project_id),
-        ).scalars().first()
+    def bulk_create(self, dto: BulkCreateProjectsDTO) -> list[BulkCreateProjectResultDTO]:
+        results = self._validate_bulk_items(dto.projects)
+        pending = [project for project, result in zip(dto.projects, results) if result is None]
+        if not pending:
+            return self._bulk_results(dto.projects, results, project_ids={})
+
+        try:
+            with savepoint(self.session):
+                project_ids = self._bulk_insert(pending)
+        except DBAPIError as e:
+            # With stale registry entries the one-by-one retry below resolves technologies from the database again.
+            self._forget_stale_technologies(e)
+            logger.warning('Bulk insert of %s projects failed, retrying one by one.', len(pending), exc_info=True)
+            project_ids = {}
+            for index, project in enumerate(dto.projects):
+                if results[index] is not None:
+                    continue
+                try:
+                    with savepoint(self.session):
+                        project_ids[project.name] = self.create(project).id
+                except ProjectNameAlreadyExistsError:
+                    continue
+                except (CoreException, DBAPIError) as e:
+                    results[index] = BulkCreateProjectResultDTO(
+                        index=index, name=project.name, status='error', error=str(e),
+                    )
+
+        return self._bulk_results(dto.projects, results, project_ids)
+
+    def bulk_update(self, dto: BulkUpdateProjectsDTO) -> BulkWriteResultDTO:
+        values = self._bulk_update_values(dto)
+        if not values or not dto.project_ids:
+            return BulkWriteResultDTO(project_ids=[])
+
+        check_query = self._invalid_date_range_query(dto, values)
+        if check_query is not None:
+            invalid = self.session.execute(check_query).first()
+            if invalid is not None:
+                raise ProjectInvalidDateRangeError(*invalid)
+
+        project_ids = self.session.execute(self._bulk_update_query(dto, values)).scalars().all()
+        return BulkWriteResultDTO(project_ids=list(project_ids))
+
+    def bulk_delete(self, dto: BulkDeleteProjectsDTO) -> BulkWriteResultDTO:
+        query = self._bulk_delete_query(dto)
+        if query is None:
+            return BulkWriteResultDTO(project_ids=[])
+
+        return BulkWriteResultDTO(project_ids=list(self.session.execute(query).scalars().all()))
+
+    def replace_technology_version(self, dto: ReplaceTechnologyVersionDTO) -> BulkWriteResultDTO:
+        if dto.from_version == dto.to_version:
+            return BulkWriteResultDTO(project_ids=[])
+
+        to_version = self._get_or_create_tech_versions(
+            [ProjectTechnologyVersionDTO(name=dto.technology, version=dto.to_version)],
+        )[0]
+        try:
+            project_ids = self.session.execute(
+                self._replace_technology_version_query(dto, to_version.id),
+            ).scalars().all()
+        except IntegrityError as e:
+            if self._forget_stale_technologies(e):
+                raise StaleTechnologyReferenceError() from e
+            raise
+
+        return BulkWriteResultDTO(project_ids=list(project_ids))
+
+    def _get_by_id(self, project_id: int, options: list | None = None) -> ProjectModel:
+        project = self.session.execute(self._get_by_id_query(project_id, options)).scalars().first()
 
         if project is None:
             raise ProjectNotFoundError(project_id)
 
         return project
 
-    @staticmethod
-    def _to_entity(project: ProjectModel) -> Project:
-        return Project(
-            id=project.id,
-            name=project.name,
-            description=project.description,
-            technologies=[
-                TechnologyVersion(
-                    id=t.id,
-                    technology=Technology(
-                        id=t.technology.id,
-                        name=t.technology.name,
-                        description=t.technology.description,
-                    ),
-                    version=t.version,
-                )
-                for t
-                in project.technologies
-            ],
-            start_date=project.start_date,
-            end_date=project.end_date,
-        )
+    def _get_technology_rows(self, project_ids: list[int]) -> list:
+        if not project_ids:
+            return []
+
+        return self.session.execute(self._technology_records_query(project_ids)).all()
+
+    def _bulk_insert(self, projects: list[CreateProjectDTO]) -> dict[str, int]:
+        technologies = self._collect_technologies(projects)
+        tech_versions = self._get_or_create_tech_versions(technologies) if technologies else []
+
+        result = self.session.execute(self._insert_projects_query(projects))
+        project_ids = {name: project_id for project_id, name in result}
+
+        associations_query = self._insert_associations_query(projects, project_ids, tech_versions)
+        if associations_query is not None:
+            self.session.execute(associations_query)
+
+        return project_ids
 
     def _get_or_create_tech_versions(self, technologies: list[ProjectTechnologyVersionDTO]) -> list[
         TechnologyVersionModel]:
-        self.session.execute(
-            insert(TechnologyModel)
-            .values([{'name': tech.name} for tech in technologies])
-            .on_conflict_do_nothing(index_elements=['name']),
+        found, missing = self._resolve_tech_versions(technologies)
+        if not missing:
+            return self._tech_version_models(found, self.session.merge)
+
+        query = self._upsert_tech_versions_query(missing)
+        rows = self.session.execute(query).all()
+        inserted = any(row.inserted for row in rows)
+        if len(rows) < len(missing):
+            # A concurrent transaction committed some of the rows after this statement took its snapshot, so
+            # they were neither inserted nor visible; running the statement again picks them up. The rows inserted
+            # by the first run come back as existing ones.
+            rows = self.session.execute(query).all()
+            inserted = inserted or any(row.inserted for row in rows)
+        self._remember_tech_versions(self.session, rows, inserted)
+
+        return self._tech_version_models([*found, *rows], self.session.merge)
+
+
+class AsyncPostgresProjectRepository(BasePostgresProjectRepository):
+
+    def __init__(
+            self,
+            session: AsyncSession,
+            registry: TechnologyRegistry | None = None,
+            technology_cache: TechnologyCache | None = None,
+    ) -> None:
+        self.session = session
+        self.registry = registry
+        self.technology_cache = technology_cache
+
+    async def get_many(self, dto: GetProjectsDTO) -> Iterable[Project]:
+        projects = (await self.session.execute(self._get_many_query(dto))).scalars().all()
+
+        return list(map(self._to_entity, projects))
+
+    async def get_by_id(self, dto: GetProjectDTO) -> Project:
+        project = await self._get_by_id(project_id=dto.project_id, options=self._load_options(dto.fields, dto.expand))
+
+        return self._to_entity(project)
+
+    async def get_many_records(self, dto: GetProjectsDTO) -> list[ProjectRecord]:
+        projects = (await self.session.execute(self._get_many_records_query(dto))).all()
+        technologies = None
+        if 'technologies' in project_expansions(dto.fields, dto.expand):
+            technologies = await self._get_technology_rows(project_ids=[project.id for project in projects])
+
+        return self._records(dto.fields, projects, technologies)
+
+    async def get_record_by_id(self, dto: GetProjectDTO) -> ProjectRecord:
+        project = (await self.session.execute(self._get_record_by_id_query(dto.project_id, dto.fields))).first()
+        if project is None:
+            raise ProjectNotFoundError(dto.project_id)
+        technologies = None
+        if 'technologies' in project_expansions(dto.fields, dto.expand):
+            technologies = await self._get_technology_rows(project_ids=[project.id])
+
+        return self._records(dto.fields, [project], technologies)[0]
+
+    async def get_many_by_ids(self, dto: GetProjectsByIdsDTO) -> list[ProjectRecord]:
+        project_ids = list(dict.fromkeys(dto.project_ids))
+        projects = (await self.session.execute(self._get_records_by_ids_query(project_ids))).all()
+        technologies = await self._get_technology_rows(project_ids=[project.id for project in projects])
+
+        return self._in_requested_order(self._to_records(projects, technologies), project_ids)
+
+    async def get_version(self, dto: GetProjectDTO) -> ProjectVersionDTO:
+        row = (await self.session.execute(self._get_version_query(dto.project_id))).first()
+        if row is None:
+            raise ProjectNotFoundError(dto.project_id)
+
+        return ProjectVersionDTO(*row)
+
+    async def get_many_versions(self, dto: GetProjectsDTO) -> list[ProjectVersionDTO]:
+        return [ProjectVersionDTO(*row) for row in await self.session.execute(self._get_many_versions_query(dto))]
+
+    async def search(self, dto: SearchProjectsDTO) -> Iterable[Project]:
+        projects = (await self.session.execute(self._search_query(dto))).scalars().all()
+
+        return list(map(self._to_entity, projects))
+
+    async def export(self, dto: ExportProjectsDTO) -> AsyncIterator[Project]:
+        async for project in (await self.session.stream(self._export_query(dto))).scalars():
+            yield self._to_entity(project)
+
+    async def create(self, dto: CreateProjectDTO) -> Project:
+        try:
+            project = ProjectModel(**asdict_extended(dto, exclude_fields=['technologies']))
+            project.updated_at = datetime.now(timezone.utc)
+            self.session.add(project)
+
+            # Assign the collection even when empty so it is never lazy-loaded outside the event loop.
+            project.technologies = []
+            if dto.technologies and dto.technologies != UNSET:
+                project.technologies = await self._get_or_create_tech_versions(technologies=dto.technologies)
+
+            await self.session.flush()
+        except IntegrityError as e:
+            if 'project_name_key' in str(e.orig):
+                raise ProjectNameAlreadyExistsError(dto.name) from e
+            if self._forget_stale_technologies(e):
+                raise StaleTechnologyReferenceError() from e
+            raise
+
+        return self._to_entity(project)
+
+    async def update(self, dto: UpdateProjectDTO) -> Project:
+        try:
+            project = await self._get_by_id(project_id=dto.project_id)
+            self._touch(project, expected_version=dto.expected_version)
+            for key, value in asdict_extended(
+                    dto, exclude_fields=['project_id', 'technologies', 'expected_version'],
+            ).items():
+                setattr(project, key, value)
+            if not dto.technologies and dto.technologies is not None:
+                project.technologies = []
+            elif dto.technologies and dto.technologies != UNSET:
+                project.technologies = await self._get_or_create_tech_versions(technologies=dto.technologies)
+
+            await self.session.flush()
+        except IntegrityError as e:
+            if 'project_name_key' in str(e.orig):
+                raise ProjectNameAlreadyExistsError(dto.name) from e
+            if self._forget_stale_technologies(e):
+                raise StaleTechnologyReferenceError() from e
+            raise
+        except StaleDataError as e:
+            raise self._stale_project_error(dto.project_id, dto.expected_version) from e
+
+        return self._to_entity(project)
+
+    async def update_technologies(self, dto: UpdateProjectTechnologiesDTO) -> Project:
+        project = await self._get_by_id(project_id=dto.project_id)
+        if not dto.technologies:
+            return self._to_entity(project)
+
+        technologies = await self._get_or_create_tech_versions(self._merge_technologies(project, dto.technologies))
+        project.technologies = technologies
+        self._touch(project)
+
+        try:
+            await self.session.flush()
+        except IntegrityError as e:
+            if self._forget_stale_technologies(e):
+                raise StaleTechnologyReferenceError() from e
+            raise
+        except StaleDataError as e:
+            raise self._stale_project_error(dto.project_id) from e
+
+        return self._to_entity(project)
+
+    async def remove_technologies(self, dto: RemoveProjectTechnologiesDTO) -> Project:
+        project = await self._get_by_id(project_id=dto.project_id)
+        if not dto.technologies:
+            return self._to_entity(project)
+
+        project.technologies = self._exclude_technologies(project, dto.technologies)
+        self._touch(project)
+
+        try:
+            await self.session.flush()
+        except StaleDataError as e:
+            raise self._stale_project_error(dto.project_id) from e
+
+        return self._to_entity(project)
+
+    async def delete(self, dto: DeleteProjectDTO) -> bool:
+        query = self._delete_projects_query([ProjectModel.id == dto.project_id])
+        return (await self.session.execute(query)).first() is not None
+
+    async def bulk_create(self, dto: BulkCreateProjectsDTO) -> list[BulkCreateProjectResultDTO]:
+        results = self._validate_bulk_items(dto.projects)
+        pending = [project for project, result in zip(dto.projects, results) if result is None]
+        if not pending:
+            return self._bulk_results(dto.projects, results, project_ids={})
+
+        try:
+            async with async_savepoint(self.session):
+                project_ids = await self._bulk_insert(pending)
+        except DBAPIError as e:
+            # With stale registry entries the one-by-one retry below resolves technologies from the database again.
+            self._forget_stale_technologies(e)
+            logger.warning('Bulk insert of %s projects failed, retrying one by one.', len(pending), exc_info=True)
+            project_ids = {}
+            for index, project in enumerate(dto.projects):
+                if results[index] is not None:
+                    continue
+                try:
+                    async with async_savepoint(self.session):
+                        project_ids[project.name] = (await self.create(project)).id
+                except ProjectNameAlreadyExistsError:
+                    continue
+                except (CoreException, DBAPIError) as e:
+                    results[index] = BulkCreateProjectResultDTO(
+                        index=index, name=project.name, status='error', error=str(e),
+                    )
+
+        return self._bulk_results(dto.projects, results, project_ids)
+
+    async def bulk_update(self, dto: BulkUpdateProjectsDTO) -> BulkWriteResultDTO:
+        values = self._bulk_update_values(dto)
+        if not values or not dto.project_ids:
+            return BulkWriteResultDTO(project_ids=[])
+
+        check_query = self._invalid_date_range_query(dto, values)
+        if check_query is not None:
+            invalid = (await self.session.execute(check_query)).first()
+            if invalid is not None:
+                raise ProjectInvalidDateRangeError(*invalid)
+
+        project_ids = (await self.session.execute(self._bulk_update_query(dto, values))).scalars().all()
+        return BulkWriteResultDTO(project_ids=list(project_ids))
+
+    async def bulk_delete(self, dto: BulkDeleteProjectsDTO) -> BulkWriteResultDTO:
+        query = self._bulk_delete_query(dto)
+        if query is None:
+            return BulkWriteResultDTO(project_ids=[])
+
+        return BulkWriteResultDTO(project_ids=list((await self.session.execute(query)).scalars().all()))
+
+    async def replace_technology_version(self, dto: ReplaceTechnologyVersionDTO) -> BulkWriteResultDTO:
+        if dto.from_version == dto.to_version:
+            return BulkWriteResultDTO(project_ids=[])
+
+        to_version = (await self._get_or_create_tech_versions(
+            [ProjectTechnologyVersionDTO(name=dto.technology, version=dto.to_version)],
+        ))[0]
+        try:
+            project_ids = (await self.session.execute(
+                self._replace_technology_version_query(dto, to_version.id),
+            )).scalars().all()
+        except IntegrityError as e:
+            if self._forget_stale_technologies(e):
+                raise StaleTechnologyReferenceError() from e
+            raise
+
+        return BulkWriteResultDTO(project_ids=list(project_ids))
+
+    async def _get_by_id(self, project_id: int, options: list | None = None) -> ProjectModel:
+        project = (await self.session.execute(self._get_by_id_query(project_id, options))).scalars().first()
+
+        if project is None:
+            raise ProjectNotFoundError(project_id)
+
+        return project
+
+    async def _get_technology_rows(self, project_ids: list[int]) -> list:
+        if not project_ids:
+            return []
+
+        return (await self.session.execute(self._technology_records_query(project_ids))).all()
+
+    async def _bulk_insert(self, projects: list[CreateProjectDTO]) -> dict[str, int]:
+        technologies = self._collect_technologies(projects)
+        tech_versions = await self._get_or_create_tech_versions(technologies) if technologies else []
+
+        result = await self.session.execute(self._insert_projects_query(projects))
+        project_ids = {name: project_id for project_id, name in result}
+
+        associations_query = self._insert_associations_query(projects, project_ids, tech_versions)
+        if associations_query is not None:
+            await self.session.execute(associations_query)
+
+        return project_ids
+
+    async def _get_or_create_tech_versions(self, technologies: list[ProjectTechnologyVersionDTO]) -> list[
+        TechnologyVersionModel]:
+        # `merge(load=False)` never emits SQL, so the sync session's merge is safe to call from the event loop.
+        found, missing = self._resolve_tech_versions(technologies)
+        if not missing:
+            return self._tech_version_models(found, self.session.sync_session.merge)
+
+        query = self._upsert_tech_versions_query(missing)
+        rows = (await self.session.execute(query)).all()
+        inserted = any(row.inserted for row in rows)
+        if len(rows) < len(missing):
+            # See `PostgresProjectRepository._get_or_create_tech_versions`.
+            rows = (await self.session.execute(query)).all()
+            inserted = inserted or any(row.inserted for row in rows)
+        self._remember_tech_versions(self.session.sync_session, rows, inserted)
+
+        return self._tech_version_models([*found, *rows], self.session.sync_session.merge)
+
+
+class BasePostgresTechnologyRepository:
+
+    @staticmethod
+    def _get_many_query(dto: GetTechnologiesDTO) -> Select:
+        query = (
+            select(TechnologyModel.id, TechnologyModel.name, TechnologyModel.description)
+            .order_by(TechnologyModel.name)
+            .limit(dto.limit)
+            .offset(dto.offset)
+        )
+        if dto.name_prefix:
+            query = query.where(_starts_with(TechnologyModel.name, dto.name_prefix))
+
+        return query
+
+    @staticmethod
+    def _get_versions_query(technology_id: int) -> Select:
+        # Outer joined, so a technology without versions still returns a row and only an unknown id returns none.
+        # Numeric versions come first, newest first ('15.2', '9.6'), then the others by name.
+        numeric_version = case(
+            (TechnologyVersionModel.version.regexp_match(NUMERIC_VERSION_PATTERN),
+             _numeric_version(TechnologyVersionModel.version)),
+            else_=None,
+        )
+        return (
+            select(
+                TechnologyModel.id,
+                TechnologyModel.name,
+                TechnologyModel.description,
+                TechnologyVersionModel.id.label('version_id'),
+                TechnologyVersionModel.version,
+            )
+            .outerjoin(TechnologyVersionModel, TechnologyVersionModel.technology_id == TechnologyModel.id)
+            .where(TechnologyModel.id == technology_id)
+            .order_by(numeric_version.desc().nulls_last(), TechnologyVersionModel.version)
         )
-        existing_techs = self.session.execute(
-            select(TechnologyModel)
-            .where(TechnologyModel.name.in_([tech.name for tech in technologies])),
-        ).scalars().all()
 
-        existing_techs_map = {tech.name: tech for tech in existing_techs}
+    @staticmethod
+    def _to_technology(row) -> Technology:
+        return Technology(id=row.id, name=row.name, description=row.description)
+
+    @staticmethod
+    def _to_versions(technology_id: int, rows) -> list[TechnologyVersion]:
+        if not rows:
+            raise TechnologyNotFoundError(technology_id)
 
-        tech_versions_insert_values = [
-            {'version': tech.version, 'technology_id': existing_techs_map[tech.name].id}
-            for tech
-            in technologies
+        technology = BasePostgresTechnologyRepository._to_technology(rows[0])
+        return [
+            TechnologyVersion(id=row.version_id, technology=technology, version=row.version)
+            for row in rows
+            if row.version_id is not None
         ]
-        self.session.execute(
-            insert(TechnologyVersionModel)
-            .values(tech_versions_insert_values)
-            .on_conflict_do_nothing(index_elements=['technology_id', 'version']),
+
+    # Statistics are read from materialized views: as fresh as the last `refresh_stats`, and cheap to read whatever
+    # the number of projects.
+    @staticmethod
+    def _top_technologies_query(dto: GetTechnologyStatsDTO) -> Select:
+        query = (
+            select(technology_stats.c.technology_id, technology_stats.c.technology, technology_stats.c.project_count)
+            .order_by(technology_stats.c.project_count.desc(), technology_stats.c.technology)
+            .limit(dto.limit)
         )
+        if dto.technology:
+            query = query.where(technology_stats.c.technology == dto.technology)
 
-        tech_versions_pairs = [(existing_techs_map[tech.name].id, tech.version) for tech in technologies]
-        tech_versions = self.session.execute(
-            select(TechnologyVersionModel)
-            .where(
-                tuple_(TechnologyVersionModel.technology_id, TechnologyVersionModel.version)
-                .in_(tech_versions_pairs),
+        return query
+
+    @staticmethod
+    def _version_counts_query(technology_ids: list[int]) -> Select:
+        return (
+            select(
+                technology_version_stats.c.technology_id,
+                technology_version_stats.c.version,
+                technology_version_stats.c.project_count,
+            )
+            .where(_id_in(technology_version_stats.c.technology_id, technology_ids))
+            .order_by(technology_version_stats.c.project_count.desc(), technology_version_stats.c.version)
+        )
+
+    @staticmethod
+    def _year_counts_query(technology_ids: list[int]) -> Select:
+        return (
+            select(technology_usage_stats.c.technology_id, technology_usage_stats.c.year,
+                   technology_usage_stats.c.project_count)
+            .where(_id_in(technology_usage_stats.c.technology_id, technology_ids))
+            .order_by(technology_usage_stats.c.year)
+        )
+
+    @staticmethod
+    def _pair_counts_query(dto: GetTechnologyStatsDTO) -> Select:
+        query = (
+            select(technology_pair_stats.c.first_technology, technology_pair_stats.c.second_technology,
+                   technology_pair_stats.c.project_count)
+            .order_by(
+                technology_pair_stats.c.project_count.desc(),
+                technology_pair_stats.c.first_technology,
+                technology_pair_stats.c.second_technology,
             )
-            .options(joinedload(TechnologyVersionModel.technology)),
-        ).scalars().all()
+            .limit(dto.pairs_limit)
+        )
+        if dto.technology:
+            query = query.where(or_(
+                technology_pair_stats.c.first_technology == dto.technology,
+                technology_pair_stats.c.second_technology == dto.technology,
+            ))
+
+        return query
+
+    @staticmethod
+    def _refreshed_at_query() -> Select:
+        return select(technology_stats_refresh.c.refreshed_at)
+
+    @staticmethod
+    def _refresh_queries(concurrently: bool) -> list[TextClause]:
+        # Refreshing concurrently does not block readers, but needs the unique index each view has.
+        keyword = 'CONCURRENTLY ' if concurrently else ''
+        return [
+            # Refreshing can outlast the statement timeout meant for API requests.
+            text('SET LOCAL statement_timeout = 0'),
+            *(text(f'REFRESH MATERIALIZED VIEW {keyword}{view.name}') for view in TECHNOLOGY_STATS_VIEWS),
+        ]
+
+    @staticmethod
+    def _to_stats(technologies, versions, years, pairs, refreshed_at: datetime | None) -> TechnologyStatsDTO:
+        versions_by_technology = defaultdict(list)
+        for technology_id, version, project_count in versions:
+            versions_by_technology[technology_id].append(TechnologyVersionCountDTO(version, project_count))
+        years_by_technology = defaultdict(list)
+        for technology_id, year, project_count in years:
+            years_by_technology[technology_id].append(TechnologyYearCountDTO(year, project_count))
+
+        return TechnologyStatsDTO(
+            technologies=[
+                TechnologyCountDTO(
+                    name=name,
+                    project_count=project_count,
+                    versions=versions_by_technology[technology_id],
+                    usage=years_by_technology[technology_id],
+                )
+                for technology_id, name, project_count in technologies
+            ],
+            pairs=[TechnologyPairCountDTO((first, second), project_count) for first, second, project_count in pairs],
+            refreshed_at=refreshed_at,
+        )
+
+
+class PostgresTechnologyRepository(BasePostgresTechnologyRepository):
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_many(self, dto: GetTechnologiesDTO) -> list[Technology]:
+        return list(map(self._to_technology, self.session.execute(self._get_many_query(dto))))
+
+    def get_versions(self, dto: GetTechnologyVersionsDTO) -> list[TechnologyVersion]:
+        rows = self.session.execute(self._get_versions_query(dto.technology_id)).all()
+
+        return self._to_versions(dto.technology_id, rows)
+
+    def get_stats(self, dto: GetTechnologyStatsDTO) -> TechnologyStatsDTO:
+        technologies = self.session.execute(self._top_technologies_query(dto)).all()
+        technology_ids = [row.technology_id for row in technologies]
+        versions = self.session.execute(self._version_counts_query(technology_ids)).all() if technologies else []
+        years = self.session.execute(self._year_counts_query(technology_ids)).all() if technologies else []
+        pairs = self.session.execute(self._pair_counts_query(dto)).all()
+        refreshed_at = self.session.execute(self._refreshed_at_query()).scalar()
+
+        return self._to_stats(technologies, versions, years, pairs, refreshed_at)
+
+    def refresh_stats(self, concurrently: bool = True) -> None:
+        # One transaction, so readers never see the views refreshed at different times.
+        for query in self._refresh_queries(concurrently):
+            self.session.execute(query)
+
+
+class AsyncPostgresTechnologyRepository(BasePostgresTechnologyRepository):
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_many(self, dto: GetTechnologiesDTO) -> list[Technology]:
+        return list(map(self._to_technology, await self.session.execute(self._get_many_query(dto))))
+
+    async def get_versions(self, dto: GetTechnologyVersionsDTO) -> list[TechnologyVersion]:
+        rows = (await self.session.execute(self._get_versions_query(dto.technology_id))).all()
+
+        return self._to_versions(dto.technology_id, rows)
+
+    async def get_stats(self, dto: GetTechnologyStatsDTO) -> TechnologyStatsDTO:
+        technologies = (await self.session.execute(self._top_technologies_query(dto))).all()
+        technology_ids = [row.technology_id for row in technologies]
+        versions, years = [], []
+        if technologies:
+            versions = (await self.session.execute(self._version_counts_query(technology_ids))).all()
+            years = (await self.session.execute(self._year_counts_query(technology_ids))).all()
+        pairs = (await self.session.execute(self._pair_counts_query(dto))).all()
+        refreshed_at = (await self.session.execute(self._refreshed_at_query())).scalar()
+
+        return self._to_stats(technologies, versions, years, pairs, refreshed_at)
 
-        return list(tech_versions)
+    async def refresh_stats(self, concurrently: bool = True) -> None:
+        for query in self._refresh_queries(concurrently):
+            await self.session.execute(query)
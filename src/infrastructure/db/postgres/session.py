@@ -1,21 +1,102 @@
+from contextlib import asynccontextmanager
 from contextlib import contextmanager
 
+from sqlalchemy import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 
-from infrastructure.db.postgres.base import sync_engine
+from infrastructure.db.postgres.engines import ASYNC_ENGINE
+from infrastructure.db.postgres.engines import SYNC_ENGINE
+from infrastructure.db.postgres.engines import get_engine
+from infrastructure.db.postgres.replicas import async_replicas
+from infrastructure.db.postgres.replicas import connect_async_replica
+from infrastructure.db.postgres.replicas import connect_replica
+from infrastructure.db.postgres.replicas import reads_pinned_to_primary
+from infrastructure.db.postgres.replicas import sync_replicas
+from infrastructure.db.transactions import POST_COMMIT_CALLBACKS
+from infrastructure.db.transactions import run_post_commit
 
 
-def get_sync_session():
-    with sync_engine.connect() as connection:
+def _connect_sync(engine_name: str) -> Connection:
+    managed = get_engine(engine_name)
+    with managed.pool_metrics.measure_checkout():
+        return managed.engine.connect()
+
+
+def _sync_session(connection: Connection):
+    callbacks = []
+    with connection:
         with connection.begin() as transaction:
             _SyncSession = sessionmaker(bind=connection)
             with _SyncSession() as session:
+                session.info[POST_COMMIT_CALLBACKS] = callbacks
                 try:
                     yield session
                     session.commit()
                 except:  # noqa:E722
                     transaction.rollback()
                     raise
+    run_post_commit(callbacks)
+
+
+def get_sync_session(engine_name: str = SYNC_ENGINE):
+    yield from _sync_session(_connect_sync(engine_name))
+
+
+def get_sync_read_session():
+    """A session on a healthy replica; on the primary without one, or when reads are pinned to the primary."""
+    connection = None
+    if sync_replicas and not reads_pinned_to_primary():
+        connection = connect_replica(sync_replicas)
+    if connection is None:
+        connection = _connect_sync(SYNC_ENGINE)
+    yield from _sync_session(connection)
 
 
 sync_session_manager = contextmanager(get_sync_session)
+sync_read_session_manager = contextmanager(get_sync_read_session)
+
+
+async def _connect_async(engine_name: str) -> AsyncConnection:
+    managed = get_engine(engine_name)
+    with managed.pool_metrics.measure_checkout():
+        return await managed.engine.connect().start()
+
+
+@asynccontextmanager
+async def _async_session(connection: AsyncConnection):
+    callbacks = []
+    try:
+        async with connection.begin() as transaction:
+            _AsyncSession = async_sessionmaker(bind=connection, expire_on_commit=False)
+            async with _AsyncSession() as session:
+                session.info[POST_COMMIT_CALLBACKS] = callbacks
+                try:
+                    yield session
+                    await session.commit()
+                except:  # noqa:E722
+                    await transaction.rollback()
+                    raise
+    finally:
+        await connection.close()
+    run_post_commit(callbacks)
+
+
+async def get_async_session(engine_name: str = ASYNC_ENGINE):
+    async with _async_session(await _connect_async(engine_name)) as session:
+        yield session
+
+
+async def get_async_read_session():
+    connection = None
+    if async_replicas and not reads_pinned_to_primary():
+        connection = await connect_async_replica(async_replicas)
+    if connection is None:
+        connection = await _connect_async(ASYNC_ENGINE)
+    async with _async_session(connection) as session:
+        yield session
+
+
+async_session_manager = asynccontextmanager(get_async_session)
+async_read_session_manager = asynccontextmanager(get_async_read_session)
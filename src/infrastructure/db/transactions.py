@@ -0,0 +1,68 @@
+import logging
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+POST_COMMIT_CALLBACKS = 'post_commit_callbacks'
+
+
+def on_commit(session, callback: Callable[[], None]) -> None:
+    """Run `callback` once the transaction `session` (sync or async) writes in is committed, not at all otherwise.
+
+    Sessions of the session managers are bound to a connection inside `connection.begin()`: their `after_commit`
+    fires before the COMMIT is sent, so the managers run these callbacks after it instead.
+    """
+    session = getattr(session, 'sync_session', session)
+    callbacks = session.info.get(POST_COMMIT_CALLBACKS)
+    if callbacks is None:
+        event.listen(session, 'after_commit', lambda _: callback(), once=True)
+    else:
+        callbacks.append(callback)
+
+
+def run_post_commit(callbacks: list[Callable[[], None]]) -> None:
+    # The data is committed by now, a failing callback (e.g. the cache being down) must not fail the request.
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            logger.exception('Post-commit callback failed.')
+
+
+@contextmanager
+def savepoint(session: Session) -> Iterator[None]:
+    """`session.begin_nested()` whose `on_commit` callbacks are dropped when the savepoint is rolled back."""
+    with _savepoint_callbacks(session), session.begin_nested():
+        yield
+
+
+@asynccontextmanager
+async def async_savepoint(session: AsyncSession) -> AsyncIterator[None]:
+    with _savepoint_callbacks(session.sync_session):
+        async with session.begin_nested():
+            yield
+
+
+@contextmanager
+def _savepoint_callbacks(session: Session) -> Iterator[None]:
+    outer = session.info.get(POST_COMMIT_CALLBACKS)
+    callbacks = session.info[POST_COMMIT_CALLBACKS] = []
+    try:
+        yield
+    finally:
+        if outer is None:
+            del session.info[POST_COMMIT_CALLBACKS]
+        else:
+            session.info[POST_COMMIT_CALLBACKS] = outer
+
+    # Only reached when the savepoint was released: its callbacks now wait for the enclosing transaction.
+    for callback in callbacks:
+        on_commit(session, callback)
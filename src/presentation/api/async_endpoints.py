@@ -0,0 +1,401 @@
+from quart import Blueprint
+from quart import Response
+from quart import jsonify
+from quart import request
+
+from application.services import BulkCreateProjectsService
+from application.services import BulkDeleteProjectsService
+from application.services import BulkUpdateProjectsService
+from application.services import CreateProjectService
+from application.services import DeleteProjectService
+from application.services import ExportProjectsService
+from application.services import GetManyProjectRecordsService
+from application.services import GetManyProjectVersionsService
+from application.services import GetProjectVersionService
+from application.services import GetProjectsByIdsService
+from application.services import GetSingleProjectRecordService
+from application.services import RemoveProjectTechnologies
+from application.services import ReplaceTechnologyVersionService
+from application.services import SearchProjectsService
+from application.services import UpdateProjectService
+from application.services import UpdateProjectTechnologiesService
+from core.dto import BulkCreateProjectsDTO
+from core.dto import BulkDeleteProjectsDTO
+from core.dto import BulkUpdateProjectsDTO
+from core.dto import CreateProjectDTO
+from core.dto import DeleteProjectDTO
+from core.dto import ExportProjectsDTO
+from core.dto import GetProjectDTO
+from core.dto import GetProjectsByIdsDTO
+from core.dto import GetProjectsDTO
+from core.dto import PROJECT_ORDERING_FIELDS
+from core.dto import RemoveProjectTechnologiesDTO
+from core.dto import ReplaceTechnologyVersionDTO
+from core.dto import SearchProjectsDTO
+from core.dto import UpdateProjectDTO
+from core.dto import UpdateProjectTechnologiesDTO
+from core.utils import encode_cursor
+from core.utils import from_dict_extended
+from infrastructure.db.postgres import async_read_session_manager
+from infrastructure.db.postgres import async_session_manager
+from presentation.api.async_swagger import async_spec
+from presentation.api.conditional import if_match_version
+from presentation.api.conditional import matching_etag
+from presentation.api.conditional import project_etag
+from presentation.api.conditional import projects_etag
+from presentation.api.conditional import with_validators
+from presentation.api.dependencies import get_async_project_repository
+from presentation.api.dependencies import retry_on_stale_technologies
+from presentation.api.schemas import BulkCreateProjectsRequestSchema
+from presentation.api.schemas import BulkCreateProjectsResponseSchema
+from presentation.api.schemas import BulkDeleteProjectsRequestSchema
+from presentation.api.schemas import BulkUpdateProjectsRequestSchema
+from presentation.api.schemas import BulkWriteResponseSchema
+from presentation.api.schemas import CreateProjectRequestSchema
+from presentation.api.schemas import CreateProjectResponseSchema
+from presentation.api.schemas import DeleteProjectRequestSchema
+from presentation.api.schemas import DeleteProjectResponseSchema
+from presentation.api.schemas import ExportProjectsRequestSchema
+from presentation.api.schemas import GetManyProjectRequestSchema
+from presentation.api.schemas import GetProjectsBatchRequestSchema
+from presentation.api.schemas import ProjectFieldsSchema
+from presentation.api.schemas import ProjectSchema
+from presentation.api.schemas import RemoveProjectTechnologiesJsonSchema
+from presentation.api.schemas import ReplaceTechnologyVersionRequestSchema
+from presentation.api.schemas import SearchProjectsRequestSchema
+from presentation.api.schemas import SearchProjectsResponseSchema
+from presentation.api.schemas import UpdateProjectJsonSchema
+from presentation.api.schemas import UpdateProjectResponseSchema
+from presentation.api.schemas import UpdateProjectTechnologiesJsonSchema
+from presentation.api.serialization import compact_project_records_batch_adapter
+from presentation.api.serialization import compact_project_records_page_adapter
+from presentation.api.serialization import compact_records
+from presentation.api.serialization import partial_project_record_adapter
+from presentation.api.serialization import partial_project_records_page_adapter
+from presentation.api.serialization import project_record_adapter
+from presentation.api.serialization import project_records_batch_adapter
+from presentation.api.serialization import project_records_page_adapter
+from presentation.api.serialization import record_fields
+from presentation.api.serialization import record_include
+from presentation.export import EXPORT_MIMETYPES
+from presentation.export import CsvRowEncoder
+from presentation.export import to_ndjson_line
+
+async_projects_router = Blueprint('projects', __name__, url_prefix='/project')
+
+
+@async_projects_router.route('/<int:project_id>', methods=['GET'])
+@async_spec.validate(
+    query=ProjectFieldsSchema,
+    tags=['Projects'],
+)
+async def get_project(project_id: int, query: ProjectFieldsSchema):
+    service_dto = from_dict_extended(GetProjectDTO, {
+        **query.model_dump(mode='json', exclude_unset=True),
+        'project_id': project_id,
+        'fields': record_fields(query.fields),
+    })
+    async with async_read_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        if request.if_none_match:
+            # Answered from the version columns alone, technologies are not loaded.
+            version = await GetProjectVersionService(project_repository=project_repository).call(dto=service_dto)
+            etag = matching_etag(request.if_none_match, project_etag(version.version))
+            if etag is not None:
+                return with_validators(Response(status=304), etag, version.updated_at)
+
+        service = GetSingleProjectRecordService(project_repository=project_repository)
+        project = await service.call(dto=service_dto)
+
+    include = record_include(query.fields, query.expand)
+    if include is None:
+        body = project_record_adapter.dump_json(project)
+    else:
+        body = partial_project_record_adapter.dump_json(project, include=include)
+    response = Response(body, status=200, mimetype='application/json')
+    return with_validators(response, project_etag(project['version']), project['updated_at'])
+
+
+@async_projects_router.route('/all', methods=['GET'])
+@async_spec.validate(
+    query=GetManyProjectRequestSchema,
+    tags=['Projects'],
+)
+async def get_projects(query: GetManyProjectRequestSchema):
+    service_dto = from_dict_extended(GetProjectsDTO, {
+        **query.model_dump(mode='json', exclude_unset=True),
+        'fields': record_fields(query.fields, *PROJECT_ORDERING_FIELDS[query.order_by]),
+    })
+    async with async_read_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        if request.if_none_match:
+            versions = await GetManyProjectVersionsService(project_repository=project_repository).call(dto=service_dto)
+            etag = matching_etag(
+                request.if_none_match, projects_etag((version.project_id, version.version) for version in versions),
+            )
+            if etag is not None:
+                last_modified = max((version.updated_at for version in versions), default=None)
+                return with_validators(Response(status=304), etag, last_modified)
+
+        service = GetManyProjectRecordsService(project_repository=project_repository)
+        projects = await service.call(dto=service_dto)
+
+    next_cursor = None
+    if len(projects) == query.limit:
+        next_cursor = encode_cursor(order_by=query.order_by, obj=projects[-1])
+
+    page = {'projects': projects, 'next_offset': query.offset + query.limit, 'next_cursor': next_cursor}
+    include = record_include(query.fields, query.expand)
+    page_include = None
+    if include is not None:
+        page_include = {'projects': {'__all__': include}, 'next_offset': True, 'next_cursor': True}
+    if query.encoding == 'compact':
+        page['projects'], page['technology_versions'] = compact_records(projects)
+        body = compact_project_records_page_adapter.dump_json(
+            page, include=None if page_include is None else {**page_include, 'technology_versions': True},
+        )
+    elif include is None:
+        body = project_records_page_adapter.dump_json(page)
+    else:
+        body = partial_project_records_page_adapter.dump_json(page, include=page_include)
+    response = Response(body, status=200, mimetype='application/json')
+    return with_validators(
+        response,
+        projects_etag((project['id'], project['version']) for project in projects),
+        max((project['updated_at'] for project in projects), default=None),
+    )
+
+
+@async_projects_router.route('/batch', methods=['GET'])
+@async_spec.validate(
+    query=GetProjectsBatchRequestSchema,
+    tags=['Projects'],
+)
+async def get_projects_batch(query: GetProjectsBatchRequestSchema):
+    async with async_read_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = GetProjectsByIdsService(project_repository=project_repository)
+        service_dto = from_dict_extended(GetProjectsByIdsDTO, {'project_ids': query.ids})
+        projects = await service.call(dto=service_dto)
+
+    found_ids = {project['id'] for project in projects}
+    batch = {
+        'projects': projects,
+        'missing_ids': [project_id for project_id in dict.fromkeys(query.ids) if project_id not in found_ids],
+    }
+    if query.encoding == 'compact':
+        batch['projects'], batch['technology_versions'] = compact_records(projects)
+        body = compact_project_records_batch_adapter.dump_json(batch)
+    else:
+        body = project_records_batch_adapter.dump_json(batch)
+    return Response(body, status=200, mimetype='application/json')
+
+
+@async_projects_router.route('/search', methods=['GET'])
+@async_spec.validate(
+    query=SearchProjectsRequestSchema,
+    tags=['Projects'],
+)
+async def search_projects(query: SearchProjectsRequestSchema):
+    async with async_read_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = SearchProjectsService(project_repository=project_repository)
+        service_dto = from_dict_extended(SearchProjectsDTO, {
+            'query': query.q,
+            **query.model_dump(mode='json', exclude={'q'}),
+        })
+        projects = await service.call(dto=service_dto)
+
+    return jsonify(SearchProjectsResponseSchema(
+        projects=[ProjectSchema.model_validate(project) for project in projects],
+        next_offset=query.offset + query.limit,
+    ).model_dump(mode='json')), 200
+
+
+@async_projects_router.route('/export', methods=['GET'])
+@async_spec.validate(
+    query=ExportProjectsRequestSchema,
+    tags=['Projects'],
+)
+async def export_projects(query: ExportProjectsRequestSchema):
+    service_dto = from_dict_extended(ExportProjectsDTO, query.model_dump(exclude={'format'}))
+
+    async def generate():
+        csv_encoder = CsvRowEncoder()
+        if query.format == 'csv':
+            yield csv_encoder.header()
+
+        async with async_read_session_manager() as session:
+            project_repository = get_async_project_repository(session=session)
+            service = ExportProjectsService(project_repository=project_repository)
+            async for project in service.call(dto=service_dto):
+                yield csv_encoder.row(project) if query.format == 'csv' else to_ndjson_line(project)
+
+    return Response(generate(), mimetype=EXPORT_MIMETYPES[query.format])
+
+
+@async_projects_router.route('/', methods=['POST'])
+@async_spec.validate(
+    json=CreateProjectRequestSchema,
+    tags=['Projects'],
+)
+@retry_on_stale_technologies
+async def create_project(json: CreateProjectRequestSchema):
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = CreateProjectService(project_repository=project_repository)
+        service_dto = from_dict_extended(CreateProjectDTO, json.model_dump(mode='json', exclude_unset=True))
+        project = await service.call(dto=service_dto)
+
+    response = jsonify(CreateProjectResponseSchema.model_validate(project).model_dump(mode='json'))
+    return with_validators(response, project_etag(project.version), project.updated_at), 201
+
+
+@async_projects_router.route('/bulk', methods=['POST'])
+@async_spec.validate(
+    json=BulkCreateProjectsRequestSchema,
+    tags=['Projects'],
+)
+async def bulk_create_projects(json: BulkCreateProjectsRequestSchema):
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = BulkCreateProjectsService(project_repository=project_repository)
+        service_dto = from_dict_extended(BulkCreateProjectsDTO, json.model_dump(mode='json', exclude_unset=True))
+        results = await service.call(dto=service_dto)
+
+    statuses = [result.status for result in results]
+    return jsonify(BulkCreateProjectsResponseSchema.model_validate({
+        'results': results,
+        'created': statuses.count('created'),
+        'duplicates': statuses.count('duplicate'),
+        'errors': statuses.count('error'),
+    }).model_dump(mode='json')), 200
+
+
+@async_projects_router.route('/bulk', methods=['PATCH'])
+@async_spec.validate(
+    json=BulkUpdateProjectsRequestSchema,
+    tags=['Projects'],
+)
+async def bulk_update_projects(json: BulkUpdateProjectsRequestSchema):
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = BulkUpdateProjectsService(project_repository=project_repository)
+        service_dto = from_dict_extended(BulkUpdateProjectsDTO, {
+            'project_ids': json.ids,
+            **json.model_dump(mode='json', exclude_unset=True, exclude={'ids'}),
+        })
+        result = await service.call(dto=service_dto)
+
+    return jsonify(BulkWriteResponseSchema(
+        count=len(result.project_ids),
+        project_ids=result.project_ids,
+    ).model_dump(mode='json')), 200
+
+
+@async_projects_router.route('/bulk/delete', methods=['POST'])
+@async_spec.validate(
+    json=BulkDeleteProjectsRequestSchema,
+    tags=['Projects'],
+)
+async def bulk_delete_projects(json: BulkDeleteProjectsRequestSchema):
+    filters = json.model_dump(mode='json', exclude_unset=True, exclude={'ids'})
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = BulkDeleteProjectsService(project_repository=project_repository)
+        service_dto = from_dict_extended(BulkDeleteProjectsDTO, {'project_ids': json.ids, 'filters': filters or None})
+        result = await service.call(dto=service_dto)
+
+    return jsonify(BulkWriteResponseSchema(
+        count=len(result.project_ids),
+        project_ids=result.project_ids,
+    ).model_dump(mode='json')), 200
+
+
+@async_projects_router.route('/technologies/replace', methods=['POST'])
+@async_spec.validate(
+    json=ReplaceTechnologyVersionRequestSchema,
+    tags=['Projects'],
+)
+@retry_on_stale_technologies
+async def replace_technology_version(json: ReplaceTechnologyVersionRequestSchema):
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = ReplaceTechnologyVersionService(project_repository=project_repository)
+        service_dto = from_dict_extended(ReplaceTechnologyVersionDTO, json.model_dump(mode='json'))
+        result = await service.call(dto=service_dto)
+
+    return jsonify(BulkWriteResponseSchema(
+        count=len(result.project_ids),
+        project_ids=result.project_ids,
+    ).model_dump(mode='json')), 200
+
+
+@async_projects_router.route('/<int:project_id>', methods=['PATCH'])
+@async_spec.validate(
+    json=UpdateProjectJsonSchema,
+    tags=['Projects'],
+)
+@retry_on_stale_technologies
+async def update_project(project_id: int, json: UpdateProjectJsonSchema):
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = UpdateProjectService(project_repository=project_repository)
+        service_dto = from_dict_extended(UpdateProjectDTO,
+                                         {'project_id': project_id,
+                                          'expected_version': if_match_version(project_id, request.if_match),
+                                          **json.model_dump(mode='json', exclude_unset=True)})
+        project = await service.call(dto=service_dto)
+
+    response = jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json'))
+    return with_validators(response, project_etag(project.version), project.updated_at), 200
+
+
+@async_projects_router.route('/<int:project_id>/technologies/update', methods=['POST'])
+@async_spec.validate(
+    json=UpdateProjectTechnologiesJsonSchema,
+    tags=['Projects'],
+)
+@retry_on_stale_technologies
+async def update_project_technologies(project_id: int, json: UpdateProjectTechnologiesJsonSchema):
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = UpdateProjectTechnologiesService(project_repository=project_repository)
+        service_dto = from_dict_extended(UpdateProjectTechnologiesDTO,
+                                         {'project_id': project_id, **json.model_dump(mode='json', exclude_unset=True)})
+        project = await service.call(dto=service_dto)
+
+    response = jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json'))
+    return with_validators(response, project_etag(project.version), project.updated_at), 200
+
+
+@async_projects_router.route('/<int:project_id>/technologies/remove', methods=['POST'])
+@async_spec.validate(
+    json=RemoveProjectTechnologiesJsonSchema,
+    tags=['Projects'],
+)
+async def remove_project_technologies(project_id: int, json: RemoveProjectTechnologiesJsonSchema):
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = RemoveProjectTechnologies(project_repository=project_repository)
+        service_dto = from_dict_extended(RemoveProjectTechnologiesDTO,
+                                         {'project_id': project_id, **json.model_dump(mode='json', exclude_unset=True)})
+        project = await service.call(dto=service_dto)
+
+    response = jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json'))
+    return with_validators(response, project_etag(project.version), project.updated_at), 200
+
+
+@async_projects_router.route('/<int:project_id>', methods=['DELETE'])
+@async_spec.validate(
+    tags=['Projects'],
+)
+async def delete_project(project_id: int):
+    request_dto = DeleteProjectRequestSchema(project_id=project_id)
+    async with async_session_manager() as session:
+        project_repository = get_async_project_repository(session=session)
+        service = DeleteProjectService(project_repository=project_repository)
+        service_dto = from_dict_extended(DeleteProjectDTO, request_dto.model_dump(exclude_unset=True))
+        success = await service.call(dto=service_dto)
+
+    return jsonify(DeleteProjectResponseSchema(success=success).model_dump(mode='json')), 200
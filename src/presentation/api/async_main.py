@@ -0,0 +1,42 @@
+from quart import Quart
+
+from infrastructure.db.postgres import dispose_async_engine
+from log import setup_logging
+from presentation.api.async_endpoints import async_projects_router
+from presentation.api.async_swagger import async_spec
+from presentation.api.async_technology_endpoints import async_technologies_router
+from presentation.api.compression import response_compression
+from presentation.api.exception_handlers import register_exception_handlers
+from presentation.api.metrics import request_metrics
+from presentation.api.read_routing import read_your_writes
+from settings import COMPRESSION_ENABLED
+from settings import METRICS_ENABLED
+from settings import POSTGRES_REPLICA_HOSTS
+from settings import READ_YOUR_WRITES_SECONDS
+
+
+def create_app() -> Quart:
+    setup_logging()
+
+    app = Quart(__name__)
+    app.register_blueprint(async_projects_router)
+    app.register_blueprint(async_technologies_router)
+    register_exception_handlers(app)
+    async_spec.register(app)
+    if METRICS_ENABLED:
+        request_metrics.init_app(app)
+    if POSTGRES_REPLICA_HOSTS and READ_YOUR_WRITES_SECONDS:
+        read_your_writes.init_app(app)
+    if COMPRESSION_ENABLED:
+        response_compression.init_app(app)
+
+    @app.after_serving
+    async def close_engines():
+        await dispose_async_engine()
+
+    return app
+
+
+if __name__ == '__main__':
+    app = create_app()
+    app.run()
@@ -0,0 +1,4 @@
+from spectree import SpecTree
+
+# Apart from `swagger.py`: the Quart plugin imports Quart, which the sync (Flask) app does not need.
+async_spec = SpecTree('quart', title='Project Presenter API', version='1.0.0', path='docs')
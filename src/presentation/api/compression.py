@@ -0,0 +1,199 @@
+import zlib
+from typing import TYPE_CHECKING
+from typing import Callable
+
+from flask import Flask
+from flask import request as flask_request
+
+from presentation.api.conditional import encoded_etag
+from presentation.api.frameworks import is_quart_app
+from settings import COMPRESSION_ALGORITHMS
+from settings import COMPRESSION_BROTLI_LEVEL
+from settings import COMPRESSION_GZIP_LEVEL
+from settings import COMPRESSION_MIN_SIZE
+from settings import COMPRESSION_ZSTD_LEVEL
+
+if TYPE_CHECKING:
+    from quart import Quart
+    from quart.wrappers.response import IterableBody
+
+COMPRESSIBLE_MIMETYPES = frozenset({'application/json', 'application/x-ndjson', 'application/javascript'})
+
+# `compress(chunk)` and `finish()` of one compression stream.
+Compressor = tuple[Callable[[bytes], bytes], Callable[[], bytes]]
+
+
+def gzip_compressor(level: int) -> Compressor:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return compressor.compress, compressor.flush
+
+
+def brotli_compressor(level: int) -> Compressor:
+    try:
+        import brotli
+    except ImportError as e:
+        raise RuntimeError('The `brotli` package is required for COMPRESSION_ALGORITHMS=br.') from e
+    compressor = brotli.Compressor(quality=level)
+    return compressor.process, compressor.finish
+
+
+def zstd_compressor(level: int) -> Compressor:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError('The `zstandard` package is required for COMPRESSION_ALGORITHMS=zstd.') from e
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    return compressor.compress, compressor.flush
+
+
+COMPRESSORS: dict[str, Callable[[int], Compressor]] = {
+    'zstd': zstd_compressor,
+    'br': brotli_compressor,
+    'gzip': gzip_compressor,
+}
+
+
+def _compress_chunks(chunks, compressor: Compressor):
+    compress, finish = compressor
+    try:
+        for chunk in chunks:
+            data = compress(chunk.encode() if isinstance(chunk, str) else chunk)
+            if data:
+                yield data
+        yield finish()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+def _encode_etag(response, algorithm: str) -> None:
+    etag, weak = response.get_etag()
+    if etag is not None:
+        response.set_etag(encoded_etag(etag, algorithm), weak=weak)
+
+
+async def _compress_async_chunks(body: 'IterableBody', compressor: Compressor):
+    compress, finish = compressor
+    async with body as chunks:
+        async for chunk in chunks:
+            data = compress(chunk.encode() if isinstance(chunk, str) else chunk)
+            if data:
+                yield data
+    yield finish()
+
+
+class ResponseCompression:
+    """Compresses response bodies with the first of `algorithms` (in server preference order) that the client
+    accepts, at the best `Accept-Encoding` quality.
+
+    Buffered bodies under `min_size` bytes are sent as is, streamed ones (export) are compressed as they are
+    produced. A compressed response gets its own `ETag`, the coding appended to the tag (see `encoded_etag`).
+    """
+
+    def __init__(
+            self,
+            app: 'Flask | Quart | None' = None,
+            algorithms: list[str] = COMPRESSION_ALGORITHMS,
+            min_size: int = COMPRESSION_MIN_SIZE,
+            levels: dict[str, int] | None = None,
+    ) -> None:
+        unknown = [algorithm for algorithm in algorithms if algorithm not in COMPRESSORS]
+        if unknown:
+            raise RuntimeError(
+                f'Unknown compression algorithm ({", ".join(unknown)}), expected any of: {", ".join(COMPRESSORS)}.'
+            )
+        self.algorithms = algorithms
+        self.min_size = min_size
+        self.levels = levels or {
+            'zstd': COMPRESSION_ZSTD_LEVEL,
+            'br': COMPRESSION_BROTLI_LEVEL,
+            'gzip': COMPRESSION_GZIP_LEVEL,
+        }
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: 'Flask | Quart') -> None:
+        # Fail at startup rather than on the first request when an optional package is missing.
+        for algorithm in self.algorithms:
+            self.compressor(algorithm)
+
+        # Registered last, it runs first of the after-request hooks: the metrics count the compression time.
+        if is_quart_app(app):
+            from quart import request as quart_request
+
+            @app.after_request
+            async def compress_response(response):
+                return self._compress_quart(quart_request.accept_encodings, response)
+        else:
+            @app.after_request
+            def compress_response(response):
+                return self._compress_flask(flask_request.accept_encodings, response)
+
+    def compressor(self, algorithm: str) -> Compressor:
+        return COMPRESSORS[algorithm](self.levels[algorithm])
+
+    def negotiate(self, accept_encodings) -> str | None:
+        best, best_quality = None, 0
+        for algorithm in self.algorithms:
+            quality = accept_encodings.quality(algorithm)
+            if quality > best_quality:
+                best, best_quality = algorithm, quality
+        return best
+
+    def _compressible(self, response) -> bool:
+        if response.status_code < 200 or response.status_code in (204, 206, 304):
+            return False
+        if 'Content-Encoding' in response.headers or 'no-transform' in response.headers.get('Cache-Control', ''):
+            return False
+        mimetype = response.mimetype or ''
+        return mimetype.startswith('text/') or mimetype in COMPRESSIBLE_MIMETYPES
+
+    def _compress_flask(self, accept_encodings, response):
+        if response.direct_passthrough or not self._compressible(response):
+            return response
+        response.vary.add('Accept-Encoding')
+        algorithm = self.negotiate(accept_encodings)
+        if algorithm is None:
+            return response
+
+        if response.is_streamed:
+            response.response = _compress_chunks(response.response, self.compressor(algorithm))
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            compress, finish = self.compressor(algorithm)
+            response.set_data(compress(data) + finish())
+        response.headers['Content-Encoding'] = algorithm
+        _encode_etag(response, algorithm)
+        return response
+
+    def _compress_quart(self, accept_encodings, response):
+        from quart.wrappers.response import DataBody
+        from quart.wrappers.response import IterableBody
+
+        if not self._compressible(response):
+            return response
+        response.vary.add('Accept-Encoding')
+        algorithm = self.negotiate(accept_encodings)
+        if algorithm is None:
+            return response
+
+        if isinstance(response.response, IterableBody):
+            response.response = IterableBody(_compress_async_chunks(response.response, self.compressor(algorithm)))
+            response.headers.pop('Content-Length', None)
+        elif isinstance(response.response, DataBody):
+            data = response.response.data
+            if len(data) < self.min_size:
+                return response
+            compress, finish = self.compressor(algorithm)
+            response.set_data(compress(data) + finish())
+        else:
+            return response
+        response.headers['Content-Encoding'] = algorithm
+        _encode_etag(response, algorithm)
+        return response
+
+
+response_compression = ResponseCompression()
@@ -0,0 +1,78 @@
+import hashlib
+from datetime import datetime
+from typing import Iterable
+
+from werkzeug.datastructures import ETags
+
+from core.exceptions import ProjectVersionMismatchError
+
+PROJECT_ETAG_PREFIX = 'v'
+
+# Content codings `ResponseCompression` may apply. An encoded body is a different representation, so it gets its own
+# strong tag with the coding appended, e.g. `"v3-gzip"` (RFC 9110, 8.8.3.3).
+ETAG_CODINGS = frozenset({'zstd', 'br', 'gzip'})
+
+
+def project_etag(version: int) -> str:
+    return f'{PROJECT_ETAG_PREFIX}{version}'
+
+
+def projects_etag(versions: Iterable[tuple[int, int]]) -> str:
+    # A page is identified by its (project_id, version) pairs; everything else in the body derives from them and
+    # from the query string, which is part of the URL anyway.
+    digest = hashlib.blake2b(digest_size=16)
+    for project_id, version in versions:
+        digest.update(f'{project_id}:{version};'.encode())
+    return digest.hexdigest()
+
+
+def encoded_etag(etag: str, coding: str) -> str:
+    return f'{etag}-{coding}'
+
+
+def unencoded_etag(etag: str) -> str:
+    tag, separator, coding = etag.rpartition('-')
+    return tag if separator and coding in ETAG_CODINGS else etag
+
+
+def matching_etag(etags: ETags, etag: str) -> str | None:
+    """The tag of `etags` (`If-None-Match`, compared weakly) that is `etag` in any content coding.
+
+    A 304 carries it back as is: it is the tag of the representation the client has.
+    """
+    if etags.star_tag:
+        return etag
+    for candidate in etags.as_set(include_weak=True):
+        if unencoded_etag(candidate) == etag:
+            return candidate
+    return None
+
+
+def parse_project_etag(etag: str) -> int | None:
+    etag = unencoded_etag(etag)
+    if not etag.startswith(PROJECT_ETAG_PREFIX) or not etag[len(PROJECT_ETAG_PREFIX):].isdigit():
+        return None
+    return int(etag[len(PROJECT_ETAG_PREFIX):])
+
+
+def with_validators(response, etag: str, last_modified: datetime | None):
+    """Set `ETag`/`Last-Modified` on a Flask or Quart response."""
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    return response
+
+
+def if_match_version(project_id: int, if_match: ETags) -> int | None:
+    """Version required by an `If-Match` header; `None` when there is no precondition to check.
+
+    Compared strongly, weak tags never match; the tag of any content coding of the version does.
+    """
+    if not if_match or if_match.star_tag:
+        return None
+
+    for etag in if_match.as_set():
+        version = parse_project_etag(etag)
+        if version is not None:
+            return version
+
+    raise ProjectVersionMismatchError(project_id)
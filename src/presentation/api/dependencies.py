@@ -0,0 +1,76 @@
+import functools
+import inspect
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.exceptions import StaleTechnologyReferenceError
+from core.interfaces import AsyncProjectRepository
+from core.interfaces import AsyncTechnologyRepository
+from core.interfaces import ProjectRepository
+from core.interfaces import TechnologyRepository
+from infrastructure.cache import CachedProjectRepository
+from infrastructure.cache import CachedTechnologyRepository
+from infrastructure.cache import project_cache
+from infrastructure.cache import technology_cache
+from infrastructure.db.postgres import AsyncPostgresProjectRepository
+from infrastructure.db.postgres import AsyncPostgresTechnologyRepository
+from infrastructure.db.postgres import PostgresProjectRepository
+from infrastructure.db.postgres import PostgresTechnologyRepository
+from infrastructure.db.postgres import reads_pinned_to_primary
+from infrastructure.db.postgres import technology_registry
+
+
+def get_project_repository(session: Session) -> ProjectRepository:
+    project_repository = PostgresProjectRepository(
+        session=session,
+        registry=technology_registry,
+        technology_cache=technology_cache,
+    )
+    if project_cache is not None:
+        # A client reading its own writes skips the cache: until the replica lag has passed and the cache is
+        # invalidated once more (see `ProjectCache.invalidate_committed`), replica reads may refill it with data
+        # older than the write.
+        return CachedProjectRepository(
+            repository=project_repository,
+            cache=project_cache,
+            read_through=not reads_pinned_to_primary(),
+        )
+    return project_repository
+
+
+def get_async_project_repository(session: AsyncSession) -> AsyncProjectRepository:
+    return AsyncPostgresProjectRepository(session=session, registry=technology_registry)
+
+
+def get_technology_repository(session: Session) -> TechnologyRepository:
+    technology_repository = PostgresTechnologyRepository(session=session)
+    if technology_cache is not None and not reads_pinned_to_primary():
+        return CachedTechnologyRepository(repository=technology_repository, cache=technology_cache)
+    return technology_repository
+
+
+def get_async_technology_repository(session: AsyncSession) -> AsyncTechnologyRepository:
+    return AsyncPostgresTechnologyRepository(session=session)
+
+
+def retry_on_stale_technologies(view):
+    # The failed transaction is rolled back and the registry cleared by then, so one more run goes to the database.
+    if inspect.iscoroutinefunction(view):
+        @functools.wraps(view)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await view(*args, **kwargs)
+            except StaleTechnologyReferenceError:
+                return await view(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        try:
+            return view(*args, **kwargs)
+        except StaleTechnologyReferenceError:
+            return view(*args, **kwargs)
+
+    return wrapper
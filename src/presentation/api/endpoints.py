@@ -1,52 +1,118 @@
 from flask import Blueprint
+from flask import Response
 from flask import jsonify
+from flask import request
 
+from application.services import BulkCreateProjectsService
+from application.services import BulkDeleteProjectsService
+from application.services import BulkUpdateProjectsService
 from application.services import CreateProjectService
 from application.services import DeleteProjectService
-from application.services import GetManyProjectsService
-from application.services import GetSingleProjectService
+from application.services import ExportProjectsService
+from application.services import GetManyProjectRecordsService
+from application.services import GetManyProjectVersionsService
+from application.services import GetProjectVersionService
+from application.services import GetProjectsByIdsService
+from application.services import GetSingleProjectRecordService
 from application.services import RemoveProjectTechnologies
+from application.services import ReplaceTechnologyVersionService
+from application.services import SearchProjectsService
 from application.services import UpdateProjectService
 from application.services import UpdateProjectTechnologiesService
+from core.dto import BulkCreateProjectsDTO
+from core.dto import BulkDeleteProjectsDTO
+from core.dto import BulkUpdateProjectsDTO
 from core.dto import CreateProjectDTO
 from core.dto import DeleteProjectDTO
+from core.dto import ExportProjectsDTO
 from core.dto import GetProjectDTO
+from core.dto import GetProjectsByIdsDTO
 from core.dto import GetProjectsDTO
+from core.dto import PROJECT_ORDERING_FIELDS
 from core.dto import RemoveProjectTechnologiesDTO
+from core.dto import ReplaceTechnologyVersionDTO
+from core.dto import SearchProjectsDTO
 from core.dto import UpdateProjectDTO
 from core.dto import UpdateProjectTechnologiesDTO
+from core.utils import encode_cursor
 from core.utils import from_dict_extended
-from infrastructure.db.postgres import PostgresProjectRepository
+from infrastructure.db.postgres import sync_read_session_manager
 from infrastructure.db.postgres import sync_session_manager
+from presentation.api.conditional import if_match_version
+from presentation.api.conditional import matching_etag
+from presentation.api.conditional import project_etag
+from presentation.api.conditional import projects_etag
+from presentation.api.conditional import with_validators
+from presentation.api.dependencies import get_project_repository
+from presentation.api.dependencies import retry_on_stale_technologies
+from presentation.api.schemas import BulkCreateProjectsRequestSchema
+from presentation.api.schemas import BulkCreateProjectsResponseSchema
+from presentation.api.schemas import BulkDeleteProjectsRequestSchema
+from presentation.api.schemas import BulkUpdateProjectsRequestSchema
+from presentation.api.schemas import BulkWriteResponseSchema
 from presentation.api.schemas import CreateProjectRequestSchema
 from presentation.api.schemas import CreateProjectResponseSchema
 from presentation.api.schemas import DeleteProjectRequestSchema
 from presentation.api.schemas import DeleteProjectResponseSchema
+from presentation.api.schemas import ExportProjectsRequestSchema
 from presentation.api.schemas import GetManyProjectRequestSchema
-from presentation.api.schemas import GetManyProjectResponseSchema
-from presentation.api.schemas import GetProjectResponseSchema
+from presentation.api.schemas import GetProjectsBatchRequestSchema
+from presentation.api.schemas import ProjectFieldsSchema
 from presentation.api.schemas import ProjectSchema
 from presentation.api.schemas import RemoveProjectTechnologiesJsonSchema
+from presentation.api.schemas import ReplaceTechnologyVersionRequestSchema
+from presentation.api.schemas import SearchProjectsRequestSchema
+from presentation.api.schemas import SearchProjectsResponseSchema
 from presentation.api.schemas import UpdateProjectJsonSchema
 from presentation.api.schemas import UpdateProjectResponseSchema
 from presentation.api.schemas import UpdateProjectTechnologiesJsonSchema
+from presentation.api.serialization import compact_project_records_batch_adapter
+from presentation.api.serialization import compact_project_records_page_adapter
+from presentation.api.serialization import compact_records
+from presentation.api.serialization import partial_project_record_adapter
+from presentation.api.serialization import partial_project_records_page_adapter
+from presentation.api.serialization import project_record_adapter
+from presentation.api.serialization import project_records_batch_adapter
+from presentation.api.serialization import project_records_page_adapter
+from presentation.api.serialization import record_fields
+from presentation.api.serialization import record_include
 from presentation.api.swagger import spec
+from presentation.export import EXPORT_ENCODERS
+from presentation.export import EXPORT_MIMETYPES
 
 projects_router = Blueprint('projects', __name__, url_prefix='/project')
 
 
 @projects_router.route('/<int:project_id>', methods=['GET'])
 @spec.validate(
+    query=ProjectFieldsSchema,
     tags=['Projects'],
 )
-def get_project(project_id: int):
-    with sync_session_manager() as session:
-        project_repository = PostgresProjectRepository(session=session)
-        service = GetSingleProjectService(project_repository=project_repository)
-        service_dto = from_dict_extended(GetProjectDTO, {'project_id': project_id})
+def get_project(project_id: int, query: ProjectFieldsSchema):
+    service_dto = from_dict_extended(GetProjectDTO, {
+        **query.model_dump(mode='json', exclude_unset=True),
+        'project_id': project_id,
+        'fields': record_fields(query.fields),
+    })
+    with sync_read_session_manager() as session:
+        project_repository = get_project_repository(session=session)
+        if request.if_none_match:
+            # Answered from the version columns alone, technologies are not loaded.
+            version = GetProjectVersionService(project_repository=project_repository).call(dto=service_dto)
+            etag = matching_etag(request.if_none_match, project_etag(version.version))
+            if etag is not None:
+                return with_validators(Response(status=304), etag, version.updated_at)
+
+        service = GetSingleProjectRecordService(project_repository=project_repository)
         project = service.call(dto=service_dto)
 
-    return jsonify(GetProjectResponseSchema.model_validate(project).model_dump(mode='json')), 200
+    include = record_include(query.fields, query.expand)
+    if include is None:
+        body = project_record_adapter.dump_json(project)
+    else:
+        body = partial_project_record_adapter.dump_json(project, include=include)
+    response = Response(body, status=200, mimetype='application/json')
+    return with_validators(response, project_etag(project['version']), project['updated_at'])
 
 
 @projects_router.route('/all', methods=['GET'])
@@ -55,35 +121,209 @@ def get_project(project_id: int):
     tags=['Projects'],
 )
 def get_projects(query: GetManyProjectRequestSchema):
-    with sync_session_manager() as session:
-        project_repository = PostgresProjectRepository(session=session)
-        service = GetManyProjectsService(project_repository=project_repository)
-        service_dto = from_dict_extended(GetProjectsDTO, query.model_dump(exclude_unset=True))
+    service_dto = from_dict_extended(GetProjectsDTO, {
+        **query.model_dump(mode='json', exclude_unset=True),
+        'fields': record_fields(query.fields, *PROJECT_ORDERING_FIELDS[query.order_by]),
+    })
+    with sync_read_session_manager() as session:
+        project_repository = get_project_repository(session=session)
+        if request.if_none_match:
+            versions = GetManyProjectVersionsService(project_repository=project_repository).call(dto=service_dto)
+            etag = matching_etag(
+                request.if_none_match, projects_etag((version.project_id, version.version) for version in versions),
+            )
+            if etag is not None:
+                last_modified = max((version.updated_at for version in versions), default=None)
+                return with_validators(Response(status=304), etag, last_modified)
+
+        service = GetManyProjectRecordsService(project_repository=project_repository)
+        projects = service.call(dto=service_dto)
+
+    next_cursor = None
+    if len(projects) == query.limit:
+        next_cursor = encode_cursor(order_by=query.order_by, obj=projects[-1])
+
+    page = {'projects': projects, 'next_offset': query.offset + query.limit, 'next_cursor': next_cursor}
+    include = record_include(query.fields, query.expand)
+    page_include = None
+    if include is not None:
+        page_include = {'projects': {'__all__': include}, 'next_offset': True, 'next_cursor': True}
+    if query.encoding == 'compact':
+        page['projects'], page['technology_versions'] = compact_records(projects)
+        body = compact_project_records_page_adapter.dump_json(
+            page, include=None if page_include is None else {**page_include, 'technology_versions': True},
+        )
+    elif include is None:
+        body = project_records_page_adapter.dump_json(page)
+    else:
+        body = partial_project_records_page_adapter.dump_json(page, include=page_include)
+    response = Response(body, status=200, mimetype='application/json')
+    return with_validators(
+        response,
+        projects_etag((project['id'], project['version']) for project in projects),
+        max((project['updated_at'] for project in projects), default=None),
+    )
+
+
+@projects_router.route('/batch', methods=['GET'])
+@spec.validate(
+    query=GetProjectsBatchRequestSchema,
+    tags=['Projects'],
+)
+def get_projects_batch(query: GetProjectsBatchRequestSchema):
+    with sync_read_session_manager() as session:
+        project_repository = get_project_repository(session=session)
+        service = GetProjectsByIdsService(project_repository=project_repository)
+        service_dto = from_dict_extended(GetProjectsByIdsDTO, {'project_ids': query.ids})
         projects = service.call(dto=service_dto)
 
-    result_projects = []
-    for project in projects:
-        result_projects.append(ProjectSchema.model_validate(project))
+    found_ids = {project['id'] for project in projects}
+    batch = {
+        'projects': projects,
+        'missing_ids': [project_id for project_id in dict.fromkeys(query.ids) if project_id not in found_ids],
+    }
+    if query.encoding == 'compact':
+        batch['projects'], batch['technology_versions'] = compact_records(projects)
+        body = compact_project_records_batch_adapter.dump_json(batch)
+    else:
+        body = project_records_batch_adapter.dump_json(batch)
+    return Response(body, status=200, mimetype='application/json')
+
+
+@projects_router.route('/search', methods=['GET'])
+@spec.validate(
+    query=SearchProjectsRequestSchema,
+    tags=['Projects'],
+)
+def search_projects(query: SearchProjectsRequestSchema):
+    with sync_read_session_manager() as session:
+        project_repository = get_project_repository(session=session)
+        service = SearchProjectsService(project_repository=project_repository)
+        service_dto = from_dict_extended(SearchProjectsDTO, {
+            'query': query.q,
+            **query.model_dump(mode='json', exclude={'q'}),
+        })
+        projects = service.call(dto=service_dto)
 
-    return jsonify(GetManyProjectResponseSchema(
-        projects=result_projects,
+    return jsonify(SearchProjectsResponseSchema(
+        projects=[ProjectSchema.model_validate(project) for project in projects],
         next_offset=query.offset + query.limit,
     ).model_dump(mode='json')), 200
 
 
+@projects_router.route('/export', methods=['GET'])
+@spec.validate(
+    query=ExportProjectsRequestSchema,
+    tags=['Projects'],
+)
+def export_projects(query: ExportProjectsRequestSchema):
+    service_dto = from_dict_extended(ExportProjectsDTO, query.model_dump(exclude={'format'}))
+    encode = EXPORT_ENCODERS[query.format]
+
+    def generate():
+        with sync_read_session_manager() as session:
+            project_repository = get_project_repository(session=session)
+            service = ExportProjectsService(project_repository=project_repository)
+            yield from encode(service.call(dto=service_dto))
+
+    return Response(generate(), mimetype=EXPORT_MIMETYPES[query.format])
+
+
 @projects_router.route('/', methods=['POST'])
 @spec.validate(
     json=CreateProjectRequestSchema,
     tags=['Projects'],
 )
+@retry_on_stale_technologies
 def create_project(json: CreateProjectRequestSchema):
     with sync_session_manager() as session:
-        project_repository = PostgresProjectRepository(session=session)
+        project_repository = get_project_repository(session=session)
         service = CreateProjectService(project_repository=project_repository)
         service_dto = from_dict_extended(CreateProjectDTO, json.model_dump(mode='json', exclude_unset=True))
         project = service.call(dto=service_dto)
 
-    return jsonify(CreateProjectResponseSchema.model_validate(project).model_dump(mode='json')), 201
+    response = jsonify(CreateProjectResponseSchema.model_validate(project).model_dump(mode='json'))
+    return with_validators(response, project_etag(project.version), project.updated_at), 201
+
+
+@projects_router.route('/bulk', methods=['POST'])
+@spec.validate(
+    json=BulkCreateProjectsRequestSchema,
+    tags=['Projects'],
+)
+def bulk_create_projects(json: BulkCreateProjectsRequestSchema):
+    with sync_session_manager() as session:
+        project_repository = get_project_repository(session=session)
+        service = BulkCreateProjectsService(project_repository=project_repository)
+        service_dto = from_dict_extended(BulkCreateProjectsDTO, json.model_dump(mode='json', exclude_unset=True))
+        results = service.call(dto=service_dto)
+
+    statuses = [result.status for result in results]
+    return jsonify(BulkCreateProjectsResponseSchema.model_validate({
+        'results': results,
+        'created': statuses.count('created'),
+        'duplicates': statuses.count('duplicate'),
+        'errors': statuses.count('error'),
+    }).model_dump(mode='json')), 200
+
+
+@projects_router.route('/bulk', methods=['PATCH'])
+@spec.validate(
+    json=BulkUpdateProjectsRequestSchema,
+    tags=['Projects'],
+)
+def bulk_update_projects(json: BulkUpdateProjectsRequestSchema):
+    with sync_session_manager() as session:
+        project_repository = get_project_repository(session=session)
+        service = BulkUpdateProjectsService(project_repository=project_repository)
+        service_dto = from_dict_extended(BulkUpdateProjectsDTO, {
+            'project_ids': json.ids,
+            **json.model_dump(mode='json', exclude_unset=True, exclude={'ids'}),
+        })
+        result = service.call(dto=service_dto)
+
+    return jsonify(BulkWriteResponseSchema(
+        count=len(result.project_ids),
+        project_ids=result.project_ids,
+    ).model_dump(mode='json')), 200
+
+
+@projects_router.route('/bulk/delete', methods=['POST'])
+@spec.validate(
+    json=BulkDeleteProjectsRequestSchema,
+    tags=['Projects'],
+)
+def bulk_delete_projects(json: BulkDeleteProjectsRequestSchema):
+    filters = json.model_dump(mode='json', exclude_unset=True, exclude={'ids'})
+    with sync_session_manager() as session:
+        project_repository = get_project_repository(session=session)
+        service = BulkDeleteProjectsService(project_repository=project_repository)
+        service_dto = from_dict_extended(BulkDeleteProjectsDTO, {'project_ids': json.ids, 'filters': filters or None})
+        result = service.call(dto=service_dto)
+
+    return jsonify(BulkWriteResponseSchema(
+        count=len(result.project_ids),
+        project_ids=result.project_ids,
+    ).model_dump(mode='json')), 200
+
+
+@projects_router.route('/technologies/replace', methods=['POST'])
+@spec.validate(
+    json=ReplaceTechnologyVersionRequestSchema,
+    tags=['Projects'],
+)
+@retry_on_stale_technologies
+def replace_technology_version(json: ReplaceTechnologyVersionRequestSchema):
+    with sync_session_manager() as session:
+        project_repository = get_project_repository(session=session)
+        service = ReplaceTechnologyVersionService(project_repository=project_repository)
+        service_dto = from_dict_extended(ReplaceTechnologyVersionDTO, json.model_dump(mode='json'))
+        result = service.call(dto=service_dto)
+
+    return jsonify(BulkWriteResponseSchema(
+        count=len(result.project_ids),
+        project_ids=result.project_ids,
+    ).model_dump(mode='json')), 200
 
 
 @projects_router.route('/<int:project_id>', methods=['PATCH'])
@@ -91,16 +331,19 @@ def create_project(json: CreateProjectRequestSchema):
     json=UpdateProjectJsonSchema,
     tags=['Projects'],
 )
+@retry_on_stale_technologies
 def update_project(project_id: int, json: UpdateProjectJsonSchema):
     with sync_session_manager() as session:
-        project_repository = PostgresProjectRepository(session=session)
+        project_repository = get_project_repository(session=session)
         service = UpdateProjectService(project_repository=project_repository)
         service_dto = from_dict_extended(UpdateProjectDTO,
                                          {'project_id': project_id,
+                                          'expected_version': if_match_version(project_id, request.if_match),
                                           **json.model_dump(mode='json', exclude_unset=True)})
         project = service.call(dto=service_dto)
 
-    return jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json')), 200
+    response = jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json'))
+    return with_validators(response, project_etag(project.version), project.updated_at), 200
 
 
 @projects_router.route('/<int:project_id>/technologies/update', methods=['POST'])
@@ -108,15 +351,17 @@ def update_project(project_id: int, json: UpdateProjectJsonSchema):
     json=UpdateProjectTechnologiesJsonSchema,
     tags=['Projects'],
 )
+@retry_on_stale_technologies
 def update_project_technologies(project_id: int, json: UpdateProjectTechnologiesJsonSchema):
     with sync_session_manager() as session:
-        project_repository = PostgresProjectRepository(session=session)
+        project_repository = get_project_repository(session=session)
         service = UpdateProjectTechnologiesService(project_repository=project_repository)
         service_dto = from_dict_extended(UpdateProjectTechnologiesDTO,
                                          {'project_id': project_id, **json.model_dump(mode='json', exclude_unset=True)})
         project = service.call(dto=service_dto)
 
-    return jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json')), 200
+    response = jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json'))
+    return with_validators(response, project_etag(project.version), project.updated_at), 200
 
 
 @projects_router.route('/<int:project_id>/technologies/remove', methods=['POST'])
@@ -126,13 +371,14 @@ def update_project_technologies(project_id: int, json: UpdateProjectTechnologies
 )
 def remove_project_technologies(project_id: int, json: RemoveProjectTechnologiesJsonSchema):
     with sync_session_manager() as session:
-        project_repository = PostgresProjectRepository(session=session)
+        project_repository = get_project_repository(session=session)
         service = RemoveProjectTechnologies(project_repository=project_repository)
         service_dto = from_dict_extended(RemoveProjectTechnologiesDTO,
                                          {'project_id': project_id, **json.model_dump(mode='json', exclude_unset=True)})
         project = service.call(dto=service_dto)
 
-    return jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json')), 200
+    response = jsonify(UpdateProjectResponseSchema.model_validate(project).model_dump(mode='json'))
+    return with_validators(response, project_etag(project.version), project.updated_at), 200
 
 
 @projects_router.route('/<int:project_id>', methods=['DELETE'])
@@ -142,7 +388,7 @@ def remove_project_technologies(project_id: int, json: RemoveProjectTechnologies
 def delete_project(project_id: int):
     request_dto = DeleteProjectRequestSchema(project_id=project_id)
     with sync_session_manager() as session:
-        project_repository = PostgresProjectRepository(session=session)
+        project_repository = get_project_repository(session=session)
         service = DeleteProjectService(project_repository=project_repository)
         service_dto = from_dict_extended(DeleteProjectDTO, request_dto.model_dump(exclude_unset=True))
         success = service.call(dto=service_dto)
@@ -1,29 +1,43 @@
 import logging
+from typing import TYPE_CHECKING
 
 from flask import Flask
-from flask import jsonify
 from werkzeug.exceptions import HTTPException
 
 from core.exceptions import CoreException
+from core.exceptions import InvalidCursorError
 from core.exceptions import InvalidTechnologyVersionFormat
+from core.exceptions import ProjectConcurrentUpdateError
 from core.exceptions import ProjectDuplicateTechnologyError
 from core.exceptions import ProjectInvalidDateRangeError
 from core.exceptions import ProjectNameAlreadyExistsError
 from core.exceptions import ProjectNotFoundError
+from core.exceptions import ProjectVersionMismatchError
+from core.exceptions import StaleTechnologyReferenceError
+from core.exceptions import TechnologyNotFoundError
+
+if TYPE_CHECKING:
+    from quart import Quart  # the sync app runs without Quart installed
 
 logger = logging.getLogger(__name__)
 
 EXCEPTION_STATUS_CODES = {
     ProjectNotFoundError: 404,
+    TechnologyNotFoundError: 404,
     ProjectNameAlreadyExistsError: 409,
     ProjectDuplicateTechnologyError: 418,  # haha, find me
     ProjectInvalidDateRangeError: 422,
     InvalidTechnologyVersionFormat: 400,
+    InvalidCursorError: 400,
+    StaleTechnologyReferenceError: 409,
+    ProjectVersionMismatchError: 412,  # only raised for an `If-Match` the client sent
+    ProjectConcurrentUpdateError: 409,
     CoreException: 500,
 }
 
 
-def register_exception_handlers(app: Flask):
+def register_exception_handlers(app: 'Flask | Quart'):
+    # Handlers return plain dicts so the same registration works for both the Flask and the Quart app.
     def create_error_handler(status):
         def handler(error):
             logger.exception('CoreException occurred')
@@ -31,7 +45,7 @@ def register_exception_handlers(app: Flask):
                 'error': error.__class__.__name__,
                 'detail': str(error),
             }
-            return jsonify(response), status
+            return response, status
 
         return handler
 
@@ -41,10 +55,10 @@ def register_exception_handlers(app: Flask):
     @app.errorhandler(Exception)
     def handle_unexpected_error(error):
         if isinstance(error, HTTPException):
-            return jsonify({
+            return {
                 'error': error.name,
                 'detail': error.description
-            }), error.code
+            }, error.code
 
         logger.exception('Unhandled exception occurred')
 
@@ -52,4 +66,4 @@ def register_exception_handlers(app: Flask):
             'error': 'InternalServerError',
             'detail': 'An unexpected error occurred. Please contact support.'
         }
-        return jsonify(response), 500
+        return response, 500
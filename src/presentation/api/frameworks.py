@@ -0,0 +1,7 @@
+import sys
+
+
+def is_quart_app(app) -> bool:
+    """Whether `app` is a Quart app, checked without importing Quart: the sync (Flask) app runs without it."""
+    quart = sys.modules.get('quart')
+    return quart is not None and isinstance(app, quart.Quart)
@@ -0,0 +1,71 @@
+from flask import Blueprint
+from flask import jsonify
+
+from infrastructure.cache import project_cache
+from infrastructure.cache import technology_cache
+from infrastructure.db.postgres import async_replicas
+from infrastructure.db.postgres import engine_registry
+from infrastructure.db.postgres import sync_replicas
+from infrastructure.db.postgres import technology_registry
+from presentation.api.schemas import CacheStatsResponseSchema
+from presentation.api.schemas import PoolStatsResponseSchema
+from presentation.api.schemas import ReplicaStatsResponseSchema
+from presentation.api.schemas import TechnologyRegistryStatsResponseSchema
+from presentation.api.swagger import spec
+
+internal_router = Blueprint('internal', __name__, url_prefix='/internal')
+
+
+@internal_router.route('/cache', methods=['GET'])
+@spec.validate(
+    tags=['Internal'],
+)
+def get_cache_stats():
+    stats = project_cache.stats() if project_cache is not None else {}
+    return jsonify(CacheStatsResponseSchema(enabled=project_cache is not None, **stats).model_dump(mode='json')), 200
+
+
+@internal_router.route('/cache/technologies', methods=['GET'])
+@spec.validate(
+    tags=['Internal'],
+)
+def get_technology_cache_stats():
+    stats = technology_cache.stats() if technology_cache is not None else {}
+    return jsonify(CacheStatsResponseSchema(
+        enabled=technology_cache is not None,
+        **stats,
+    ).model_dump(mode='json')), 200
+
+
+@internal_router.route('/pool', methods=['GET'])
+@spec.validate(
+    tags=['Internal'],
+)
+def get_pool_stats():
+    # Only engines this process has used; reporting one must not create it.
+    return jsonify(PoolStatsResponseSchema.model_validate({
+        'engines': {managed.name: managed.pool_metrics.snapshot() for managed in engine_registry.initialized()},
+    }).model_dump(mode='json')), 200
+
+
+@internal_router.route('/replicas', methods=['GET'])
+@spec.validate(
+    tags=['Internal'],
+)
+def get_replica_stats():
+    return jsonify(ReplicaStatsResponseSchema.model_validate({
+        'sync': sync_replicas.snapshot(),
+        'async': async_replicas.snapshot(),
+    }).model_dump(mode='json', by_alias=True)), 200
+
+
+@internal_router.route('/technologies', methods=['GET'])
+@spec.validate(
+    tags=['Internal'],
+)
+def get_technology_registry_stats():
+    stats = technology_registry.stats() if technology_registry is not None else {}
+    return jsonify(TechnologyRegistryStatsResponseSchema(
+        enabled=technology_registry is not None,
+        **stats,
+    ).model_dump(mode='json')), 200
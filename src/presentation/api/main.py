@@ -1,9 +1,18 @@
 from flask import Flask
 
 from presentation.api.endpoints import projects_router
+from presentation.api.compression import response_compression
 from presentation.api.exception_handlers import register_exception_handlers
+from presentation.api.internal import internal_router
+from presentation.api.metrics import request_metrics
+from presentation.api.read_routing import read_your_writes
 from presentation.api.swagger import spec
+from presentation.api.technology_endpoints import technologies_router
 from log import setup_logging
+from settings import COMPRESSION_ENABLED
+from settings import METRICS_ENABLED
+from settings import POSTGRES_REPLICA_HOSTS
+from settings import READ_YOUR_WRITES_SECONDS
 
 
 def create_app() -> Flask:
@@ -11,12 +20,21 @@ def create_app() -> Flask:
 
     app = Flask(__name__)
     app.register_blueprint(projects_router)
+    app.register_blueprint(technologies_router)
+    app.register_blueprint(internal_router)
     register_exception_handlers(app)
     spec.register(app)
+    if METRICS_ENABLED:
+        request_metrics.init_app(app)
+    if POSTGRES_REPLICA_HOSTS and READ_YOUR_WRITES_SECONDS:
+        read_your_writes.init_app(app)
+    if COMPRESSION_ENABLED:
+        response_compression.init_app(app)
 
     return app
 
 
+app = create_app()
+
 if __name__ == '__main__':
-    app = create_app()
     app.run()
@@ -0,0 +1,279 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from flask import Flask
+from flask import Response as FlaskResponse
+from flask import request as flask_request
+from flask.json.provider import DefaultJSONProvider as FlaskJSONProvider
+
+from infrastructure.db.postgres import QueryStats
+from infrastructure.db.postgres import engine_registry
+from infrastructure.db.postgres import start_tracking
+from infrastructure.db.postgres import stop_tracking
+from presentation.api.frameworks import is_quart_app
+from settings import SLOW_REQUEST_MS
+
+if TYPE_CHECKING:
+    from quart import Quart
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SERIALIZATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ''
+    escaped = (value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n') for value in values)
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(names, escaped)) + '}'
+
+
+class Counter:
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: tuple[str, ...], amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}')
+        return lines
+
+
+class Histogram:
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...], buckets: tuple[float, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        # Per label set: non-cumulative bucket counts (the last slot is +Inf), sum and count.
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        with self._lock:
+            counts, totals = self._values.setdefault(labels, ([0] * (len(self.buckets) + 1), [0.0, 0]))
+            counts[bisect_left(self.buckets, value)] += 1
+            totals[0] += value
+            totals[1] += 1
+
+    def render(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        label_names = self.label_names + ('le',)
+        with self._lock:
+            for labels, (counts, (total, count)) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                    cumulative += bucket_count
+                    le = '+Inf' if bound == float('inf') else _format_value(bound)
+                    lines.append(f'{self.name}_bucket{_format_labels(label_names, labels + (le,))} {cumulative}')
+                label_str = _format_labels(self.label_names, labels)
+                lines.append(f'{self.name}_sum{label_str} {_format_value(total)}')
+                lines.append(f'{self.name}_count{label_str} {count}')
+        return lines
+
+
+@dataclass
+class RequestTimings:
+    started: float
+    queries: QueryStats
+    serialization_ms: float = 0.0
+
+
+_current_timings: ContextVar[RequestTimings | None] = ContextVar('request_timings', default=None)
+
+
+@contextmanager
+def measure_serialization():
+    """Attribute the time spent in the block to the current request's serialization, if there is one."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.serialization_ms += (time.perf_counter() - started) * 1000
+
+
+class _TimedDumpsMixin:
+
+    def dumps(self, obj, **kwargs) -> str:
+        with measure_serialization():
+            return super().dumps(obj, **kwargs)
+
+
+class TimedFlaskJSONProvider(_TimedDumpsMixin, FlaskJSONProvider):
+    ...
+
+
+def server_timing(timings: RequestTimings, elapsed_ms: float) -> str:
+    return ', '.join((
+        f'app;dur={elapsed_ms:.1f}',
+        f'db;dur={timings.queries.total_ms:.1f};desc="{timings.queries.count} queries"',
+        f'serialize;dur={timings.serialization_ms:.1f}',
+    ))
+
+
+class RequestMetrics:
+    """Per-endpoint latency, SQL and serialization metrics for the Flask or Quart app.
+
+    Exposes everything in Prometheus text format on `/metrics` and summarizes each request in a `Server-Timing`
+    response header.
+    """
+
+    def __init__(self, app: 'Flask | Quart | None' = None, slow_request_ms: float = SLOW_REQUEST_MS) -> None:
+        self.slow_request_ms = slow_request_ms
+
+        self.request_duration = Histogram(
+            'http_request_duration_seconds', 'Request latency.', ('endpoint', 'method'), LATENCY_BUCKETS,
+        )
+        self.requests = Counter('http_requests_total', 'Handled requests.', ('endpoint', 'method', 'status'))
+        self.slow_requests = Counter(
+            'http_slow_requests_total', 'Requests slower than the slow-request threshold.', ('endpoint', 'method'),
+        )
+        self.db_queries = Histogram(
+            'http_request_db_queries', 'SQL statements executed per request.', ('endpoint',), QUERY_COUNT_BUCKETS,
+        )
+        self.db_duration = Histogram(
+            'http_request_db_duration_seconds', 'Time spent in SQL per request.', ('endpoint',), LATENCY_BUCKETS,
+        )
+        self.serialization_duration = Histogram(
+            'http_request_serialization_duration_seconds', 'Time spent serializing responses per request.',
+            ('endpoint',), SERIALIZATION_BUCKETS,
+        )
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: 'Flask | Quart') -> None:
+        if is_quart_app(app):
+            self._init_quart(app)
+        else:
+            self._init_flask(app)
+
+    def _init_flask(self, app: Flask) -> None:
+        app.json = TimedFlaskJSONProvider(app)
+
+        @app.before_request
+        def start_timings():
+            self._start()
+
+        @app.after_request
+        def finish_timings(response):
+            return self._finish(flask_request.endpoint, flask_request.method, response)
+
+        @app.teardown_request
+        def reset_timings(exc):
+            self._reset()
+
+        def metrics():
+            return FlaskResponse(self.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+        app.add_url_rule('/metrics', 'metrics', metrics)
+
+    def _init_quart(self, app: 'Quart') -> None:
+        from quart import Response as QuartResponse
+        from quart import request as quart_request
+        from quart.json.provider import DefaultJSONProvider as QuartJSONProvider
+
+        class TimedQuartJSONProvider(_TimedDumpsMixin, QuartJSONProvider):
+            ...
+
+        # Async hooks run in the request task itself, so the context variables they set are seen by the views.
+        app.json = TimedQuartJSONProvider(app)
+
+        @app.before_request
+        async def start_timings():
+            self._start()
+
+        @app.after_request
+        async def finish_timings(response):
+            return self._finish(quart_request.endpoint, quart_request.method, response)
+
+        @app.teardown_request
+        async def reset_timings(exc):
+            self._reset()
+
+        async def metrics():
+            return QuartResponse(self.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+        app.add_url_rule('/metrics', 'metrics', metrics)
+
+    def _start(self) -> None:
+        _current_timings.set(RequestTimings(started=time.perf_counter(), queries=start_tracking()))
+
+    def _reset(self) -> None:
+        stop_tracking()
+        _current_timings.set(None)
+
+    def _finish(self, endpoint: str | None, method: str, response):
+        timings = _current_timings.get()
+        if timings is None:
+            return response
+
+        elapsed_ms = (time.perf_counter() - timings.started) * 1000
+        # Unmatched URLs share one label so scanners cannot blow up the series count.
+        endpoint = endpoint or 'unmatched'
+
+        self.request_duration.observe((endpoint, method), elapsed_ms / 1000)
+        self.requests.inc((endpoint, method, str(response.status_code)))
+        self.db_queries.observe((endpoint,), timings.queries.count)
+        self.db_duration.observe((endpoint,), timings.queries.total_ms / 1000)
+        self.serialization_duration.observe((endpoint,), timings.serialization_ms / 1000)
+
+        if elapsed_ms >= self.slow_request_ms:
+            self.slow_requests.inc((endpoint, method))
+            logger.warning(
+                'Slow request %s %s (%.1f ms, %d queries in %.1f ms, %.1f ms serializing).',
+                method, endpoint, elapsed_ms, timings.queries.count, timings.queries.total_ms,
+                timings.serialization_ms,
+            )
+
+        response.headers['Server-Timing'] = server_timing(timings, elapsed_ms)
+        return response
+
+    def render(self) -> str:
+        lines = []
+        for metric in (
+            self.request_duration,
+            self.requests,
+            self.slow_requests,
+            self.db_queries,
+            self.db_duration,
+            self.serialization_duration,
+        ):
+            lines.extend(metric.render())
+
+        lines.append('# HELP db_slow_queries_total Statements slower than the slow-query threshold.')
+        lines.append('# TYPE db_slow_queries_total counter')
+        for managed in engine_registry.initialized():
+            lines.append(f'db_slow_queries_total{{engine="{managed.name}"}} {managed.query_tracker.slow_queries}')
+
+        return '\n'.join(lines) + '\n'
+
+
+request_metrics = RequestMetrics()
@@ -0,0 +1,71 @@
+import time
+from typing import TYPE_CHECKING
+
+from flask import Flask
+from flask import request as flask_request
+
+from infrastructure.db.postgres import pin_reads_to_primary
+from presentation.api.frameworks import is_quart_app
+from settings import READ_YOUR_WRITES_SECONDS
+
+if TYPE_CHECKING:
+    from quart import Quart
+
+READ_YOUR_WRITES_COOKIE = 'read_primary_until'
+WRITE_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})
+
+
+class ReadYourWrites:
+    """Sends a client's reads to the primary for `seconds` after it wrote, so it does not read older data back
+    from a lagging replica.
+
+    A successful write sets a cookie holding the time reads stay pinned until; it works across workers and
+    instances, and clients without a cookie jar can send it back themselves.
+    """
+
+    def __init__(self, app: 'Flask | Quart | None' = None, seconds: float = READ_YOUR_WRITES_SECONDS) -> None:
+        self.seconds = seconds
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: 'Flask | Quart') -> None:
+        # Set on every request and not reset on teardown: streamed responses (export) read after the teardown.
+        if is_quart_app(app):
+            from quart import request as quart_request
+
+            @app.before_request
+            async def pin_reads():
+                self._pin(quart_request.cookies)
+
+            @app.after_request
+            async def remember_write(response):
+                return self._remember(quart_request.method, response)
+        else:
+            @app.before_request
+            def pin_reads():
+                self._pin(flask_request.cookies)
+
+            @app.after_request
+            def remember_write(response):
+                return self._remember(flask_request.method, response)
+
+    def _pin(self, cookies) -> None:
+        try:
+            pinned_until = float(cookies.get(READ_YOUR_WRITES_COOKIE, 0))
+        except ValueError:
+            pinned_until = 0
+        pin_reads_to_primary(pinned_until > time.time())
+
+    def _remember(self, method: str, response):
+        if method in WRITE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE,
+                f'{time.time() + self.seconds:.3f}',
+                max_age=max(int(self.seconds), 1),
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+read_your_writes = ReadYourWrites()
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
@@ -20,14 +21,17 @@ class AtLeastOneFieldRequiredMixin(BaseModel):
 
     @model_validator(mode='after')
     def check_at_least_one_field(self):
-        submitted_data = self.model_dump(exclude_unset=True)
-
-        if not submitted_data:
+        # Not `model_dump()`: a set of schemas dumps to a set of dicts, which cannot be hashed.
+        if not self.model_fields_set:
             raise ValueError('At least one field must be provided!')
 
         return self
 
 
+ProjectField = Literal['id', 'name', 'description', 'start_date', 'end_date', 'version', 'updated_at']
+ProjectExpansion = Literal['technologies']
+
+
 # TODO: create custom type for version
 
 class TechnologySchema(BaseSchema):
@@ -49,6 +53,8 @@ class ProjectSchema(BaseSchema):
     technologies: set[TechnologyVersionSchema] = Field(default_factory=set)
     start_date: datetime | None = None
     end_date: datetime | None = None
+    version: int | None = None
+    updated_at: datetime | None = None
 
 
 class ProjectTechnologyVersionSchema(BaseSchema):
@@ -64,14 +70,81 @@ class GetProjectResponseSchema(ProjectSchema):
     ...
 
 
-class GetManyProjectRequestSchema(BaseSchema):
+class ProjectFieldsSchema(BaseSchema):
+    fields: list[ProjectField] | None = Field(
+        None, min_length=1, examples=['id,name'],
+        description='Project fields to return, comma-separated; technologies are then only embedded with `expand`.',
+    )
+    expand: list[ProjectExpansion] | None = Field(
+        None, examples=['technologies'],
+        description='Relations to embed, comma-separated (empty for none); all of them by default without `fields`.',
+    )
+
+    @field_validator('fields', 'expand', mode='before')
+    @classmethod
+    def split_values(cls, value):
+        values = value if isinstance(value, list) else [value]
+        return list(dict.fromkeys(item.strip() for value in values for item in str(value).split(',') if item.strip()))
+
+
+class ProjectFiltersSchema(BaseSchema):
+    name_prefix: str | None = Field(None, min_length=1, max_length=128)
+    technology: str | None = Field(None, min_length=1, max_length=128, examples=['PostgreSQL'])
+    version: str | None = Field(None, min_length=1, max_length=128, description='Exact technology version.')
+    min_version: str | None = Field(None, pattern=r'^\d{1,18}(\.\d{1,18})*$', examples=['15'],
+                                    description='Minimal numeric technology version, e.g. `15` or `3.11`.')
+    start_date_from: datetime | None = None
+    start_date_to: datetime | None = None
+    end_date_from: datetime | None = None
+    end_date_to: datetime | None = None
+
+
+class ProjectEncodingSchema(BaseSchema):
+    encoding: Literal['full', 'compact'] = Field(
+        'full',
+        description='`compact` lists each technology version once, in `technology_versions`, and refers to it by id '
+                    'from `projects[].technologies`.',
+    )
+
+
+class GetManyProjectRequestSchema(ProjectFiltersSchema, ProjectFieldsSchema, ProjectEncodingSchema):
     limit: int = Field(10, gt=0)
     offset: int = Field(0, ge=0)
+    cursor: str | None = Field(None, min_length=1, description='Opaque cursor from `next_cursor`; overrides `offset`.')
+    order_by: Literal['id', 'name'] = 'id'
+
+
+class GetProjectsBatchRequestSchema(ProjectEncodingSchema):
+    ids: list[int] = Field(..., min_length=1, max_length=500, examples=['1,2,3'],
+                           description='Project ids, comma-separated or as repeated `ids` parameters.')
+
+    @field_validator('ids', mode='before')
+    @classmethod
+    def split_ids(cls, value):
+        values = value if isinstance(value, list) else [value]
+        return [item for value in values for item in str(value).split(',') if item.strip()]
+
+
+class SearchProjectsRequestSchema(BaseSchema):
+    q: str = Field(..., min_length=1, max_length=256, examples=['inventory api'])
+    limit: int = Field(10, gt=0, le=100)
+    offset: int = Field(0, ge=0)
+
+
+class SearchProjectsResponseSchema(BaseSchema):
+    projects: list[ProjectSchema]
+    next_offset: int = Field(0, ge=0)
+
+
+class ExportProjectsRequestSchema(BaseSchema):
+    format: Literal['ndjson', 'csv'] = 'ndjson'
+    batch_size: int = Field(500, gt=0, le=10000)
 
 
 class GetManyProjectResponseSchema(BaseSchema):
     projects: list[ProjectSchema]
     next_offset: int = Field(0, ge=0)
+    next_cursor: str | None = None
 
 
 class CreateProjectRequestSchema(BaseSchema):
@@ -92,6 +165,25 @@ class CreateProjectResponseSchema(ProjectSchema):
     ...
 
 
+class BulkCreateProjectsRequestSchema(BaseSchema):
+    projects: list[CreateProjectRequestSchema] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkCreateProjectResultSchema(BaseSchema):
+    index: int
+    name: str
+    status: Literal['created', 'duplicate', 'error']
+    project_id: int | None = None
+    error: str | None = None
+
+
+class BulkCreateProjectsResponseSchema(BaseSchema):
+    results: list[BulkCreateProjectResultSchema]
+    created: int = Field(0, ge=0)
+    duplicates: int = Field(0, ge=0)
+    errors: int = Field(0, ge=0)
+
+
 class UpdateProjectJsonSchema(BaseSchema, AtLeastOneFieldRequiredMixin):
     name: str = Field(..., min_length=1, max_length=128, examples=['Project new name'])
     description: str | None = Field(None, min_length=1, max_length=255, examples=['Some new description'])
@@ -145,3 +237,139 @@ class DeleteProjectRequestSchema(BaseSchema):
 
 class DeleteProjectResponseSchema(BaseSchema):
     success: bool
+
+
+class BulkUpdateProjectsRequestSchema(BaseSchema):
+    ids: list[int] = Field(..., min_length=1, max_length=10000)
+    description: str | None = Field(None, min_length=1, max_length=255, examples=['Some new description'])
+    start_date: datetime | None = Field(None, examples=['2025-01-01T00:00:00'])
+    end_date: datetime | None = Field(None, examples=['2025-12-31T00:00:00'])
+
+    @model_validator(mode='after')
+    def check_at_least_one_field(self):
+        if not self.model_dump(exclude_unset=True, exclude={'ids'}):
+            raise ValueError('At least one field to update must be provided!')
+
+        return self
+
+
+class BulkDeleteProjectsRequestSchema(ProjectFiltersSchema):
+    ids: list[int] | None = Field(None, min_length=1, max_length=10000)
+
+    @model_validator(mode='after')
+    def check_selection(self):
+        if not self.model_dump(exclude_unset=True, exclude_none=True):
+            raise ValueError('Either ids or at least one filter must be provided!')
+
+        return self
+
+
+class ReplaceTechnologyVersionRequestSchema(BaseSchema):
+    technology: str = Field(..., min_length=1, max_length=128, examples=['Python'])
+    from_version: str = Field(..., min_length=1, max_length=128, examples=['3.11'])
+    to_version: str = Field(..., min_length=1, max_length=128, examples=['3.12'])
+
+
+class BulkWriteResponseSchema(BaseSchema):
+    count: int = Field(0, ge=0)
+    project_ids: list[int]
+
+
+class GetTechnologiesRequestSchema(BaseSchema):
+    name_prefix: str | None = Field(None, min_length=1, max_length=128, examples=['Py'])
+    limit: int = Field(50, gt=0, le=500)
+    offset: int = Field(0, ge=0)
+
+
+class GetTechnologiesResponseSchema(BaseSchema):
+    technologies: list[TechnologySchema]
+    next_offset: int = Field(0, ge=0)
+
+
+class TechnologyVersionItemSchema(BaseSchema):
+    id: int
+    version: str
+
+
+class GetTechnologyVersionsResponseSchema(BaseSchema):
+    technology_id: int
+    versions: list[TechnologyVersionItemSchema]
+
+
+class GetTechnologyStatsRequestSchema(BaseSchema):
+    technology: str | None = Field(None, min_length=1, max_length=128, examples=['Python'])
+    limit: int = Field(20, gt=0, le=500)
+    pairs_limit: int = Field(20, ge=0, le=500)
+
+
+class TechnologyVersionCountSchema(BaseSchema):
+    version: str
+    project_count: int
+
+
+class TechnologyYearCountSchema(BaseSchema):
+    year: int
+    project_count: int
+
+
+class TechnologyCountSchema(BaseSchema):
+    name: str
+    project_count: int
+    versions: list[TechnologyVersionCountSchema]
+    usage: list[TechnologyYearCountSchema]
+
+
+class TechnologyPairCountSchema(BaseSchema):
+    technologies: tuple[str, str]
+    project_count: int
+
+
+class TechnologyStatsResponseSchema(BaseSchema):
+    technologies: list[TechnologyCountSchema]
+    pairs: list[TechnologyPairCountSchema]
+    refreshed_at: datetime | None = None
+
+
+class CacheStatsResponseSchema(BaseSchema):
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class TechnologyRegistryStatsResponseSchema(BaseSchema):
+    enabled: bool
+    technologies: int = 0
+    versions: int = 0
+    hits: int = 0
+    misses: int = 0
+    clears: int = 0
+
+
+class PoolStatsSchema(BaseSchema):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    connects: int
+    checkouts: int
+    checkins: int
+    invalidations: int
+    checkout_failures: int
+    checkout_wait_avg_ms: float
+    checkout_wait_max_ms: float
+
+
+class PoolStatsResponseSchema(BaseSchema):
+    engines: dict[str, PoolStatsSchema]
+
+
+class ReplicaStatsSchema(BaseSchema):
+    healthy: bool
+    lag_ms: float | None
+
+
+class ReplicaStatsResponseSchema(BaseSchema):
+    sync: dict[str, ReplicaStatsSchema]
+    async_: dict[str, ReplicaStatsSchema] = Field(..., alias='async', serialization_alias='async')
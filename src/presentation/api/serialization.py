@@ -0,0 +1,121 @@
+from datetime import datetime
+
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+from core.dto import PROJECT_EXPANSIONS
+from core.dto import PROJECT_FIELDS
+from core.dto import ProjectRecord
+from core.dto import TechnologyVersionRecord
+from core.utils import project_expansions
+from presentation.api.metrics import measure_serialization
+
+
+class ProjectRecordsPage(TypedDict):
+    projects: list[ProjectRecord]
+    next_offset: int
+    next_cursor: str | None
+
+
+class PartialProjectRecord(TypedDict, total=False):
+    # A `ProjectRecord` narrowed with `fields`/`expand`.
+    id: int
+    name: str
+    description: str | None
+    technologies: list[TechnologyVersionRecord]
+    start_date: datetime | None
+    end_date: datetime | None
+    version: int
+    updated_at: datetime
+
+
+class PartialProjectRecordsPage(TypedDict):
+    projects: list[PartialProjectRecord]
+    next_offset: int
+    next_cursor: str | None
+
+
+class ProjectRecordsBatch(TypedDict):
+    projects: list[ProjectRecord]
+    missing_ids: list[int]
+
+
+class CompactProjectRecord(TypedDict, total=False):
+    # A `PartialProjectRecord` whose technologies are ids into `technology_versions`.
+    id: int
+    name: str
+    description: str | None
+    technologies: list[int]
+    start_date: datetime | None
+    end_date: datetime | None
+    version: int
+    updated_at: datetime
+
+
+class CompactProjectRecordsPage(TypedDict):
+    projects: list[CompactProjectRecord]
+    technology_versions: list[TechnologyVersionRecord]
+    next_offset: int
+    next_cursor: str | None
+
+
+class CompactProjectRecordsBatch(TypedDict):
+    projects: list[CompactProjectRecord]
+    technology_versions: list[TechnologyVersionRecord]
+    missing_ids: list[int]
+
+
+class RecordSerializer:
+    """JSON-only `TypeAdapter` whose time is reported to the request metrics."""
+
+    def __init__(self, type_) -> None:
+        self._adapter = TypeAdapter(type_)
+
+    def dump_json(self, value, include=None) -> bytes:
+        with measure_serialization():
+            return self._adapter.dump_json(value, include=include)
+
+
+# ETags and Last-Modified (and cursors, from the ordering fields) are built from these, whatever was asked for.
+VALIDATOR_FIELDS = ('id', 'version', 'updated_at')
+
+
+def record_fields(fields: list[str] | None, *required: str) -> list[str] | None:
+    """The fields to read for a response narrowed to `fields`, `None` for every field."""
+    if fields is None:
+        return None
+    wanted = {*fields, *VALIDATOR_FIELDS, *required}
+    return [field for field in PROJECT_FIELDS if field in wanted]
+
+
+def record_include(fields: list[str] | None, expand: list[str] | None) -> set[str] | None:
+    """What a response keeps of records read with `record_fields`, `None` for whole records."""
+    expansions = project_expansions(fields, expand)
+    if fields is None and expansions == list(PROJECT_EXPANSIONS):
+        return None
+    return {*(fields if fields is not None else PROJECT_FIELDS), *expansions}
+
+
+def compact_records(projects: list[ProjectRecord]) -> tuple[list[CompactProjectRecord], list[TechnologyVersionRecord]]:
+    """The projects with their technology versions replaced by ids, and each of those versions once."""
+    technology_versions = {}
+    compacted = []
+    for project in projects:
+        technologies = project.get('technologies')
+        if technologies is None:
+            compacted.append(project)
+            continue
+        for technology_version in technologies:
+            technology_versions.setdefault(technology_version['id'], technology_version)
+        compacted.append({**project, 'technologies': [technology_version['id'] for technology_version in technologies]})
+    return compacted, list(technology_versions.values())
+
+
+# Serializers only, nothing is validated: records come straight from database rows.
+project_record_adapter = RecordSerializer(ProjectRecord)
+project_records_page_adapter = RecordSerializer(ProjectRecordsPage)
+project_records_batch_adapter = RecordSerializer(ProjectRecordsBatch)
+partial_project_record_adapter = RecordSerializer(PartialProjectRecord)
+partial_project_records_page_adapter = RecordSerializer(PartialProjectRecordsPage)
+compact_project_records_page_adapter = RecordSerializer(CompactProjectRecordsPage)
+compact_project_records_batch_adapter = RecordSerializer(CompactProjectRecordsBatch)
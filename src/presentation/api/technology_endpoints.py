@@ -0,0 +1,72 @@
+from flask import Blueprint
+from flask import jsonify
+
+from application.services import GetManyTechnologiesService
+from application.services import GetTechnologyStatsService
+from application.services import GetTechnologyVersionsService
+from core.dto import GetTechnologiesDTO
+from core.dto import GetTechnologyStatsDTO
+from core.dto import GetTechnologyVersionsDTO
+from core.utils import from_dict_extended
+from infrastructure.db.postgres import sync_read_session_manager
+from presentation.api.dependencies import get_technology_repository
+from presentation.api.schemas import GetTechnologiesRequestSchema
+from presentation.api.schemas import GetTechnologiesResponseSchema
+from presentation.api.schemas import GetTechnologyStatsRequestSchema
+from presentation.api.schemas import GetTechnologyVersionsResponseSchema
+from presentation.api.schemas import TechnologySchema
+from presentation.api.schemas import TechnologyStatsResponseSchema
+from presentation.api.schemas import TechnologyVersionItemSchema
+from presentation.api.swagger import spec
+
+technologies_router = Blueprint('technologies', __name__, url_prefix='/technology')
+
+
+@technologies_router.route('', methods=['GET'])
+@spec.validate(
+    query=GetTechnologiesRequestSchema,
+    tags=['Technologies'],
+)
+def get_technologies(query: GetTechnologiesRequestSchema):
+    with sync_read_session_manager() as session:
+        technology_repository = get_technology_repository(session=session)
+        service = GetManyTechnologiesService(technology_repository=technology_repository)
+        service_dto = from_dict_extended(GetTechnologiesDTO, query.model_dump(mode='json'))
+        technologies = service.call(dto=service_dto)
+
+    return jsonify(GetTechnologiesResponseSchema(
+        technologies=[TechnologySchema.model_validate(technology) for technology in technologies],
+        next_offset=query.offset + query.limit,
+    ).model_dump(mode='json')), 200
+
+
+@technologies_router.route('/<int:technology_id>/versions', methods=['GET'])
+@spec.validate(
+    tags=['Technologies'],
+)
+def get_technology_versions(technology_id: int):
+    with sync_read_session_manager() as session:
+        technology_repository = get_technology_repository(session=session)
+        service = GetTechnologyVersionsService(technology_repository=technology_repository)
+        service_dto = from_dict_extended(GetTechnologyVersionsDTO, {'technology_id': technology_id})
+        versions = service.call(dto=service_dto)
+
+    return jsonify(GetTechnologyVersionsResponseSchema(
+        technology_id=technology_id,
+        versions=[TechnologyVersionItemSchema.model_validate(version) for version in versions],
+    ).model_dump(mode='json')), 200
+
+
+@technologies_router.route('/stats', methods=['GET'])
+@spec.validate(
+    query=GetTechnologyStatsRequestSchema,
+    tags=['Technologies'],
+)
+def get_technology_stats(query: GetTechnologyStatsRequestSchema):
+    with sync_read_session_manager() as session:
+        technology_repository = get_technology_repository(session=session)
+        service = GetTechnologyStatsService(technology_repository=technology_repository)
+        service_dto = from_dict_extended(GetTechnologyStatsDTO, query.model_dump(mode='json'))
+        stats = service.call(dto=service_dto)
+
+    return jsonify(TechnologyStatsResponseSchema.model_validate(stats).model_dump(mode='json')), 200
@@ -0,0 +1,66 @@
+import csv
+import io
+from typing import Iterable
+from typing import Iterator
+
+from core.entities import Project
+from presentation.api.schemas import ProjectSchema
+
+EXPORT_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+CSV_COLUMNS = ['id', 'name', 'description', 'start_date', 'end_date', 'technologies']
+
+
+def to_ndjson_line(project: Project) -> str:
+    return ProjectSchema.model_validate(project).model_dump_json() + '\n'
+
+
+def iter_ndjson(projects: Iterable[Project]) -> Iterator[str]:
+    for project in projects:
+        yield to_ndjson_line(project)
+
+
+class CsvRowEncoder:
+
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def header(self) -> str:
+        return self._encode(CSV_COLUMNS)
+
+    def row(self, project: Project) -> str:
+        return self._encode([
+            project.id,
+            project.name,
+            project.description or '',
+            project.start_date.isoformat() if project.start_date else '',
+            project.end_date.isoformat() if project.end_date else '',
+            ';'.join(
+                f'{tech_version.technology.name} {tech_version.version}'
+                for tech_version
+                in sorted(project.technologies, key=lambda tech_version: tech_version.technology.name)
+            ),
+        ])
+
+    def _encode(self, values: list) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(values)
+        return self._buffer.getvalue()
+
+
+def iter_csv(projects: Iterable[Project]) -> Iterator[str]:
+    encoder = CsvRowEncoder()
+    yield encoder.header()
+    for project in projects:
+        yield encoder.row(project)
+
+
+EXPORT_ENCODERS = {
+    'ndjson': iter_ndjson,
+    'csv': iter_csv,
+}
@@ -2,11 +2,72 @@ import os
 
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
 
+# API
+API_MODE = os.getenv('API_MODE', 'sync').lower()  # sync (Flask + psycopg2) | async (Quart + asyncpg)
+
+# Gunicorn (ENVIRONMENT=prod, API_MODE=sync)
+GUNICORN_BIND = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+GUNICORN_WORKER_CLASS = os.getenv('GUNICORN_WORKER_CLASS', 'gthread').lower()  # gthread | gevent | sync
+GUNICORN_WORKERS = int(os.getenv('GUNICORN_WORKERS', '0'))  # 0 sizes from the CPU count
+GUNICORN_THREADS = int(os.getenv('GUNICORN_THREADS', '0'))  # gthread, 0 sizes from the connection pool
+GUNICORN_WORKER_CONNECTIONS = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '100'))  # gevent
+GUNICORN_TIMEOUT = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+GUNICORN_GRACEFUL_TIMEOUT = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+GUNICORN_KEEPALIVE = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+GUNICORN_MAX_REQUESTS = int(os.getenv('GUNICORN_MAX_REQUESTS', '10000'))  # 0 never recycles workers
+GUNICORN_MAX_REQUESTS_JITTER = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '1000'))
+GUNICORN_PRELOAD = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
 # PostgresSQL
 POSTGRES_USER = os.getenv('POSTGRES_USER', 'postgres')
 POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'postgres')
 POSTGRES_DB = os.getenv('POSTGRES_DB', 'projects')
 POSTGRES_HOST = os.getenv('POSTGRES_HOST', 'localhost')
 POSTGRES_PORT = os.getenv('POSTGRES_PORT', '5432')
+POSTGRES_POOL_SIZE = int(os.getenv('POSTGRES_POOL_SIZE', '5'))
+POSTGRES_MAX_OVERFLOW = int(os.getenv('POSTGRES_MAX_OVERFLOW', '10'))
+POSTGRES_POOL_TIMEOUT = float(os.getenv('POSTGRES_POOL_TIMEOUT', '30'))
+POSTGRES_POOL_RECYCLE = int(os.getenv('POSTGRES_POOL_RECYCLE', '1800'))  # seconds, -1 disables recycling
+POSTGRES_POOL_PRE_PING = os.getenv('POSTGRES_POOL_PRE_PING', 'true').lower() == 'true'
+POSTGRES_STATEMENT_TIMEOUT_MS = int(os.getenv('POSTGRES_STATEMENT_TIMEOUT_MS', '0'))  # 0 disables the timeout
+POSTGRES_SLOW_CHECKOUT_MS = float(os.getenv('POSTGRES_SLOW_CHECKOUT_MS', '100'))
+POSTGRES_SLOW_QUERY_MS = float(os.getenv('POSTGRES_SLOW_QUERY_MS', '200'))
+# Any relationship access that would emit SQL raises instead, to catch N+1 regressions in production-like setups.
+POSTGRES_RAISE_ON_LAZY_LOAD = os.getenv('POSTGRES_RAISE_ON_LAZY_LOAD', 'false').lower() == 'true'
+# Read replicas, `host[:port]` (POSTGRES_PORT by default) separated by commas; none sends every read to the primary
+POSTGRES_REPLICA_HOSTS = [host.strip() for host in os.getenv('POSTGRES_REPLICA_HOSTS', '').split(',') if host.strip()]
+POSTGRES_REPLICA_STRATEGY = os.getenv('POSTGRES_REPLICA_STRATEGY', 'round_robin')  # round_robin | least_connections
+POSTGRES_REPLICA_RETRY_SECONDS = float(os.getenv('POSTGRES_REPLICA_RETRY_SECONDS', '10'))
+POSTGRES_REPLICA_CHECK_SECONDS = float(os.getenv('POSTGRES_REPLICA_CHECK_SECONDS', '5'))
+POSTGRES_REPLICA_MAX_LAG_MS = float(os.getenv('POSTGRES_REPLICA_MAX_LAG_MS', '0'))  # 0 disables the lag check
+READ_YOUR_WRITES_SECONDS = float(os.getenv('READ_YOUR_WRITES_SECONDS', '5'))  # 0 disables pinning after writes
 
 FLASK_SECRET = os.getenv('FLASK_SECRET')
+
+# Metrics
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+SLOW_REQUEST_MS = float(os.getenv('SLOW_REQUEST_MS', '1000'))
+
+# Response compression, `br` and `zstd` need the `brotli` and `zstandard` packages
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+# Server preference order among what the client accepts: zstd | br | gzip
+COMPRESSION_ALGORITHMS = [
+    algorithm.strip().lower()
+    for algorithm in os.getenv('COMPRESSION_ALGORITHMS', 'gzip').split(',')
+    if algorithm.strip()
+]
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))  # bytes, smaller bodies are sent as is
+COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))  # 1-9
+COMPRESSION_BROTLI_LEVEL = int(os.getenv('COMPRESSION_BROTLI_LEVEL', '4'))  # 0-11
+COMPRESSION_ZSTD_LEVEL = int(os.getenv('COMPRESSION_ZSTD_LEVEL', '3'))  # 1-22
+
+# Cache
+PROJECT_CACHE_BACKEND = os.getenv('PROJECT_CACHE_BACKEND', 'none').lower()  # none | memory | redis | fake-redis
+PROJECT_CACHE_TTL = int(os.getenv('PROJECT_CACHE_TTL', '30'))
+PROJECT_CACHE_MAX_SIZE = int(os.getenv('PROJECT_CACHE_MAX_SIZE', '1024'))
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+# The technology catalogue only changes when a write adds a technology or version, which drops the cached copy.
+TECHNOLOGY_CACHE_BACKEND = os.getenv('TECHNOLOGY_CACHE_BACKEND', PROJECT_CACHE_BACKEND).lower()
+TECHNOLOGY_CACHE_TTL = int(os.getenv('TECHNOLOGY_CACHE_TTL', '300'))
+TECHNOLOGY_REGISTRY_TTL = float(os.getenv('TECHNOLOGY_REGISTRY_TTL', '300'))  # seconds, 0 disables the registry
+TECHNOLOGY_REGISTRY_MAX_SIZE = int(os.getenv('TECHNOLOGY_REGISTRY_MAX_SIZE', '10000'))
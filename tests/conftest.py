@@ -0,0 +1,89 @@
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from core.dto import BulkCreateProjectsDTO
+from core.dto import CreateProjectDTO
+from core.dto import ProjectTechnologyVersionDTO
+from infrastructure.db.postgres import PostgresProjectRepository
+from infrastructure.db.postgres import SYNC_ENGINE
+from infrastructure.db.postgres import init_engine
+from presentation.api import endpoints
+from presentation.api import main
+
+
+@pytest.fixture
+def connection():
+    """A connection to the configured database whose transaction is rolled back after the test."""
+    try:
+        connection = init_engine(SYNC_ENGINE).connect()
+    except OperationalError as e:
+        pytest.skip(f'PostgreSQL is not reachable: {e.orig}')
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def session(connection):
+    with Session(bind=connection) as session:
+        yield session
+
+
+@pytest.fixture
+def prefix():
+    return f'qbudget{uuid.uuid4().hex[:8]}'
+
+
+@pytest.fixture
+def project_fixture(prefix):
+    def project_fixture(name: str, index: int = 0) -> CreateProjectDTO:
+        return CreateProjectDTO(
+            name=f'{prefix}-{name}',
+            description=f'Query budget fixture {index}',
+            technologies=[
+                ProjectTechnologyVersionDTO(name=f'{prefix}-python', version=f'3.{index % 4}'),
+                ProjectTechnologyVersionDTO(name=f'{prefix}-postgres', version='16'),
+            ],
+            start_date=datetime(2024, 1, 1),
+            end_date=None,
+        )
+
+    return project_fixture
+
+
+@pytest.fixture
+def project_ids(session, project_fixture):
+    results = PostgresProjectRepository(session).bulk_create(BulkCreateProjectsDTO(
+        projects=[project_fixture(str(index), index) for index in range(20)],
+    ))
+    session.commit()
+    session.expunge_all()
+    return [result.project_id for result in results]
+
+
+@pytest.fixture
+def client(monkeypatch, connection):
+    """A test client whose requests run on the test connection, without the cache and the technology registry.
+
+    Each request gets its own session, committed like the session managers do; that commit leaves the test
+    transaction open. The metrics are off, they would track the request's statements in place of the test.
+    """
+    @contextmanager
+    def session_manager():
+        with Session(bind=connection) as session:
+            yield session
+            session.commit()
+
+    monkeypatch.setattr(endpoints, 'sync_session_manager', session_manager)
+    monkeypatch.setattr(endpoints, 'sync_read_session_manager', session_manager)
+    monkeypatch.setattr(endpoints, 'get_project_repository', lambda session: PostgresProjectRepository(session))
+    monkeypatch.setattr(main, 'METRICS_ENABLED', False)
+    return main.create_app().test_client()
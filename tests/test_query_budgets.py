@@ -0,0 +1,136 @@
+from dataclasses import asdict
+from datetime import datetime
+
+import pytest
+
+from commands.queries import QUERY_BUDGETS
+from commands.queries import _budget_cases
+from core.dto import CreateProjectDTO
+from infrastructure.db.postgres import query_budget
+
+PAGE_SIZES = [1, 20]
+
+
+def test_repository_methods(session, subtests):
+    for label, budget, call in _budget_cases(session, project_count=max(PAGE_SIZES)):
+        session.expunge_all()
+        with subtests.test(label), query_budget(budget, label):
+            call()
+
+
+def project_json(dto: CreateProjectDTO) -> dict:
+    return {
+        'name': dto.name,
+        'description': dto.description,
+        'technologies': [asdict(technology) for technology in dto.technologies],
+        'start_date': dto.start_date.isoformat(),
+    }
+
+
+def request_within_budget(budget: int, label: str, send, status: int = 200):
+    with query_budget(budget, label):
+        response = send()
+    assert response.status_code == status, response.get_data(as_text=True)
+    return response
+
+
+def test_get_project(client, project_ids):
+    request_within_budget(QUERY_BUDGETS['get_record_by_id'], 'GET /project/<id>',
+                          lambda: client.get(f'/project/{project_ids[0]}'))
+
+
+def test_get_project_narrow(client, project_ids):
+    request_within_budget(QUERY_BUDGETS['get_record_by_id_narrow'], 'GET /project/<id>?fields=id,name',
+                          lambda: client.get(f'/project/{project_ids[0]}?fields=id,name'))
+
+
+def test_get_project_not_modified(client, project_ids):
+    etag = client.get(f'/project/{project_ids[0]}').headers['ETag']
+    request_within_budget(QUERY_BUDGETS['get_version'], 'GET /project/<id> If-None-Match',
+                          lambda: client.get(f'/project/{project_ids[0]}', headers={'If-None-Match': etag}),
+                          status=304)
+
+
+@pytest.mark.parametrize('limit', PAGE_SIZES)
+def test_get_projects(client, project_ids, prefix, limit):
+    request_within_budget(QUERY_BUDGETS['get_many_records'], f'GET /project/all?limit={limit}',
+                          lambda: client.get(f'/project/all?limit={limit}&name_prefix={prefix}'))
+
+
+@pytest.mark.parametrize('limit', PAGE_SIZES)
+def test_get_projects_narrow(client, project_ids, prefix, limit):
+    request_within_budget(QUERY_BUDGETS['get_many_records_narrow'], f'GET /project/all?limit={limit}&fields=id,name',
+                          lambda: client.get(f'/project/all?limit={limit}&name_prefix={prefix}&fields=id,name'))
+
+
+@pytest.mark.parametrize('limit', PAGE_SIZES)
+def test_get_projects_not_modified(client, project_ids, prefix, limit):
+    url = f'/project/all?limit={limit}&name_prefix={prefix}'
+    etag = client.get(url).headers['ETag']
+    request_within_budget(QUERY_BUDGETS['get_many_versions'], f'GET /project/all?limit={limit} If-None-Match',
+                          lambda: client.get(url, headers={'If-None-Match': etag}), status=304)
+
+
+@pytest.mark.parametrize('limit', PAGE_SIZES)
+def test_get_projects_batch(client, project_ids, limit):
+    ids = ','.join(map(str, project_ids[:limit]))
+    request_within_budget(QUERY_BUDGETS['get_many_by_ids'], f'GET /project/batch?ids=<{limit} ids>',
+                          lambda: client.get(f'/project/batch?ids={ids}'))
+
+
+@pytest.mark.parametrize('limit', PAGE_SIZES)
+def test_search_projects(client, project_ids, prefix, limit):
+    request_within_budget(QUERY_BUDGETS['search'], f'GET /project/search?limit={limit}',
+                          lambda: client.get(f'/project/search?q={prefix}&limit={limit}'))
+
+
+def test_create_project(client, project_fixture):
+    project = project_json(project_fixture('created'))
+    request_within_budget(QUERY_BUDGETS['create'], 'POST /project/',
+                          lambda: client.post('/project/', json=project), status=201)
+
+
+def test_bulk_create_projects(client, project_fixture):
+    projects = [project_json(project_fixture(f'bulk-{index}', index)) for index in range(2)]
+    request_within_budget(QUERY_BUDGETS['bulk_create'], 'POST /project/bulk',
+                          lambda: client.post('/project/bulk', json={'projects': projects}))
+
+
+def test_update_project(client, project_ids):
+    request_within_budget(QUERY_BUDGETS['update'], 'PATCH /project/<id>',
+                          lambda: client.patch(f'/project/{project_ids[0]}', json={'name': 'Updated fixture'}))
+
+
+def test_update_project_technologies(client, project_ids, prefix):
+    technologies = [{'name': f'{prefix}-redis', 'version': '7'}]
+    request_within_budget(QUERY_BUDGETS['update_technologies'], 'POST /project/<id>/technologies/update',
+                          lambda: client.post(f'/project/{project_ids[0]}/technologies/update',
+                                              json={'technologies': technologies}))
+
+
+def test_remove_project_technologies(client, project_ids, prefix):
+    request_within_budget(QUERY_BUDGETS['remove_technologies'], 'POST /project/<id>/technologies/remove',
+                          lambda: client.post(f'/project/{project_ids[0]}/technologies/remove',
+                                              json={'technologies': [f'{prefix}-postgres']}))
+
+
+def test_delete_project(client, project_ids):
+    request_within_budget(QUERY_BUDGETS['delete'], 'DELETE /project/<id>',
+                          lambda: client.delete(f'/project/{project_ids[0]}'))
+
+
+def test_bulk_update_projects(client, project_ids):
+    end_date = datetime(2030, 1, 1).isoformat()
+    request_within_budget(QUERY_BUDGETS['bulk_update'], 'PATCH /project/bulk',
+                          lambda: client.patch('/project/bulk', json={'ids': project_ids, 'end_date': end_date}))
+
+
+def test_bulk_delete_projects(client, project_ids):
+    request_within_budget(QUERY_BUDGETS['bulk_delete'], 'POST /project/bulk/delete',
+                          lambda: client.post('/project/bulk/delete', json={'ids': project_ids[:2]}))
+
+
+def test_replace_technology_version(client, project_ids, prefix):
+    body = {'technology': f'{prefix}-python', 'from_version': '3.0', 'to_version': '3.1'}
+    request_within_budget(QUERY_BUDGETS['replace_technology_version'], 'POST /project/technologies/replace',
+                          lambda: client.post('/project/technologies/replace', json=body))